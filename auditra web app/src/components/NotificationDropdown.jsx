@@ -1,4 +1,4 @@
-import { useState, useEffect, useRef } from 'react';
+import { useState, useEffect } from 'react';
 import {
   IconButton, Badge, Popover, Box, Typography, List, ListItem,
   ListItemText, Divider, Button, Chip
@@ -21,16 +21,6 @@ export default function NotificationDropdown() {
   const [anchorEl, setAnchorEl] = useState(null);
   const [notifications, setNotifications] = useState([]);
   const [unreadCount, setUnreadCount] = useState(0);
-  const intervalRef = useRef(null);
-
-  const fetchUnreadCount = async () => {
-    try {
-      const res = await notificationService.getUnreadCount();
-      setUnreadCount(res.data.count || 0);
-    } catch {
-      // silently fail
-    }
-  };
 
   const fetchNotifications = async () => {
     try {
@@ -43,9 +33,38 @@ export default function NotificationDropdown() {
   };
 
   useEffect(() => {
-    fetchUnreadCount();
-    intervalRef.current = setInterval(fetchUnreadCount, 30000);
-    return () => clearInterval(intervalRef.current);
+    // Hold a long-poll request open; the server answers as soon as a
+    // notification arrives or the unread count changes
+    const controller = new AbortController();
+
+    const listen = async () => {
+      let state = null;
+      while (!controller.signal.aborted) {
+        try {
+          const params = state ? { after: state.last_id, count: state.unread_count } : {};
+          const res = await notificationService.waitForChanges(params, controller.signal);
+          state = res.data;
+          setUnreadCount(state.unread_count || 0);
+          if (state.notifications?.length) {
+            setNotifications(prev => {
+              const known = new Set(prev.map(n => n.id));
+              return [...state.notifications.filter(n => !known.has(n.id)), ...prev];
+            });
+          }
+          if (state.retry_after) {
+            // Server is at its waiting limit; come back later instead of spinning
+            await new Promise(resolve => setTimeout(resolve, state.retry_after * 1000));
+          }
+        } catch {
+          if (controller.signal.aborted) return;
+          // Back off before reconnecting after a network or server error
+          await new Promise(resolve => setTimeout(resolve, 5000));
+        }
+      }
+    };
+
+    listen();
+    return () => controller.abort();
   }, []);
 
   const handleOpen = (e) => {
@@ -7,6 +7,10 @@ const notificationService = {
   getUnreadCount: () =>
     axiosClient.get('/valuations/notifications/unread-count/'),
 
+  // Long-poll: resolves when notifications arrive or the unread count changes
+  waitForChanges: (params, signal) =>
+    axiosClient.get('/valuations/notifications/wait/', { params, signal, timeout: 40000 }),
+
   markAsRead: (id) =>
     axiosClient.post(`/valuations/notifications/${id}/read/`),
 
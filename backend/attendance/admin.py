@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Attendance, Holiday
+from .models import Attendance, AttendanceYearMap, DailyRoleAttendanceRollup, Holiday, MonthlyAttendanceRollup
 
 
 @admin.register(Holiday)
@@ -18,3 +18,27 @@ class AttendanceAdmin(admin.ModelAdmin):
     date_hierarchy = 'date'
     readonly_fields = ('working_hours', 'overtime_hours', 'created_at', 'updated_at')
 
+
+
+@admin.register(MonthlyAttendanceRollup)
+class MonthlyAttendanceRollupAdmin(admin.ModelAdmin):
+    list_display = ('user', 'year', 'month', 'present_days', 'half_days', 'absent_days', 'working_hours', 'overtime_hours')
+    list_filter = ('year', 'month')
+    search_fields = ('user__username',)
+    readonly_fields = [field.name for field in MonthlyAttendanceRollup._meta.fields]
+
+
+@admin.register(DailyRoleAttendanceRollup)
+class DailyRoleAttendanceRollupAdmin(admin.ModelAdmin):
+    list_display = ('date', 'role', 'records', 'present', 'half_day', 'absent', 'working_hours', 'overtime_hours')
+    list_filter = ('role',)
+    date_hierarchy = 'date'
+    readonly_fields = [field.name for field in DailyRoleAttendanceRollup._meta.fields]
+
+
+@admin.register(AttendanceYearMap)
+class AttendanceYearMapAdmin(admin.ModelAdmin):
+    list_display = ('user', 'year', 'updated_at')
+    list_filter = ('year',)
+    search_fields = ('user__username',)
+    readonly_fields = [field.name for field in AttendanceYearMap._meta.fields]
@@ -0,0 +1,46 @@
+"""
+Check-in write path.
+
+Everyone checks in between 6 and 8 AM, so this path is built for bursts:
+the row is written with ``INSERT ... ON CONFLICT DO NOTHING`` instead of
+``get_or_create`` (which races on ``unique_together(user, date)``), a retried
+request finds the existing check-in and leaves it untouched, and the audit
+entry and rollup refresh are queued for background batches.
+"""
+from django.utils import timezone
+
+from .models import Attendance
+from .rollups import defer_rollup_refresh
+
+
+def check_in(user, now=None):
+    """
+    Record the user's check-in for the local date of ``now`` (server time).
+
+    Returns ``(attendance, checked_in)``; checked_in is False when the user
+    had already checked in, e.g. when the client retried the request.
+    """
+    now = now or timezone.now()
+    today = timezone.localtime(now).date()
+
+    Attendance.objects.bulk_create(
+        [Attendance(user=user, date=today, check_in=now, status='present')],
+        ignore_conflicts=True,
+    )
+    attendance = Attendance.objects.get(user=user, date=today)
+
+    if attendance.check_in is None:
+        # A row without a check-in (e.g. marked absent earlier): claim it
+        # unless a concurrent request got there first
+        Attendance.objects.filter(pk=attendance.pk, check_in__isnull=True).update(
+            check_in=now,
+            status='present',
+            working_hours=0,
+            updated_at=now,
+        )
+        attendance.refresh_from_db()
+
+    checked_in = attendance.check_in == now
+    if checked_in:
+        defer_rollup_refresh(user.pk, today)
+    return attendance, checked_in
@@ -0,0 +1,118 @@
+"""
+HR bulk attendance corrections, e.g. after a week of device outages.
+
+Rows are validated together (unknown users, duplicate employee/date pairs),
+merged onto the existing records, re-derived with ``derive_hours`` and
+written with one ``bulk_update`` and one ``bulk_create`` inside a
+transaction. The caller logs a single audit entry from the returned changes.
+"""
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from .hours import DERIVED_FIELDS, derive_hours, hours_errors
+from .models import Attendance
+from .rollups import refresh_rollups_for
+
+MAX_CORRECTIONS = 1000
+EDITABLE_FIELDS = ['check_in', 'check_out', 'overtime_start', 'overtime_end', 'status', 'notes']
+TRACKED_FIELDS = DERIVED_FIELDS + ['notes']
+
+
+class CorrectionRowErrors(Exception):
+    """Raised by apply_corrections with {row index: errors} for rows that cannot be saved"""
+
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def validate_corrections(rows):
+    """Cross-row checks on serializer-validated rows; returns {row index: errors}"""
+    errors = {}
+    known_users = set(User.objects.filter(pk__in={row['user'] for row in rows}).values_list('pk', flat=True))
+    seen = {}
+    for index, row in enumerate(rows):
+        if row['user'] not in known_users:
+            errors[index] = {'user': f"No user with id {row['user']}"}
+            continue
+        key = (row['user'], row['date'])
+        if key in seen:
+            errors[index] = {'date': f'Duplicates row {seen[key]} for the same employee and date'}
+            continue
+        seen[key] = index
+    return errors
+
+
+def _serialise(value):
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+@transaction.atomic
+def apply_corrections(rows):
+    """
+    Apply validated correction rows; returns one entry per row with the
+    attendance id, whether it was created and {field: [old, new]} changes.
+
+    Raises CorrectionRowErrors without saving anything when a row's derived
+    hours are too large to store.
+    """
+    existing = {
+        (attendance.user_id, attendance.date): attendance
+        for attendance in Attendance.objects.select_for_update().filter(
+            user_id__in={row['user'] for row in rows},
+            date__in={row['date'] for row in rows},
+        )
+    }
+
+    records, before = [], []
+    for row in rows:
+        attendance = existing.get((row['user'], row['date']))
+        if attendance is None:
+            attendance = Attendance(user_id=row['user'], date=row['date'], status='')
+            before.append(None)
+        else:
+            before.append({field: getattr(attendance, field) for field in TRACKED_FIELDS})
+        for field in EDITABLE_FIELDS:
+            if field in row:
+                setattr(attendance, field, row[field])
+        if 'status' not in row and ('check_in' in row or 'check_out' in row):
+            # New times on an auto-marked absence: derive the status from them
+            attendance.status = ''
+        records.append(attendance)
+
+    derive_hours(records)
+    hours = {index: hours_errors(attendance) for index, attendance in enumerate(records)}
+    hours = {index: errors for index, errors in hours.items() if errors}
+    if hours:
+        raise CorrectionRowErrors(hours)
+
+    now = timezone.now()
+    to_update = []
+    for attendance, old in zip(records, before):
+        attendance.updated_at = now
+        if old is not None:
+            to_update.append(attendance)
+    to_create = [attendance for attendance, old in zip(records, before) if old is None]
+    Attendance.objects.bulk_update(to_update, TRACKED_FIELDS + ['updated_at'], batch_size=500)
+    Attendance.objects.bulk_create(to_create, batch_size=500)
+    # Bulk writes skip the rollup receivers
+    refresh_rollups_for((attendance.user_id, attendance.date) for attendance in records)
+
+    results = []
+    for attendance, old in zip(records, before):
+        changes = {
+            field: [_serialise(old[field]) if old else None, _serialise(getattr(attendance, field))]
+            for field in TRACKED_FIELDS
+            if old is None or old[field] != getattr(attendance, field)
+        }
+        results.append({
+            'id': attendance.pk,
+            'user': attendance.user_id,
+            'date': attendance.date.isoformat(),
+            'created': old is None,
+            'changes': changes,
+        })
+    return results
@@ -0,0 +1,83 @@
+"""
+End-of-day attendance processing, run by the close_attendance_day command.
+
+* Employees with no attendance row on a working day get an ``absent`` row,
+  unless they are on approved leave or joined after that day.
+* Sessions still open at the end of the day are checked out at 5 PM.
+
+Both steps are set-based (one read and one bulk write each) and idempotent,
+so the command can be re-run for a day safely.
+"""
+from datetime import datetime, time
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Attendance
+from .rollups import refresh_rollups_for
+from .summary import EMPLOYEE_ROLES
+from .workdays import is_working_day
+
+ABSENT_AFTER = time(8, 0)
+AUTO_CHECKOUT_AT = time(17, 0)
+
+
+def _local_datetime(day, at):
+    return timezone.make_aware(datetime.combine(day, at))
+
+
+@transaction.atomic
+def mark_absentees(day):
+    """Create absent rows for employees without attendance on a working day; returns the count"""
+    if not is_working_day(day):
+        return 0
+    from authentication.models import LeaveRequest
+
+    user_ids = list(
+        User.objects.filter(
+            role__role__in=EMPLOYEE_ROLES,
+            is_active=True,
+            date_joined__lt=_local_datetime(day, ABSENT_AFTER),
+        ).exclude(
+            attendances__date=day
+        ).exclude(
+            pk__in=LeaveRequest.objects.filter(
+                status='approved', start_date__lte=day, end_date__gte=day
+            ).values('user_id')
+        ).values_list('pk', flat=True)
+    )
+    Attendance.objects.bulk_create(
+        [Attendance(user_id=user_id, date=day, status='absent') for user_id in user_ids],
+        ignore_conflicts=True,
+        batch_size=1000,
+    )
+    refresh_rollups_for((user_id, day) for user_id in user_ids)
+    return len(user_ids)
+
+
+@transaction.atomic
+def auto_checkout(day):
+    """Check out sessions left open on the day at 5 PM; returns the count"""
+    checkout = _local_datetime(day, AUTO_CHECKOUT_AT)
+    open_sessions = list(
+        Attendance.objects.select_for_update().filter(
+            date=day,
+            check_in__isnull=False,
+            check_out__isnull=True,
+            check_in__lte=checkout,
+        )
+    )
+    for attendance in open_sessions:
+        # Same outcome as Attendance.save() for a 5 PM check-out
+        attendance.check_out = checkout
+        attendance.working_hours = round(attendance.calculate_working_hours(), 2)
+        attendance.status = 'present'
+        attendance.updated_at = timezone.now()
+    Attendance.objects.bulk_update(
+        open_sessions,
+        ['check_out', 'working_hours', 'status', 'updated_at'],
+        batch_size=1000,
+    )
+    refresh_rollups_for((attendance.user_id, day) for attendance in open_sessions)
+    return len(open_sessions)
@@ -0,0 +1,125 @@
+"""
+Vectorised derivation of working hours, overtime and status.
+
+``derive_hours`` applies the rules of ``Attendance.save()`` to many records
+at once: timestamps are turned into NumPy arrays of local seconds, clamped
+to the 8 AM - 5 PM working window and classified by check-out time, so
+imports, bulk corrections and recomputations can write results with
+``bulk_create``/``bulk_update`` instead of saving row by row.
+"""
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+
+import numpy as np
+from django.utils import timezone
+
+DAY = 86400
+WORK_START = 8 * 3600           # Check-ins before 8 AM count from 8 AM
+WORK_END = 17 * 3600            # Check-outs after 5 PM count until 5 PM
+HALF_DAY_BEFORE = 12 * 3600     # Leaving before noon is an absence
+FULL_DAY_FROM = 17 * 3600       # Leaving at 5 PM or later is a full day
+
+DERIVED_FIELDS = ['check_in', 'check_out', 'overtime_start', 'overtime_end', 'status', 'working_hours', 'overtime_hours']
+
+# working_hours and overtime_hours are DecimalField(max_digits=5, decimal_places=2)
+MAX_HOURS = Decimal('999.99')
+HOURS_ERRORS = {
+    'working_hours': ('check_out', 'Check-in to check-out spans more than {} hours'),
+    'overtime_hours': ('overtime_end', 'Overtime spans more than {} hours'),
+}
+
+
+def _seconds(values):
+    """Epoch seconds as a float array, NaN where the value is missing"""
+    return np.array([value.timestamp() if value else np.nan for value in values], dtype=float)
+
+
+def _local_seconds(epoch):
+    """Shift epoch seconds into the current timezone, one offset lookup per distinct hour"""
+    tz = timezone.get_current_timezone()
+    local = np.full_like(epoch, np.nan)
+    present = ~np.isnan(epoch)
+    if not present.any():
+        return local
+    hours = np.floor(epoch[present] / 3600)
+    unique_hours, inverse = np.unique(hours, return_inverse=True)
+    offsets = np.array([
+        datetime.fromtimestamp(hour * 3600, tz=dt_timezone.utc).astimezone(tz).utcoffset().total_seconds()
+        for hour in unique_hours
+    ])
+    local[present] = epoch[present] + offsets[inverse]
+    return local
+
+
+def _hours(value):
+    return Decimal(f'{max(0.0, float(value)):.2f}')
+
+
+def derive_hours(records):
+    """
+    Set working_hours, overtime_hours and status on Attendance instances as
+    Attendance.save() would, clearing times where save() clears them.
+
+    Returns the records for chaining.
+    """
+    records = list(records)
+    if not records:
+        return records
+
+    status = np.array([record.status or '' for record in records], dtype=object)
+    check_in = _seconds(record.check_in for record in records)
+    check_out = _seconds(record.check_out for record in records)
+    ot_start = _seconds(record.overtime_start for record in records)
+    ot_end = _seconds(record.overtime_end for record in records)
+
+    explicit_absent = status == 'absent'
+    has_in = ~np.isnan(check_in)
+    has_out = ~np.isnan(check_out)
+    both = has_in & has_out & ~explicit_absent
+    inverted = both & (check_out < check_in)
+    valid = both & ~inverted
+
+    # Working window, in local time of day
+    local_in = _local_seconds(check_in)
+    local_out = _local_seconds(check_out)
+    in_day = np.floor(local_in / DAY) * DAY
+    out_day = np.floor(local_out / DAY) * DAY
+    start = np.fmax(local_in, in_day + WORK_START)
+    end = np.fmin(local_out, out_day + WORK_END)
+    working = np.where(valid, np.clip((end - start) / 3600, 0, None), 0.0)
+    working = np.nan_to_num(working)
+
+    out_time = local_out - out_day
+    new_status = status.copy()
+    new_status[valid & (out_time < HALF_DAY_BEFORE)] = 'absent'
+    new_status[valid & (out_time >= HALF_DAY_BEFORE) & (out_time < FULL_DAY_FROM)] = 'half_day'
+    new_status[valid & (out_time >= FULL_DAY_FROM)] = 'present'
+    new_status[inverted] = 'absent'
+    only_in = has_in & ~has_out & ~explicit_absent
+    new_status[only_in & (status == '')] = 'present'
+    neither = ~has_in & ~explicit_absent & (status == '')
+    new_status[neither] = 'absent'
+
+    has_overtime = ~np.isnan(ot_start) & ~np.isnan(ot_end) & ~explicit_absent
+    overtime = np.where(has_overtime & (ot_end >= ot_start), (ot_end - ot_start) / 3600, 0.0)
+    overtime = np.nan_to_num(overtime)
+
+    for index, record in enumerate(records):
+        if explicit_absent[index]:
+            record.check_in = record.check_out = None
+            record.overtime_start = record.overtime_end = None
+        elif inverted[index]:
+            record.check_in = record.check_out = None
+        record.status = new_status[index]
+        record.working_hours = _hours(working[index])
+        record.overtime_hours = _hours(overtime[index])
+    return records
+
+
+def hours_errors(record):
+    """{field: message} for derived hours too large to store, keyed by the time field to fix"""
+    return {
+        field: message.format(MAX_HOURS)
+        for hours_field, (field, message) in HOURS_ERRORS.items()
+        if getattr(record, hours_field) > MAX_HOURS
+    }
@@ -0,0 +1,290 @@
+"""
+Bulk attendance import from CSV or XLSX exports (biometric terminals, spreadsheets).
+
+Files are read as a stream and processed in chunks. Each chunk resolves its
+employees in a couple of queries, derives hours for every row at once with
+``derive_hours`` and upserts with ``bulk_create(update_conflicts=True)``, so
+memory stays flat and a month of company-wide data imports in seconds.
+
+Columns (header names are case-insensitive):
+
+* one of ``user_id``, ``employee_number``, ``username`` or ``email``
+* ``date`` - YYYY-MM-DD or DD/MM/YYYY
+* ``check_in``, ``check_out``, ``overtime_start``, ``overtime_end`` - optional,
+  HH:MM[:SS] on the row's date (local time) or a full ISO datetime; an
+  overtime end earlier than its start is taken to be after midnight
+* ``status`` - optional; derived from the times when left blank
+* ``notes`` - optional
+
+Rows that fail validation are reported with their line number and skipped;
+the rest are imported. A later row for the same employee and date wins.
+"""
+import csv
+import io
+import zipfile
+from datetime import date, datetime, time, timedelta
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .hours import DERIVED_FIELDS, derive_hours, hours_errors
+from .models import Attendance
+from .rollups import refresh_rollups_for
+
+IDENTITY_COLUMNS = ('user_id', 'employee_number', 'username', 'email')
+TIME_COLUMNS = ('check_in', 'check_out', 'overtime_start', 'overtime_end')
+STATUSES = {value for value, _ in Attendance.STATUS_CHOICES}
+DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y')
+TIME_FORMATS = ('%H:%M', '%H:%M:%S', '%I:%M %p')
+
+SUPPORTED_FORMATS = ('csv', 'xlsx')
+UPSERT_FIELDS = DERIVED_FIELDS + ['notes', 'updated_at']
+
+
+def detect_format(filename):
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension not in SUPPORTED_FORMATS:
+        raise ValueError(f'Unsupported file type {extension!r}. Use one of: {", ".join(SUPPORTED_FORMATS)}')
+    return extension
+
+
+def _normalise(header):
+    return str(header or '').strip().lower().replace(' ', '_').replace('-', '_')
+
+
+def read_csv_rows(file):
+    """Yield (line number, row dict) from a binary CSV file"""
+    reader = csv.reader(io.TextIOWrapper(file, encoding='utf-8-sig', newline=''))
+    headers = [_normalise(header) for header in next(reader, [])]
+    for line, values in enumerate(reader, start=2):
+        if any(value.strip() for value in values):
+            yield line, dict(zip(headers, values))
+
+
+def read_xlsx_rows(file):
+    """Yield (line number, row dict) from the first sheet of an XLSX workbook"""
+    from openpyxl import load_workbook
+
+    from openpyxl.utils.exceptions import InvalidFileException
+
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except (InvalidFileException, zipfile.BadZipFile, KeyError, OSError):
+        raise ValueError('Not a valid XLSX workbook')
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        headers = [_normalise(header) for header in next(rows, ())]
+        for line, values in enumerate(rows, start=2):
+            if any(value not in (None, '') for value in values):
+                yield line, dict(zip(headers, values))
+    finally:
+        workbook.close()
+
+
+READERS = {'csv': read_csv_rows, 'xlsx': read_xlsx_rows}
+READ_ERRORS = (ValueError, csv.Error)  # UnicodeDecodeError is a ValueError
+
+
+def _parse_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value or '').strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError('Enter a date as YYYY-MM-DD or DD/MM/YYYY')
+
+
+def _parse_moment(value, day):
+    """Aware datetime for a time-of-day on `day` or a full datetime; None when blank"""
+    if value in (None, ''):
+        return None
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, time):
+        moment = datetime.combine(day, value)
+    else:
+        text = str(value).strip()
+        moment = parse_datetime(text)
+        if moment is None:
+            for fmt in TIME_FORMATS:
+                try:
+                    moment = datetime.combine(day, datetime.strptime(text.upper(), fmt).time())
+                    break
+                except ValueError:
+                    continue
+        if moment is None:
+            raise ValueError('Enter a time as HH:MM or a full date and time')
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def _parse_row(row):
+    """(identity column, identity value, Attendance without user) or raise a dict of errors"""
+    errors = {}
+
+    identity = None
+    for column in IDENTITY_COLUMNS:
+        value = row.get(column)
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)  # Spreadsheets store ids as numbers
+        if value not in (None, '') and str(value).strip():
+            identity = (column, str(value).strip())
+            break
+    if identity is None:
+        errors['employee'] = f'One of {", ".join(IDENTITY_COLUMNS)} is required'
+
+    try:
+        day = _parse_date(row.get('date'))
+    except ValueError as e:
+        errors['date'] = str(e)
+        raise ValueError(errors)
+
+    moments = {}
+    for column in TIME_COLUMNS:
+        try:
+            moments[column] = _parse_moment(row.get(column), day)
+        except ValueError as e:
+            errors[column] = str(e)
+    if moments.get('overtime_start') and moments.get('overtime_end') and moments['overtime_end'] < moments['overtime_start']:
+        moments['overtime_end'] += timedelta(days=1)
+
+    status = str(row.get('status') or '').strip().lower().replace(' ', '_')
+    if status and status not in STATUSES:
+        errors['status'] = f'Use one of: {", ".join(sorted(STATUSES))}'
+
+    if errors:
+        raise ValueError(errors)
+    attendance = Attendance(date=day, status=status, notes=str(row.get('notes') or '').strip(), **moments)
+    return identity, attendance
+
+
+def _resolve_users(identities):
+    """{(column, value): user_id} for every identity that matches a user"""
+    wanted = {}
+    for column, value in identities:
+        wanted.setdefault(column, set()).add(value)
+
+    resolved = {}
+    ids = {value for column in ('user_id', 'employee_number') for value in wanted.get(column, ()) if value.isdigit()}
+    if ids:
+        for pk in User.objects.filter(pk__in=ids).values_list('pk', flat=True):
+            resolved[('user_id', str(pk))] = resolved[('employee_number', str(pk))] = pk
+    if wanted.get('username'):
+        for pk, username in User.objects.filter(username__in=wanted['username']).values_list('pk', 'username'):
+            resolved[('username', username)] = pk
+    if wanted.get('email'):
+        by_email = dict(
+            User.objects.annotate(email_lower=Lower('email'))
+            .filter(email_lower__in={value.lower() for value in wanted['email']})
+            .values_list('email_lower', 'pk')
+        )
+        for value in wanted['email']:
+            if value.lower() in by_email:
+                resolved[('email', value)] = by_email[value.lower()]
+    return resolved
+
+
+class _Report:
+    def __init__(self, max_errors):
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors = []
+        self.max_errors = max_errors
+        self.read_error = None
+
+    def fail(self, line, errors):
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'row': line, 'errors': errors})
+
+    def as_dict(self, dry_run):
+        return {
+            'dry_run': dry_run,
+            'rows': self.rows,
+            'imported': self.imported,
+            'failed': self.failed,
+            'errors': self.errors,
+            'errors_truncated': self.failed > len(self.errors),
+            'read_error': self.read_error,
+        }
+
+
+def _import_chunk(chunk, report, dry_run):
+    parsed = []
+    for line, row in chunk:
+        try:
+            parsed.append((line, *_parse_row(row)))
+        except ValueError as e:
+            report.fail(line, e.args[0])
+
+    users = _resolve_users({identity for _, identity, _ in parsed})
+    latest = {}
+    for line, identity, attendance in parsed:
+        user_id = users.get(identity)
+        if user_id is None:
+            report.fail(line, {'employee': f'No user with {identity[0]} {identity[1]!r}'})
+            continue
+        attendance.user_id = user_id
+        key = (user_id, attendance.date)
+        if key in latest:
+            report.fail(latest[key][0], {'row': f'Superseded by row {line} for the same employee and date'})
+        latest[key] = (line, attendance)
+
+    derive_hours(attendance for _, attendance in latest.values())
+    for key, (line, attendance) in list(latest.items()):
+        errors = hours_errors(attendance)
+        if errors:
+            report.fail(line, errors)
+            del latest[key]
+
+    records = [attendance for _, attendance in latest.values()]
+    if records and not dry_run:
+        with transaction.atomic():
+            Attendance.objects.bulk_create(
+                records,
+                update_conflicts=True,
+                unique_fields=['user', 'date'],
+                update_fields=UPSERT_FIELDS,
+            )
+            # bulk_create skips the rollup receivers
+            refresh_rollups_for(latest)
+    report.imported += len(records)
+
+
+def import_attendance(file, file_format, dry_run=False, chunk_size=1000, max_errors=1000):
+    """
+    Import attendance rows from a binary file object; returns a report dict
+    with row counts and per-row errors (capped at max_errors).
+
+    A file that cannot be read past some point is imported up to there and
+    the problem is reported as read_error.
+    """
+    report = _Report(max_errors)
+    chunk = []
+    rows = READERS[file_format](file)
+    while True:
+        try:
+            line, row = next(rows)
+        except StopIteration:
+            break
+        except READ_ERRORS as e:
+            report.read_error = f'Could not read the file after {report.rows} row(s): {e}'
+            break
+        report.rows += 1
+        chunk.append((line, row))
+        if len(chunk) >= chunk_size:
+            _import_chunk(chunk, report, dry_run)
+            chunk = []
+    if chunk:
+        _import_chunk(chunk, report, dry_run)
+    return report.as_dict(dry_run)
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from attendance.dayclose import ABSENT_AFTER, AUTO_CHECKOUT_AT, auto_checkout, mark_absentees
+from attendance.workdays import is_working_day
+
+
+class Command(BaseCommand):
+    help = (
+        'Close an attendance day: mark employees without attendance as absent (skipping approved leave) '
+        'and check out sessions left open at 5 PM. Schedule daily from cron, e.g. 55 23 * * *'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--date',
+            help='Day to close (YYYY-MM-DD, default today)',
+        )
+        parser.add_argument(
+            '--days-back',
+            type=int,
+            default=0,
+            help='Also close this many previous days (catch-up after missed runs)',
+        )
+        parser.add_argument(
+            '--skip-absent',
+            action='store_true',
+            help='Do not create absent rows',
+        )
+        parser.add_argument(
+            '--skip-checkout',
+            action='store_true',
+            help='Do not auto check out open sessions',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            day = datetime.strptime(options['date'], '%Y-%m-%d').date() if options['date'] else timezone.localdate()
+        except ValueError:
+            raise CommandError('--date must be in YYYY-MM-DD format')
+
+        now = timezone.localtime()
+        for offset in range(options['days_back'], -1, -1):
+            self.close_day(day - timedelta(days=offset), now, options)
+
+    def close_day(self, day, now, options):
+        # Today's steps only apply once their cut-off has passed
+        is_today = day == now.date()
+        if day > now.date():
+            self.stdout.write(self.style.WARNING(f'{day}: in the future, skipped'))
+            return
+
+        if not options['skip_checkout']:
+            if is_today and now.time() < AUTO_CHECKOUT_AT:
+                self.stdout.write(f'{day}: before {AUTO_CHECKOUT_AT:%H:%M}, auto check-out skipped')
+            else:
+                self.stdout.write(f'{day}: checked out {auto_checkout(day)} open session(s)')
+
+        if not options['skip_absent']:
+            if not is_working_day(day):
+                self.stdout.write(f'{day}: not a working day, no absences marked')
+            elif is_today and now.time() < ABSENT_AFTER:
+                self.stdout.write(f'{day}: before {ABSENT_AFTER:%H:%M}, absences not marked')
+            else:
+                self.stdout.write(f'{day}: marked {mark_absentees(day)} employee(s) absent')
+
+        self.stdout.write(self.style.SUCCESS(f'{day}: closed'))
@@ -1,6 +1,9 @@
 from django.core.management.base import BaseCommand
 from django.db.models import Q
 from attendance.models import Attendance
+from attendance.recompute import recompute_attendance
+
+TIME_FIELDS = ('check_in', 'check_out', 'overtime_start', 'overtime_end')
 
 
 class Command(BaseCommand):
@@ -12,50 +15,22 @@ class Command(BaseCommand):
             status='absent'
         ).filter(
             Q(check_in__isnull=False) | Q(check_out__isnull=False)
-        )
-        
-        total_fixed = 0
-        
-        if absent_with_times.exists():
-            count = absent_with_times.count()
-            self.stdout.write(f'Found {count} attendance(s) with absent status but have check-in/check-out times')
-            
-            for attendance in absent_with_times:
-                had_check_in = attendance.check_in is not None
-                had_check_out = attendance.check_out is not None
-                had_overtime_start = attendance.overtime_start is not None
-                had_overtime_end = attendance.overtime_end is not None
-                
-                # Clear all times for absent records
-                attendance.check_in = None
-                attendance.check_out = None
-                attendance.overtime_start = None
-                attendance.overtime_end = None
-                attendance.working_hours = 0.0
-                attendance.overtime_hours = 0.0
-                attendance.save()
-                
-                total_fixed += 1
-                cleared_items = []
-                if had_check_in:
-                    cleared_items.append('check_in')
-                if had_check_out:
-                    cleared_items.append('check_out')
-                if had_overtime_start:
-                    cleared_items.append('overtime_start')
-                if had_overtime_end:
-                    cleared_items.append('overtime_end')
-                
-                self.stdout.write(
-                    f'  Fixed attendance {attendance.id} (user: {attendance.user.username}, '
-                    f'date: {attendance.date}): Cleared {", ".join(cleared_items)}'
-                )
-        else:
+        ).select_related('user')
+
+        def report(attendance, changes):
+            cleared_items = [field for field in TIME_FIELDS if field in changes]
+            self.stdout.write(
+                f'  Fixed attendance {attendance.id} (user: {attendance.user.username}, '
+                f'date: {attendance.date}): Cleared {", ".join(cleared_items)}'
+            )
+
+        # Re-deriving an absent record clears all of its times and hours
+        examined, total_fixed = recompute_attendance(absent_with_times, on_change=report)
+        if not examined:
             self.stdout.write('No attendances with absent status and check-in/check-out times found')
-        
+
         self.stdout.write(
             self.style.SUCCESS(
                 f'\nSuccessfully fixed {total_fixed} attendance record(s)'
             )
         )
-
@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from attendance.models import Attendance
+from attendance.recompute import recompute_attendance
 from django.db.models import Q
 
 
@@ -8,54 +9,26 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         # Find all attendances with negative working_hours or overtime_hours
-        negative_working = Attendance.objects.filter(working_hours__lt=0)
-        negative_overtime = Attendance.objects.filter(overtime_hours__lt=0)
-        
-        total_fixed = 0
-        
-        # Fix negative working_hours
-        if negative_working.exists():
-            count = negative_working.count()
-            self.stdout.write(f'Found {count} attendance(s) with negative working_hours')
-            
-            for attendance in negative_working:
-                old_value = attendance.working_hours
-                # Recalculate working hours
-                attendance.working_hours = attendance.calculate_working_hours()
-                # Ensure it's not negative
-                attendance.working_hours = max(0.0, float(attendance.working_hours))
-                attendance.save()
-                total_fixed += 1
-                self.stdout.write(
-                    f'  Fixed attendance {attendance.id} (user: {attendance.user.username}, '
-                    f'date: {attendance.date}): {old_value} -> {attendance.working_hours}'
-                )
-        else:
-            self.stdout.write('No attendances with negative working_hours found')
-        
-        # Fix negative overtime_hours
-        if negative_overtime.exists():
-            count = negative_overtime.count()
-            self.stdout.write(f'\nFound {count} attendance(s) with negative overtime_hours')
-            
-            for attendance in negative_overtime:
-                old_value = attendance.overtime_hours
-                # Recalculate overtime hours
-                attendance.overtime_hours = attendance.calculate_overtime_hours()
-                # Ensure it's not negative
-                attendance.overtime_hours = max(0.0, float(attendance.overtime_hours))
-                attendance.save()
-                total_fixed += 1
-                self.stdout.write(
-                    f'  Fixed attendance {attendance.id} (user: {attendance.user.username}, '
-                    f'date: {attendance.date}): {old_value} -> {attendance.overtime_hours}'
-                )
-        else:
-            self.stdout.write('No attendances with negative overtime_hours found')
-        
+        negative = Attendance.objects.filter(
+            Q(working_hours__lt=0) | Q(overtime_hours__lt=0)
+        ).select_related('user')
+
+        def report(attendance, changes):
+            for field in ('working_hours', 'overtime_hours'):
+                if field in changes:
+                    old_value, new_value = changes[field]
+                    self.stdout.write(
+                        f'  Fixed attendance {attendance.id} (user: {attendance.user.username}, '
+                        f'date: {attendance.date}): {field} {old_value} -> {new_value}'
+                    )
+
+        # Re-derive the hours; derived values are never negative
+        examined, total_fixed = recompute_attendance(negative, on_change=report)
+        if not examined:
+            self.stdout.write('No attendances with negative working_hours or overtime_hours found')
+
         self.stdout.write(
             self.style.SUCCESS(
                 f'\nSuccessfully fixed {total_fixed} attendance record(s)'
             )
         )
-
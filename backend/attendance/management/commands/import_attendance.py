@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from attendance.importer import detect_format, import_attendance
+
+
+class Command(BaseCommand):
+    help = 'Import attendance from a CSV or XLSX export (see attendance/importer.py for the columns)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or XLSX file to import')
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate every row without saving',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Rows parsed and upserted per batch',
+        )
+        parser.add_argument(
+            '--show-errors',
+            type=int,
+            default=20,
+            help='Number of row errors to print',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            file_format = detect_format(options['path'])
+            with open(options['path'], 'rb') as file:
+                report = import_attendance(
+                    file, file_format,
+                    dry_run=options['dry_run'],
+                    chunk_size=options['chunk_size'],
+                    max_errors=options['show_errors'],
+                )
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        for error in report['errors']:
+            details = '; '.join(f'{field}: {message}' for field, message in error['errors'].items())
+            self.stdout.write(self.style.WARNING(f"  Row {error['row']}: {details}"))
+        if report['errors_truncated']:
+            self.stdout.write(f"  ... {report['failed'] - len(report['errors'])} more error(s)")
+        if report['read_error']:
+            self.stdout.write(self.style.ERROR(report['read_error']))
+
+        verb = 'Validated' if report['dry_run'] else 'Imported'
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {report['imported']} of {report['rows']} row(s); {report['failed']} failed"
+        ))
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from attendance.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the monthly (user) and daily (role) attendance rollups and year maps from attendance records'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start',
+            help='First date to rebuild (YYYY-MM-DD); rounded down to the start of its month',
+        )
+        parser.add_argument(
+            '--end',
+            help='Last date to rebuild (YYYY-MM-DD); rounded up to the end of its month',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            start_date = datetime.strptime(options['start'], '%Y-%m-%d').date() if options['start'] else None
+            end_date = datetime.strptime(options['end'], '%Y-%m-%d').date() if options['end'] else None
+        except ValueError:
+            raise CommandError('Dates must be in YYYY-MM-DD format')
+
+        monthly, daily, year_maps = rebuild_rollups(start_date, end_date)
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {monthly} monthly and {daily} daily attendance rollup(s) and {year_maps} year map(s)'
+        ))
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from attendance.models import Attendance
+from attendance.recompute import recompute_attendance
+
+
+class Command(BaseCommand):
+    help = 'Re-derive status, working hours and overtime hours for attendance records in a date range'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', help='First date to recompute (YYYY-MM-DD)')
+        parser.add_argument('--end', help='Last date to recompute (YYYY-MM-DD)')
+        parser.add_argument('--user', type=int, help='Only recompute this user id')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Records loaded and written per batch',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would change without saving',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            start_date = datetime.strptime(options['start'], '%Y-%m-%d').date() if options['start'] else None
+            end_date = datetime.strptime(options['end'], '%Y-%m-%d').date() if options['end'] else None
+        except ValueError:
+            raise CommandError('Dates must be in YYYY-MM-DD format')
+
+        attendances = Attendance.objects.all()
+        if start_date:
+            attendances = attendances.filter(date__gte=start_date)
+        if end_date:
+            attendances = attendances.filter(date__lte=end_date)
+        if options['user']:
+            attendances = attendances.filter(user_id=options['user'])
+
+        def report(attendance, changes):
+            if options['verbosity'] > 1:
+                details = ', '.join(f'{field}: {old} -> {new}' for field, (old, new) in changes.items())
+                self.stdout.write(f'  Attendance {attendance.id} (user {attendance.user_id}, date: {attendance.date}): {details}')
+
+        examined, changed = recompute_attendance(
+            attendances,
+            batch_size=options['batch_size'],
+            dry_run=options['dry_run'],
+            on_change=report,
+        )
+        verb = 'would change' if options['dry_run'] else 'updated'
+        self.stdout.write(self.style.SUCCESS(
+            f'Recomputed {examined} attendance record(s); {changed} {verb}'
+        ))
@@ -0,0 +1,111 @@
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from attendance.checkin import check_in
+from attendance.models import Attendance
+from attendance.rollups import flush_deferred_rollup_refreshes
+from authentication.models import UserRole
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-test the check-in path: temporary employees all check in (plus client retries) '
+        'from concurrent threads within a simulated 6-8 AM window'
+    )
+
+    username_prefix = 'checkin_burst_'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200, help='Number of simulated employees')
+        parser.add_argument('--threads', type=int, default=32, help='Concurrent request threads')
+        parser.add_argument('--retries', type=int, default=1, help='Duplicate (retried) requests per employee')
+        parser.add_argument('--date', help='Attendance date to use (YYYY-MM-DD, default today)')
+        parser.add_argument('--keep', action='store_true', help='Keep the temporary users and their attendance')
+
+    def handle(self, *args, **options):
+        if User.objects.filter(username__startswith=self.username_prefix).exists():
+            raise CommandError(
+                f'Users named {self.username_prefix}* already exist (left by a --keep run); delete them first'
+            )
+        try:
+            day = datetime.strptime(options['date'], '%Y-%m-%d').date() if options['date'] else timezone.localdate()
+        except ValueError:
+            raise CommandError('--date must be in YYYY-MM-DD format')
+
+        users = self.create_users(options['users'])
+        window_start = timezone.make_aware(datetime.combine(day, dt_time(6, 0)))
+
+        # Each employee checks in once, then retries; shuffle so retries interleave with first attempts
+        calls = [user for user in users for _ in range(1 + options['retries'])]
+        random.shuffle(calls)
+
+        latencies = []
+        results = []
+        lock = threading.Lock()
+
+        def request(user):
+            now = window_start + timedelta(seconds=random.uniform(0, 7200))
+            started = time.perf_counter()
+            try:
+                _, checked_in = check_in(user, now)
+                error = None
+            except Exception as e:
+                checked_in, error = False, e
+            finally:
+                elapsed = time.perf_counter() - started
+                connection.close()
+            with lock:
+                latencies.append(elapsed)
+                results.append((user.pk, checked_in, error))
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['threads']) as pool:
+            list(pool.map(request, calls))
+        duration = time.perf_counter() - started
+        flush_deferred_rollup_refreshes()
+
+        errors = [error for _, _, error in results if error]
+        check_ins = sum(1 for _, checked_in, _ in results if checked_in)
+        rows = Attendance.objects.filter(user__in=users, date=day).count()
+        missing = Attendance.objects.filter(user__in=users, date=day, check_in__isnull=True).count()
+
+        latencies.sort()
+        quantile = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+        self.stdout.write(f'Requests:   {len(calls)} from {options["threads"]} threads in {duration:.2f}s '
+                          f'({len(calls) / duration:.0f} req/s)')
+        self.stdout.write(f'Latency ms: p50 {quantile(0.5):.1f}  p95 {quantile(0.95):.1f}  '
+                          f'p99 {quantile(0.99):.1f}  max {latencies[-1] * 1000:.1f}  '
+                          f'mean {statistics.mean(latencies) * 1000:.1f}')
+        self.stdout.write(f'Check-ins:  {check_ins} recorded, {len(calls) - check_ins - len(errors)} retries '
+                          f'answered as already marked, {len(errors)} error(s)')
+
+        if not options['keep']:
+            User.objects.filter(pk__in=[user.pk for user in users]).delete()
+
+        if errors or check_ins != len(users) or rows != len(users) or missing:
+            for error in errors[:5]:
+                self.stderr.write(f'  {type(error).__name__}: {error}')
+            raise CommandError(
+                f'Inconsistent result: {rows} row(s) and {check_ins} check-in(s) for {len(users)} user(s), '
+                f'{missing} row(s) without check-in'
+            )
+        self.stdout.write(self.style.SUCCESS(f'Exactly one check-in per employee for {day}'))
+
+    def create_users(self, count):
+        User.objects.bulk_create([
+            User(username=f'{self.username_prefix}{index}', first_name='Burst', last_name=str(index))
+            for index in range(count)
+        ])
+        users = list(User.objects.filter(username__startswith=self.username_prefix))
+        # bulk_create skips the signal that gives every user a role
+        UserRole.objects.bulk_create([UserRole(user=user, role='general_employee') for user in users])
+        return users
@@ -0,0 +1,77 @@
+# Generated by Django 5.0 on 2026-10-19 02:25
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRoleAttendanceRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('role', models.CharField(max_length=50)),
+                ('records', models.PositiveIntegerField(default=0)),
+                ('present', models.PositiveIntegerField(default=0)),
+                ('half_day', models.PositiveIntegerField(default=0)),
+                ('absent', models.PositiveIntegerField(default=0)),
+                ('leave', models.PositiveIntegerField(default=0)),
+                ('working_hours', models.DecimalField(decimal_places=2, default=0.0, max_digits=10)),
+                ('overtime_hours', models.DecimalField(decimal_places=2, default=0.0, max_digits=10)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Daily Role Attendance Rollup',
+                'verbose_name_plural': 'Daily Role Attendance Rollups',
+                'db_table': 'attendance_daily_role_rollups',
+                'ordering': ['-date', 'role'],
+            },
+        ),
+        migrations.CreateModel(
+            name='MonthlyAttendanceRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('records', models.PositiveIntegerField(default=0)),
+                ('present_days', models.PositiveIntegerField(default=0)),
+                ('half_days', models.PositiveIntegerField(default=0)),
+                ('absent_days', models.PositiveIntegerField(default=0)),
+                ('leave_days', models.PositiveIntegerField(default=0)),
+                ('working_hours', models.DecimalField(decimal_places=2, default=0.0, max_digits=8)),
+                ('overtime_hours', models.DecimalField(decimal_places=2, default=0.0, max_digits=8)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Monthly Attendance Rollup',
+                'verbose_name_plural': 'Monthly Attendance Rollups',
+                'db_table': 'attendance_monthly_rollups',
+                'ordering': ['-year', '-month'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailyroleattendancerollup',
+            constraint=models.UniqueConstraint(fields=('date', 'role'), name='unique_daily_role_attendance_rollup'),
+        ),
+        migrations.AddField(
+            model_name='monthlyattendancerollup',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_rollups', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='monthlyattendancerollup',
+            index=models.Index(fields=['year', 'month'], name='attendance_rollup_month_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='monthlyattendancerollup',
+            constraint=models.UniqueConstraint(fields=('user', 'year', 'month'), name='unique_monthly_attendance_rollup'),
+        ),
+    ]
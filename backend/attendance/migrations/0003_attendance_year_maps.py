@@ -0,0 +1,40 @@
+# Generated by Django 5.0 on 2026-10-19 02:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0002_attendance_rollups'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceYearMap',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('status', models.BinaryField(default=bytes)),
+                ('leave', models.BinaryField(default=bytes)),
+                ('working_hours', models.BinaryField(default=bytes)),
+                ('overtime_hours', models.BinaryField(default=bytes)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_year_maps', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Attendance Year Map',
+                'verbose_name_plural': 'Attendance Year Maps',
+                'db_table': 'attendance_year_maps',
+                'ordering': ['-year'],
+                'indexes': [models.Index(fields=['year'], name='attendance_year_map_year_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='attendanceyearmap',
+            constraint=models.UniqueConstraint(fields=('user', 'year'), name='unique_attendance_year_map'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+from django.db import migrations
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+def backfill_rollups(apps, schema_editor):
+    Attendance = apps.get_model('attendance', 'Attendance')
+    MonthlyAttendanceRollup = apps.get_model('attendance', 'MonthlyAttendanceRollup')
+    DailyRoleAttendanceRollup = apps.get_model('attendance', 'DailyRoleAttendanceRollup')
+
+    monthly = Attendance.objects.order_by().values(
+        'user_id', year=ExtractYear('date'), month=ExtractMonth('date')
+    ).annotate(
+        records=Count('pk'),
+        present_days=Count('pk', filter=Q(status='present')),
+        half_days=Count('pk', filter=Q(status='half_day')),
+        absent_days=Count('pk', filter=Q(status='absent')),
+        leave_days=Count('pk', filter=Q(status='leave')),
+        total_working=Sum('working_hours'),
+        total_overtime=Sum('overtime_hours'),
+    )
+    MonthlyAttendanceRollup.objects.bulk_create([
+        MonthlyAttendanceRollup(
+            user_id=row['user_id'], year=row['year'], month=row['month'],
+            records=row['records'], present_days=row['present_days'], half_days=row['half_days'],
+            absent_days=row['absent_days'], leave_days=row['leave_days'],
+            working_hours=row['total_working'] or 0, overtime_hours=row['total_overtime'] or 0,
+        )
+        for row in monthly
+    ], batch_size=1000, ignore_conflicts=True)
+
+    UserRole = apps.get_model('authentication', 'UserRole')
+    roles = dict(UserRole.objects.values_list('user_id', 'role'))
+    daily = {}
+    for user_id, day, status, working_hours, overtime_hours in Attendance.objects.values_list(
+        'user_id', 'date', 'status', 'working_hours', 'overtime_hours'
+    ).iterator(chunk_size=5000):
+        role = roles.get(user_id)
+        if role is None:
+            continue
+        rollup = daily.get((day, role))
+        if rollup is None:
+            rollup = daily[(day, role)] = DailyRoleAttendanceRollup(
+                date=day, role=role, records=0, present=0, half_day=0, absent=0, leave=0,
+                working_hours=0, overtime_hours=0,
+            )
+        rollup.records += 1
+        if status in ('present', 'half_day', 'absent', 'leave'):
+            setattr(rollup, status, getattr(rollup, status) + 1)
+        rollup.working_hours += working_hours or 0
+        rollup.overtime_hours += overtime_hours or 0
+    DailyRoleAttendanceRollup.objects.bulk_create(daily.values(), batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0003_attendance_year_maps'),
+        ('authentication', '0021_rename_hr_staff_to_hr_head'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
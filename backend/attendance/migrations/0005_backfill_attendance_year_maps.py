@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+def backfill_year_maps(apps, schema_editor):
+    from attendance.yearmaps import build_year_maps
+
+    Attendance = apps.get_model('attendance', 'Attendance')
+    AttendanceYearMap = apps.get_model('attendance', 'AttendanceYearMap')
+    AttendanceYearMap.objects.bulk_create(
+        build_year_maps(Attendance.objects.all(), AttendanceYearMap),
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0004_backfill_attendance_rollups'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_year_maps, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-19 02:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0005_backfill_attendance_year_maps'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='holiday',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from datetime import datetime, time, timedelta
 
@@ -10,6 +12,7 @@ class Holiday(models.Model):
     date = models.DateField(unique=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         db_table = 'holidays'
@@ -178,13 +181,114 @@ class Attendance(models.Model):
     @staticmethod
     def is_working_day(date):
         """Check if a date is a working day (not Sunday and not a holiday)"""
-        # Check if it's Sunday
-        if date.weekday() == 6:  # Sunday is 6
-            return False
-        
-        # Check if it's a holiday
-        if Holiday.objects.filter(date=date, is_active=True).exists():
-            return False
-        
-        return True
+        from .workdays import is_working_day
+        return is_working_day(date)
+
+
+@receiver(post_save, sender=Holiday)
+@receiver(post_delete, sender=Holiday)
+def invalidate_working_calendar(sender, **kwargs):
+    """Holiday changes alter which days are working days"""
+    from .workdays import working_calendar
+    working_calendar.invalidate()
+
+
+class MonthlyAttendanceRollup(models.Model):
+    """Per user, per month attendance totals maintained from Attendance changes (see rollups.py)"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='attendance_rollups')
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+
+    records = models.PositiveIntegerField(default=0)
+    present_days = models.PositiveIntegerField(default=0)
+    half_days = models.PositiveIntegerField(default=0)
+    absent_days = models.PositiveIntegerField(default=0)  # Recorded absences only
+    leave_days = models.PositiveIntegerField(default=0)
+    working_hours = models.DecimalField(max_digits=8, decimal_places=2, default=0.00)
+    overtime_hours = models.DecimalField(max_digits=8, decimal_places=2, default=0.00)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'attendance_monthly_rollups'
+        verbose_name = 'Monthly Attendance Rollup'
+        verbose_name_plural = 'Monthly Attendance Rollups'
+        ordering = ['-year', '-month']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'year', 'month'], name='unique_monthly_attendance_rollup'),
+        ]
+        indexes = [
+            models.Index(fields=['year', 'month'], name='attendance_rollup_month_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.year}-{self.month:02d}"
+
+
+class DailyRoleAttendanceRollup(models.Model):
+    """Per day, per role attendance totals maintained from Attendance changes (see rollups.py)"""
+    date = models.DateField()
+    role = models.CharField(max_length=50)
+
+    records = models.PositiveIntegerField(default=0)
+    present = models.PositiveIntegerField(default=0)
+    half_day = models.PositiveIntegerField(default=0)
+    absent = models.PositiveIntegerField(default=0)
+    leave = models.PositiveIntegerField(default=0)
+    working_hours = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    overtime_hours = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'attendance_daily_role_rollups'
+        verbose_name = 'Daily Role Attendance Rollup'
+        verbose_name_plural = 'Daily Role Attendance Rollups'
+        ordering = ['-date', 'role']
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'role'], name='unique_daily_role_attendance_rollup'),
+        ]
+
+    def __str__(self):
+        return f"{self.date} - {self.role}"
+
+
+class AttendanceYearMap(models.Model):
+    """
+    One user's attendance for a year as packed per-day arrays, maintained with
+    the rollups (see yearmaps.py for the encoding)
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='attendance_year_maps')
+    year = models.PositiveSmallIntegerField()
+
+    status = models.BinaryField(default=bytes)          # 2 bits per day
+    leave = models.BinaryField(default=bytes)           # 1 bit per day
+    working_hours = models.BinaryField(default=bytes)   # uint16 hundredths of an hour per day
+    overtime_hours = models.BinaryField(default=bytes)  # uint16 hundredths of an hour per day
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'attendance_year_maps'
+        verbose_name = 'Attendance Year Map'
+        verbose_name_plural = 'Attendance Year Maps'
+        ordering = ['-year']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'year'], name='unique_attendance_year_map'),
+        ]
+        indexes = [
+            models.Index(fields=['year'], name='attendance_year_map_year_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.year}"
+
 
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def refresh_attendance_rollups(sender, instance, raw=False, **kwargs):
+    """Keep the rollups covering this attendance row in step with it"""
+    if raw:
+        return
+    from .rollups import queue_rollup_refresh
+    queue_rollup_refresh(instance.user_id, instance.date)
@@ -0,0 +1,68 @@
+"""
+Batch re-derivation of attendance status and hours.
+
+``recompute_attendance`` walks a queryset in primary-key order, runs each
+batch through ``derive_hours`` and writes back only the rows whose derived
+fields changed, with one ``bulk_update`` and one rollup refresh per batch.
+It backs the recompute_attendance_hours command (e.g. after a rule change)
+and the fix_* repair commands.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .hours import DERIVED_FIELDS, derive_hours
+from .models import Attendance
+from .rollups import refresh_rollups_for
+
+UPDATE_FIELDS = DERIVED_FIELDS + ['updated_at']
+
+
+def _snapshot(record):
+    return {field: getattr(record, field) for field in DERIVED_FIELDS}
+
+
+def recompute_attendance(queryset=None, batch_size=2000, dry_run=False, force_status=None, on_change=None):
+    """
+    Re-derive status, working_hours and overtime_hours for every record in
+    queryset (all attendance by default).
+
+    force_status is applied before deriving, e.g. 'absent' to clear a set of
+    records. on_change(record, changes) is called for each changed record
+    with {field: (old, new)}. Returns (examined, changed).
+    """
+    queryset = (queryset if queryset is not None else Attendance.objects.all()).order_by('pk')
+    examined = changed_count = 0
+    last_pk = 0
+    while True:
+        records = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+        if not records:
+            break
+        last_pk = records[-1].pk
+        examined += len(records)
+
+        before = [_snapshot(record) for record in records]
+        if force_status:
+            for record in records:
+                record.status = force_status
+        derive_hours(records)
+
+        now = timezone.now()
+        changed = []
+        for record, old in zip(records, before):
+            changes = {
+                field: (old[field], getattr(record, field))
+                for field in DERIVED_FIELDS if old[field] != getattr(record, field)
+            }
+            if changes:
+                record.updated_at = now
+                changed.append(record)
+                if on_change:
+                    on_change(record, changes)
+        changed_count += len(changed)
+
+        if changed and not dry_run:
+            with transaction.atomic():
+                Attendance.objects.bulk_update(changed, UPDATE_FIELDS)
+                # bulk_update skips the rollup receivers
+                refresh_rollups_for((record.user_id, record.date) for record in changed)
+    return examined, changed_count
@@ -0,0 +1,209 @@
+"""
+Maintenance of the attendance rollup tables.
+
+``MonthlyAttendanceRollup`` holds one row per (user, month) and
+``DailyRoleAttendanceRollup`` one row per (date, role); the per-user year
+maps (yearmaps.py) are refreshed with the monthly rows. The Attendance
+receivers in attendance/models.py call ``queue_rollup_refresh`` and the
+affected keys are recomputed once the transaction commits, so a check-in
+followed by a check-out in the same request refreshes them once.
+
+Daily rows are keyed by each user's current role. Paths that write
+attendance with ``update()`` or ``bulk_create`` skip the receivers and call
+``refresh_rollups`` themselves, or ``defer_rollup_refresh`` on hot paths where
+many requests touch the same day; the ``rebuild_attendance_rollups`` command
+recomputes everything, e.g. after role changes.
+"""
+import calendar
+import logging
+from datetime import date
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+from auditra_backend.background import BatchWorker
+from auditra_backend.transactions import CoalescedCallback, queue_on_commit
+
+from .models import Attendance, DailyRoleAttendanceRollup, MonthlyAttendanceRollup
+from .yearmaps import rebuild_year_maps, refresh_year_maps
+
+logger = logging.getLogger(__name__)
+
+MONTHLY_TOTALS = {
+    'records': Count('pk'),
+    'present_days': Count('pk', filter=Q(status='present')),
+    'half_days': Count('pk', filter=Q(status='half_day')),
+    'absent_days': Count('pk', filter=Q(status='absent')),
+    'leave_days': Count('pk', filter=Q(status='leave')),
+    'working_hours': Sum('working_hours'),
+    'overtime_hours': Sum('overtime_hours'),
+}
+
+DAILY_TOTALS = {
+    'records': Count('pk'),
+    'present': Count('pk', filter=Q(status='present')),
+    'half_day': Count('pk', filter=Q(status='half_day')),
+    'absent': Count('pk', filter=Q(status='absent')),
+    'leave': Count('pk', filter=Q(status='leave')),
+    'working_hours': Sum('working_hours'),
+    'overtime_hours': Sum('overtime_hours'),
+}
+
+
+def _month_range(year, month):
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _monthly_rollups(attendances):
+    rows = attendances.order_by().values(
+        'user_id', year=ExtractYear('date'), month=ExtractMonth('date')
+    ).annotate(**MONTHLY_TOTALS)
+    return [
+        MonthlyAttendanceRollup(**{**row, 'working_hours': row['working_hours'] or 0,
+                                   'overtime_hours': row['overtime_hours'] or 0})
+        for row in rows
+    ]
+
+
+def _daily_rollups(attendances):
+    rows = attendances.filter(user__role__isnull=False).order_by().values(
+        'date', role=F('user__role__role')
+    ).annotate(**DAILY_TOTALS)
+    return [
+        DailyRoleAttendanceRollup(**{**row, 'working_hours': row['working_hours'] or 0,
+                                     'overtime_hours': row['overtime_hours'] or 0})
+        for row in rows
+    ]
+
+
+def _save_monthly(rollups):
+    MonthlyAttendanceRollup.objects.bulk_create(
+        rollups,
+        update_conflicts=True,
+        unique_fields=['user', 'year', 'month'],
+        update_fields=list(MONTHLY_TOTALS) + ['updated_at'],
+    )
+
+
+def _save_daily(rollups):
+    DailyRoleAttendanceRollup.objects.bulk_create(
+        rollups,
+        update_conflicts=True,
+        unique_fields=['date', 'role'],
+        update_fields=list(DAILY_TOTALS) + ['updated_at'],
+    )
+
+
+def _group_by_month(user_months):
+    grouped = {}
+    for user_id, year, month in user_months:
+        grouped.setdefault((year, month), []).append(user_id)
+    return grouped
+
+
+def refresh_rollups(user_months=(), dates=()):
+    """
+    Recompute the given keys.
+
+    user_months is an iterable of (user_id, year, month), dates the days whose
+    per-role rows should be rebuilt. Keys left without attendance are removed.
+    """
+    user_months = set(user_months)
+    dates = set(dates)
+
+    if user_months:
+        by_month = _group_by_month(user_months)
+        attendances = Attendance.objects.filter(reduce(or_, (
+            Q(user_id__in=user_ids, date__range=_month_range(year, month))
+            for (year, month), user_ids in by_month.items()
+        )))
+        rollups = _monthly_rollups(attendances)
+        _save_monthly(rollups)
+        refresh_year_maps(user_months, attendances)
+        stale = user_months - {(r.user_id, r.year, r.month) for r in rollups}
+        if stale:
+            MonthlyAttendanceRollup.objects.filter(reduce(or_, (
+                Q(user_id__in=user_ids, year=year, month=month)
+                for (year, month), user_ids in _group_by_month(stale).items()
+            ))).delete()
+
+    if dates:
+        rollups = _daily_rollups(Attendance.objects.filter(date__in=dates))
+        _save_daily(rollups)
+        kept = {(r.date, r.role) for r in rollups}
+        stale = [
+            pk for pk, day, role in DailyRoleAttendanceRollup.objects.filter(date__in=dates).values_list('pk', 'date', 'role')
+            if (day, role) not in kept
+        ]
+        if stale:
+            DailyRoleAttendanceRollup.objects.filter(pk__in=stale).delete()
+
+
+def refresh_rollups_for(pairs):
+    """Refresh rollups covering (user_id, date) pairs"""
+    pairs = list(pairs)
+    refresh_rollups(
+        user_months={(user_id, day.year, day.month) for user_id, day in pairs},
+        dates={day for _, day in pairs},
+    )
+
+
+@transaction.atomic
+def rebuild_rollups(start_date=None, end_date=None):
+    """
+    Recompute every rollup, optionally limited to whole months/days within a
+    date range; year maps are rebuilt for every year the range touches
+    """
+    attendances = Attendance.objects.all()
+    monthly = MonthlyAttendanceRollup.objects.all()
+    daily = DailyRoleAttendanceRollup.objects.all()
+    if start_date:
+        start_date = start_date.replace(day=1)
+        attendances = attendances.filter(date__gte=start_date)
+        daily = daily.filter(date__gte=start_date)
+        monthly = monthly.filter(Q(year__gt=start_date.year) | Q(year=start_date.year, month__gte=start_date.month))
+    if end_date:
+        end_date = _month_range(end_date.year, end_date.month)[1]
+        attendances = attendances.filter(date__lte=end_date)
+        daily = daily.filter(date__lte=end_date)
+        monthly = monthly.filter(Q(year__lt=end_date.year) | Q(year=end_date.year, month__lte=end_date.month))
+
+    monthly.delete()
+    daily.delete()
+    monthly_rollups = _monthly_rollups(attendances)
+    daily_rollups = _daily_rollups(attendances)
+    MonthlyAttendanceRollup.objects.bulk_create(monthly_rollups, batch_size=1000)
+    DailyRoleAttendanceRollup.objects.bulk_create(daily_rollups, batch_size=1000)
+    year_maps = rebuild_year_maps(start_date.year if start_date else None, end_date.year if end_date else None)
+    return len(monthly_rollups), len(daily_rollups), year_maps
+
+
+class _RollupRefresh(CoalescedCallback):
+    """on_commit callback carrying every (user, date) touched in the transaction"""
+
+    def run(self, pairs):
+        try:
+            refresh_rollups_for(pairs)
+        except Exception:
+            logger.exception('Failed to refresh attendance rollups for %d row(s)', len(pairs))
+
+
+def queue_rollup_refresh(user_id, day):
+    """Refresh the rollups covering this user and date once the current transaction commits"""
+    queue_on_commit(_RollupRefresh, (user_id, day))
+
+
+_deferred_refreshes = BatchWorker('attendance-rollup-refresh', refresh_rollups_for, interval=5.0, max_batch=500)
+
+
+def defer_rollup_refresh(user_id, day):
+    """Refresh the rollups covering this user and date in a background batch after commit"""
+    _deferred_refreshes.add((user_id, day))
+
+
+def flush_deferred_rollup_refreshes():
+    """Run queued background refreshes now (management commands, shutdown)"""
+    _deferred_refreshes.flush()
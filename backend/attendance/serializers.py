@@ -41,3 +41,22 @@ class HolidaySerializer(serializers.ModelSerializer):
         fields = ('id', 'name', 'date', 'is_active', 'created_at')
         read_only_fields = ('created_at',)
 
+
+
+class AttendanceCorrectionSerializer(serializers.Serializer):
+    """One row of an HR bulk correction; omitted fields keep their current value"""
+    user = serializers.IntegerField(min_value=1)
+    date = serializers.DateField()
+    check_in = serializers.DateTimeField(required=False, allow_null=True)
+    check_out = serializers.DateTimeField(required=False, allow_null=True)
+    overtime_start = serializers.DateTimeField(required=False, allow_null=True)
+    overtime_end = serializers.DateTimeField(required=False, allow_null=True)
+    status = serializers.ChoiceField(choices=Attendance.STATUS_CHOICES, required=False)
+    notes = serializers.CharField(required=False, allow_blank=True)
+
+    def validate(self, attrs):
+        if attrs.get('check_in') and attrs.get('check_out') and attrs['check_out'] < attrs['check_in']:
+            raise serializers.ValidationError({'check_out': 'Check-out cannot be before check-in'})
+        if attrs.get('overtime_start') and attrs.get('overtime_end') and attrs['overtime_end'] < attrs['overtime_start']:
+            raise serializers.ValidationError({'overtime_end': 'Overtime end cannot be before overtime start'})
+        return attrs
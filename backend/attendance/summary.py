@@ -0,0 +1,254 @@
+"""
+Attendance aggregation over arbitrary date ranges.
+
+* ``summarize_attendance`` reads one user's range once with ``values()`` and
+  folds it into counts, hour totals and the per-day series in a single pass,
+  so a yearly summary costs a single attendance query like a weekly one.
+* ``summarize_employees`` builds HR reports from a single ``GROUP BY user_id``
+  with conditional aggregates, however many employees are included.
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.db.models import Count, Q, Sum
+
+from .models import Attendance
+from .workdays import is_working_day, iter_working_days, working_days_between
+
+# Roles that take attendance and appear in HR reports
+EMPLOYEE_ROLES = [
+    'coordinator', 'field_officer', 'senior_valuer',
+    'accessor', 'md_gm', 'general_employee'
+]
+
+SUMMARY_FIELDS = ('date', 'status', 'check_in', 'check_out', 'working_hours', 'overtime_hours')
+
+
+def _day_entry(day, row):
+    if row is None:
+        return {
+            'date': day.isoformat(),
+            'status': 'absent',
+            'check_in': None,
+            'check_out': None,
+            'working_hours': 0.0,
+            'overtime_hours': 0.0,
+        }
+    return {
+        'date': day.isoformat(),
+        'status': row['status'],
+        'check_in': row['check_in'].isoformat() if row['check_in'] else None,
+        'check_out': row['check_out'].isoformat() if row['check_out'] else None,
+        'working_hours': float(row['working_hours']),
+        'overtime_hours': float(row['overtime_hours']),
+    }
+
+
+def summarize_attendance(user, start_date, end_date):
+    """Summary statistics and daily breakdown for a user between two dates (inclusive)"""
+    rows = Attendance.objects.filter(
+        user=user,
+        date__range=[start_date, end_date]
+    ).order_by().values(*SUMMARY_FIELDS)
+
+    by_date = {}
+    present_count = half_day_count = 0
+    total_working_hours = total_overtime_hours = Decimal('0')
+    for row in rows:
+        by_date[row['date']] = row
+        if row['status'] == 'present':
+            present_count += 1
+        elif row['status'] == 'half_day':
+            half_day_count += 1
+        total_working_hours += row['working_hours'] or 0
+        total_overtime_hours += row['overtime_hours'] or 0
+
+    working_dates = list(iter_working_days(start_date, end_date))
+    working_days = len(working_dates)
+
+    attendance_percentage = 0.0
+    if working_days > 0:
+        attendance_percentage = ((present_count + half_day_count * 0.5) / working_days) * 100
+
+    return {
+        'start_date': start_date.isoformat(),
+        'end_date': end_date.isoformat(),
+        'total_days': (end_date - start_date).days + 1,
+        'working_days': working_days,
+        'summary': {
+            'present': present_count,
+            'half_day': half_day_count,
+            'absent': working_days - present_count - half_day_count,
+            'total_working_hours': float(total_working_hours),
+            'total_overtime_hours': float(total_overtime_hours),
+            'attendance_percentage': round(float(attendance_percentage), 2),
+        },
+        'daily_data': [_day_entry(day, by_date.get(day)) for day in working_dates],
+    }
+
+
+def period_bounds(period, today):
+    """(start, end) of the daily/weekly/monthly/yearly period containing today"""
+    if period == 'daily':
+        return today, today
+    if period == 'weekly':
+        start_date = today - timedelta(days=today.weekday())
+        return start_date, start_date + timedelta(days=6)
+    if period == 'monthly':
+        start_date = today.replace(day=1)
+        if today.month == 12:
+            return start_date, today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
+        return start_date, today.replace(month=today.month + 1, day=1) - timedelta(days=1)
+    if period == 'yearly':
+        return today.replace(month=1, day=1), today.replace(month=12, day=31)
+    raise ValueError(period)
+
+
+def parse_date_range(params, max_days):
+    """
+    Read start_date/end_date (YYYY-MM-DD) from query params.
+
+    Raises ValueError with a client-facing message when they are missing,
+    malformed, reversed or span more than max_days.
+    """
+    try:
+        start_date = datetime.strptime(params.get('start_date', ''), '%Y-%m-%d').date()
+        end_date = datetime.strptime(params.get('end_date', ''), '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError('start_date and end_date are required for a custom period. Use YYYY-MM-DD')
+    if end_date < start_date:
+        raise ValueError('end_date must be on or after start_date')
+    if (end_date - start_date).days >= max_days:
+        raise ValueError(f'Custom periods are limited to {max_days} days')
+    return start_date, end_date
+
+
+def parse_roles(params):
+    """
+    Employee roles requested with ?role= (repeatable or comma separated); all
+    when absent. Raises ValueError with a client-facing message for unknown roles.
+    """
+    requested = [
+        role.strip()
+        for value in params.getlist('role')
+        for role in value.split(',')
+        if role.strip()
+    ]
+    if not requested:
+        return list(EMPLOYEE_ROLES)
+    unknown = [role for role in requested if role not in EMPLOYEE_ROLES]
+    if unknown:
+        raise ValueError(f'Unknown role: {", ".join(unknown)}. Use: {", ".join(EMPLOYEE_ROLES)}')
+    return requested
+
+
+def employee_queryset(roles=None, search=None):
+    """Employees included in HR reports, optionally narrowed by role and name"""
+    users = User.objects.filter(role__role__in=EMPLOYEE_ROLES if roles is None else roles)
+    if search:
+        users = users.filter(
+            Q(first_name__icontains=search)
+            | Q(last_name__icontains=search)
+            | Q(username__icontains=search)
+        )
+    return users
+
+
+def _employee_rows(users):
+    return users.order_by().values('id', 'username', 'first_name', 'last_name', 'role__role')
+
+
+def _employee_name(row):
+    return f"{row['first_name']} {row['last_name']}".strip() or row['username']
+
+
+def summarize_employees(start_date, end_date, users):
+    """
+    Per-employee totals for the range, one entry per user in ``users``.
+
+    Attendance is aggregated in a single GROUP BY user_id query; employees
+    without rows in the range report zero attendance.
+    """
+    working_days = working_days_between(start_date, end_date)
+
+    totals = {
+        row['user_id']: row
+        for row in Attendance.objects.filter(
+            date__range=[start_date, end_date],
+            user__in=users.values('pk'),
+        ).order_by().values('user_id').annotate(
+            present=Count('pk', filter=Q(status='present')),
+            half_day=Count('pk', filter=Q(status='half_day')),
+            working_hours=Sum('working_hours'),
+            overtime_hours=Sum('overtime_hours'),
+        )
+    }
+
+    results = []
+    for employee in _employee_rows(users):
+        row = totals.get(employee['id'], {})
+        present_count = row.get('present', 0)
+        half_day_count = row.get('half_day', 0)
+
+        attendance_percentage = 0.0
+        if working_days > 0:
+            attendance_percentage = ((present_count + half_day_count * 0.5) / working_days) * 100
+
+        results.append({
+            'user_id': employee['id'],
+            'employee_name': _employee_name(employee),
+            'employee_number': str(employee['id']),
+            'role': employee['role__role'],
+            'present_days': present_count,
+            'half_days': half_day_count,
+            'absent_days': max(0, working_days - present_count - half_day_count),
+            'working_hours': round(float(row.get('working_hours') or 0), 2),
+            'overtime_hours': round(float(row.get('overtime_hours') or 0), 2),
+            'attendance_percentage': round(float(attendance_percentage), 2),
+        })
+
+    results.sort(key=lambda x: x['employee_name'])
+    return results, working_days
+
+
+def employee_day_status(day, users):
+    """Each employee's attendance on a single day, in two queries"""
+    is_working = is_working_day(day)
+
+    records = {
+        row['user_id']: row
+        for row in Attendance.objects.filter(
+            date=day,
+            user__in=users.values('pk'),
+        ).order_by().values('user_id', *SUMMARY_FIELDS)
+    }
+
+    results = []
+    for employee in _employee_rows(users):
+        row = records.get(employee['id'])
+        entry = {
+            'employee_name': _employee_name(employee),
+            'employee_number': str(employee['id']),
+            'role': employee['role__role'],
+        }
+        if row:
+            entry.update({
+                'status': row['status'],
+                'check_in': row['check_in'].isoformat() if row['check_in'] else None,
+                'check_out': row['check_out'].isoformat() if row['check_out'] else None,
+                'working_hours': round(float(row['working_hours']), 2),
+                'overtime_hours': round(float(row['overtime_hours']), 2),
+            })
+        else:
+            entry.update({
+                'status': 'absent' if is_working else 'N/A',
+                'check_in': None,
+                'check_out': None,
+                'working_hours': 0.0,
+                'overtime_hours': 0.0,
+            })
+        results.append(entry)
+
+    results.sort(key=lambda x: x['employee_name'])
+    return results
@@ -0,0 +1,268 @@
+import io
+import random
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+import numpy as np
+from django.utils import timezone
+
+from .hours import DERIVED_FIELDS, derive_hours
+from .importer import import_attendance
+from .models import Attendance, AttendanceYearMap
+from .rollups import refresh_rollups_for
+from .workdays import working_calendar
+from .yearmaps import (
+    ABSENT, DAYS, HALF_DAY, LEAVE, NO_RECORD, PRESENT, STATUS_BYTES, _attended_and_recorded,
+    attendance_streaks, day_index, organisation_presence, pack_status, rebuild_year_maps,
+    unpack_status, year_heatmap,
+)
+
+
+def csv_file(*lines):
+    return io.BytesIO(('\n'.join(lines) + '\n').encode())
+
+
+def local(day, hour, minute=0):
+    return timezone.make_aware(datetime.combine(day, time(hour, minute)))
+
+
+class DeriveHoursTests(TestCase):
+    """derive_hours must give the same results as Attendance.save()"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('officer', password='pass')
+
+    def derive(self, **fields):
+        record = Attendance(user=self.user, date=date(2026, 3, 2), **fields)
+        derive_hours([record])
+        return record
+
+    def test_working_window_is_clamped_to_eight_to_five(self):
+        day = date(2026, 3, 2)
+        record = self.derive(status='', check_in=local(day, 6, 30), check_out=local(day, 19))
+        self.assertEqual((record.status, record.working_hours), ('present', Decimal('9.00')))
+
+    def test_check_out_time_sets_the_status(self):
+        day = date(2026, 3, 2)
+        for check_out, expected in ((local(day, 11, 59), 'absent'), (local(day, 12), 'half_day'), (local(day, 17), 'present')):
+            self.assertEqual(self.derive(status='', check_in=local(day, 8), check_out=check_out).status, expected)
+
+    def test_inverted_times_mark_absent_and_clear_them(self):
+        day = date(2026, 3, 2)
+        record = self.derive(status='present', check_in=local(day, 17), check_out=local(day, 8))
+        self.assertEqual((record.status, record.check_in, record.check_out, record.working_hours), ('absent', None, None, Decimal('0.00')))
+
+    def test_explicit_absence_clears_all_times(self):
+        day = date(2026, 3, 2)
+        record = self.derive(status='absent', check_in=local(day, 8), check_out=local(day, 17),
+                             overtime_start=local(day, 17), overtime_end=local(day, 19))
+        self.assertEqual((record.check_in, record.overtime_start, record.overtime_hours), (None, None, Decimal('0.00')))
+
+    def test_matches_save_on_random_records(self):
+        rng = random.Random(48)
+        statuses = ['', '', 'present', 'half_day', 'absent', 'leave']
+        start = date(2025, 1, 1)
+
+        def moment(day):
+            if rng.random() < 0.2:
+                return None
+            return local(day, 0) + timedelta(minutes=rng.randrange(0, 26 * 60))
+
+        saved, derived = [], []
+        for offset in range(600):
+            day = start + timedelta(days=offset)
+            fields = {
+                'status': rng.choice(statuses),
+                'check_in': moment(day),
+                'check_out': moment(day),
+                'overtime_start': moment(day),
+                'overtime_end': moment(day),
+            }
+            record = Attendance(user=self.user, date=day, **fields)
+            record.save()
+            saved.append(record)
+            derived.append(Attendance(user=self.user, date=day, **fields))
+        derive_hours(derived)
+
+        stored = Attendance.objects.in_bulk([record.pk for record in saved])
+        for record, expected in zip(derived, saved):
+            expected = stored[expected.pk]
+            for field in DERIVED_FIELDS:
+                self.assertEqual(getattr(record, field), getattr(expected, field), f'{field} on {record.date}')
+
+
+class ImportAttendanceTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('officer', email='officer@example.com', password='pass')
+
+    def test_imports_rows_and_derives_hours(self):
+        report = import_attendance(csv_file(
+            'username,date,check_in,check_out,overtime_start,overtime_end',
+            'officer,2026-03-02,07:45,17:30,17:30,19:00',
+            'officer,03/03/2026,09:00,13:00,,',
+        ), 'csv')
+
+        self.assertEqual((report['rows'], report['imported'], report['failed']), (2, 2, 0))
+        first = Attendance.objects.get(user=self.user, date=date(2026, 3, 2))
+        self.assertEqual((first.status, first.working_hours, first.overtime_hours), ('present', Decimal('9.00'), Decimal('1.50')))
+        second = Attendance.objects.get(user=self.user, date=date(2026, 3, 3))
+        self.assertEqual((second.status, second.working_hours), ('half_day', Decimal('4.00')))
+
+    def test_later_duplicate_wins_and_earlier_is_reported(self):
+        report = import_attendance(csv_file(
+            'email,date,check_in,check_out',
+            'OFFICER@example.com,2026-03-02,08:00,11:00',
+            'officer@example.com,2026-03-02,08:00,17:00',
+        ), 'csv')
+
+        self.assertEqual((report['imported'], report['failed']), (1, 1))
+        self.assertEqual(report['errors'][0]['row'], 2)
+        self.assertIn('Superseded by row 3', report['errors'][0]['errors']['row'])
+        self.assertEqual(Attendance.objects.get(user=self.user, date=date(2026, 3, 2)).status, 'present')
+
+    def test_hours_too_large_to_store_are_reported_not_imported(self):
+        report = import_attendance(csv_file(
+            'user_id,date,check_in,check_out,overtime_start,overtime_end',
+            f'{self.user.pk},2026-03-02,08:00,17:00,17:00,2026-05-01T17:00:00+05:30',
+            f'{self.user.pk},2026-03-03,08:00,17:00,,',
+        ), 'csv')
+
+        self.assertEqual((report['imported'], report['failed']), (1, 1))
+        self.assertEqual(report['errors'][0]['row'], 2)
+        self.assertIn('overtime_end', report['errors'][0]['errors'])
+        self.assertFalse(Attendance.objects.filter(user=self.user, date=date(2026, 3, 2)).exists())
+
+    def test_invalid_rows_are_reported_by_line(self):
+        report = import_attendance(csv_file(
+            'username,date,check_in,status',
+            'nobody,2026-03-02,08:00,',
+            'officer,2026-13-45,08:00,',
+            'officer,2026-03-04,8 o\'clock,',
+            'officer,2026-03-05,,holiday',
+            'officer,2026-03-06,,leave',
+        ), 'csv')
+
+        self.assertEqual((report['imported'], report['failed']), (1, 4))
+        errors = {error['row']: error['errors'] for error in report['errors']}
+        self.assertEqual(set(errors), {2, 3, 4, 5})
+        self.assertIn('employee', errors[2])
+        self.assertIn('date', errors[3])
+        self.assertIn('check_in', errors[4])
+        self.assertIn('status', errors[5])
+
+    def test_existing_record_is_updated(self):
+        Attendance.objects.create(user=self.user, date=date(2026, 3, 2), status='absent')
+        import_attendance(csv_file(
+            'username,date,check_in,check_out',
+            'officer,2026-03-02,08:00,17:00',
+        ), 'csv')
+        self.assertEqual(Attendance.objects.get(user=self.user, date=date(2026, 3, 2)).status, 'present')
+
+    def test_dry_run_writes_nothing(self):
+        report = import_attendance(csv_file(
+            'username,date,check_in,check_out',
+            'officer,2026-03-02,08:00,17:00',
+        ), 'csv', dry_run=True)
+        self.assertEqual(report['imported'], 1)
+        self.assertFalse(Attendance.objects.exists())
+
+    def test_unreadable_tail_keeps_the_rows_read_before_it(self):
+        lines = ['username,date,check_in,check_out'] + [
+            f'officer,2026-{month:02d}-{day:02d},08:00,17:00' for month in (1, 2, 3) for day in range(1, 29)
+        ] * 6  # Past the first decoded block
+        data = ('\n'.join(lines) + '\n').encode() + b'officer,\xff\xfe,08:00\n'
+        report = import_attendance(io.BytesIO(data), 'csv')
+
+        self.assertIsNotNone(report['read_error'])
+        self.assertGreater(report['rows'], 0)
+        self.assertEqual(Attendance.objects.filter(user=self.user).count(), 84)
+
+
+class YearMapTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('officer', password='pass')
+        cls.other = User.objects.create_user('clerk', password='pass')
+
+    def setUp(self):
+        working_calendar.invalidate()
+
+    def record(self, user, day, status, check_in=None, check_out=None):
+        attendance = Attendance.objects.create(
+            user=user, date=day, status=status,
+            check_in=check_in and local(day, check_in), check_out=check_out and local(day, check_out),
+        )
+        # The save receivers refresh on commit, which TestCase never reaches
+        refresh_rollups_for([(user.pk, day)])
+        return attendance
+
+    def test_status_packing_round_trips(self):
+        codes = np.random.default_rng(50).integers(0, 4, DAYS, dtype=np.uint8)
+        packed = pack_status(codes)
+        self.assertEqual(len(packed), STATUS_BYTES)
+        self.assertTrue((unpack_status(packed) == codes).all())
+        # Four days to a byte, first day in the high bits
+        self.assertEqual(pack_status(np.array([PRESENT, HALF_DAY, ABSENT, NO_RECORD], dtype=np.uint8))[0], 0b01101100)
+
+    def test_packed_presence_matches_unpacked_codes(self):
+        codes = np.random.default_rng(50).integers(0, 4, (6, DAYS), dtype=np.uint8)
+        packed = np.stack([np.frombuffer(pack_status(row), dtype=np.uint8) for row in codes])
+        attended, recorded = _attended_and_recorded(packed)
+        self.assertTrue((attended == np.isin(codes, (PRESENT, HALF_DAY))).all())
+        self.assertTrue((recorded == (codes != NO_RECORD)).all())
+
+    def test_heatmap_follows_attendance_changes(self):
+        monday = date(2026, 3, 2)
+        self.record(self.user, monday, '', 8, 17)
+        self.record(self.user, monday + timedelta(days=1), '', 8, 13)
+        absent = self.record(self.user, monday + timedelta(days=2), 'absent')
+        self.record(self.user, monday + timedelta(days=3), 'leave')
+
+        heatmap = year_heatmap(self.user.pk, 2026)
+        index = day_index(monday)
+        self.assertEqual(heatmap['status'][index:index + 5], [PRESENT, HALF_DAY, ABSENT, LEAVE, NO_RECORD])
+        self.assertEqual(heatmap['working_hours'][index:index + 2], [9.0, 5.0])
+        self.assertEqual(heatmap['totals']['present'], 1)
+
+        absent.check_in, absent.check_out, absent.status = local(absent.date, 8), local(absent.date, 17), ''
+        absent.save()
+        refresh_rollups_for([(self.user.pk, absent.date)])
+        self.assertEqual(year_heatmap(self.user.pk, 2026)['status'][index + 2], PRESENT)
+
+        incremental = AttendanceYearMap.objects.get(user=self.user, year=2026)
+        rebuild_year_maps()
+        rebuilt = AttendanceYearMap.objects.get(user=self.user, year=2026)
+        for field in ('status', 'leave', 'working_hours', 'overtime_hours'):
+            self.assertEqual(bytes(getattr(incremental, field)), bytes(getattr(rebuilt, field)), field)
+
+    def test_streaks_skip_leave_and_sundays(self):
+        monday = date(2026, 3, 2)
+        for offset, (status, check_out) in enumerate([
+            ('', 17), ('absent', None), ('', 17), ('leave', None), ('', 13), ('', 17),
+        ]):
+            self.record(self.user, monday + timedelta(days=offset), status, 8 if check_out else None, check_out)
+
+        streaks = attendance_streaks(self.user.pk, today=date(2026, 3, 7))
+        self.assertEqual(streaks['current_streak'], 3)
+        self.assertEqual(streaks['current_streak_start'], '2026-03-04')
+        self.assertEqual((streaks['longest_streak'], streaks['longest_streak_end']), (3, '2026-03-07'))
+
+    def test_organisation_presence_counts_attended_and_leave(self):
+        monday = date(2026, 3, 2)
+        self.record(self.user, monday, '', 8, 17)
+        self.record(self.other, monday, '', 8, 17)
+        self.record(self.user, monday + timedelta(days=1), '', 8, 13)
+        self.record(self.other, monday + timedelta(days=1), 'leave')
+        self.record(self.user, monday + timedelta(days=2), 'absent')
+
+        days = organisation_presence(monday, monday + timedelta(days=2), [self.user.pk, self.other.pk])['days']
+        self.assertEqual(
+            [(day['attended'], day['on_leave'], day['expected']) for day in days],
+            [(2, 0, 2), (1, 1, 1), (0, 0, 2)],
+        )
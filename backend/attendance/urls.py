@@ -16,6 +16,13 @@ try:
         path('summary/', views.AttendanceSummaryView.as_view(), name='attendance-summary'),
         path('summary/weekly/', views.WeeklyAttendanceSummaryView.as_view(), name='weekly-attendance-summary'),
         path('summary/hr/', views.HRAttendanceSummaryView.as_view(), name='hr-attendance-summary'),
+        path('trends/', views.AttendanceTrendView.as_view(), name='attendance-trends'),
+        path('trends/hr/', views.HRAttendanceTrendView.as_view(), name='hr-attendance-trends'),
+        path('heatmap/', views.AttendanceHeatmapView.as_view(), name='attendance-heatmap'),
+        path('streaks/', views.AttendanceStreakView.as_view(), name='attendance-streaks'),
+        path('presence/hr/', views.HRPresenceView.as_view(), name='hr-attendance-presence'),
+        path('corrections/', views.AttendanceCorrectionView.as_view(), name='attendance-corrections'),
+        path('import/', views.AttendanceImportView.as_view(), name='attendance-import'),
         path('my-attendances/', views.MyAttendancesView.as_view(), name='my-attendances'),
     ]
 except ImportError as e:
@@ -2,12 +2,30 @@ from rest_framework import status, generics
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.parsers import MultiPartParser, FormParser
 from django.utils import timezone
-from django.db.models import Sum, Count, Q
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
 from datetime import datetime, date, timedelta, time
-from django.contrib.auth.models import User
-from .models import Attendance, Holiday
+from auditra_backend.conditional import conditional_get, aggregate_version
+from auditra_backend.pagination import KeysetPagination
+from .models import Attendance, AttendanceYearMap, DailyRoleAttendanceRollup, Holiday, MonthlyAttendanceRollup
+from .checkin import check_in
+from .corrections import MAX_CORRECTIONS, CorrectionRowErrors, apply_corrections, validate_corrections
+from .importer import detect_format, import_attendance
+from .workdays import working_days_between
+from .yearmaps import attendance_streaks, organisation_presence, year_heatmap
+from .summary import (
+    employee_day_status,
+    employee_queryset,
+    parse_date_range,
+    parse_roles,
+    period_bounds,
+    summarize_attendance,
+    summarize_employees,
+)
 from .serializers import (
+    AttendanceCorrectionSerializer,
     AttendanceSerializer,
     AttendanceSummarySerializer,
     HolidaySerializer
@@ -20,7 +38,7 @@ class MarkAttendanceView(APIView):
     
     def post(self, request):
         now = timezone.now()
-        today = now.date()
+        today = timezone.localtime(now).date()
         user = request.user
         
         # Check if it's a working day
@@ -38,34 +56,23 @@ class MarkAttendanceView(APIView):
                 'error': f'Attendance can only be marked between 6 AM and 8 AM. Current time: {local_now.strftime("%I:%M %p")}'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Check if attendance already marked
-        attendance, created = Attendance.objects.get_or_create(
-            user=user,
-            date=today,
-            defaults={
-                'check_in': timezone.now(),
-                'status': 'present'
-            }
-        )
-        
-        if not created:
-            if attendance.check_in:
-                return Response({
-                    'error': 'Attendance already marked for today'
-                }, status=status.HTTP_400_BAD_REQUEST)
-            # If attendance exists but not checked in, and it's before 12 PM, allow marking
-            attendance.check_in = timezone.now()
-            attendance.status = 'present'
-            attendance.save()
-        
+        # Single INSERT ... ON CONFLICT; a retried request finds the existing check-in
+        attendance, checked_in = check_in(user, now)
         serializer = AttendanceSerializer(attendance)
 
+        if not checked_in:
+            return Response({
+                'message': 'Attendance already marked for today',
+                'data': serializer.data,
+                'already_marked': True
+            }, status=status.HTTP_200_OK)
+
         try:
-            from system_logs.utils import log_action, get_client_ip
-            log_action(
+            from system_logs.utils import log_action_deferred, get_client_ip
+            log_action_deferred(
                 action='ATTENDANCE_CHECK_IN',
                 user=user,
-                description=f"Attendance marked (check-in) for {today}",
+                description=f"Attendance marked (check-in) for {attendance.date}",
                 category='attendance',
                 ip_address=get_client_ip(request),
             )
@@ -75,7 +82,7 @@ class MarkAttendanceView(APIView):
         return Response({
             'message': 'Attendance marked successfully',
             'data': serializer.data
-        }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+        }, status=status.HTTP_201_CREATED)
 
 
 class LeaveEarlyView(APIView):
@@ -298,15 +305,8 @@ class TodayAttendanceView(APIView):
         try:
             attendance = Attendance.objects.get(user=user, date=today)
             
-            # Implementation of "Lazy" Auto Check-out
-            # If it's past 5 PM and user hasn't checked out, auto check-out them at 5 PM
+            # Open sessions are checked out at 5 PM by the close_attendance_day job
             local_now = timezone.localtime(now)
-            if not attendance.check_out and local_now.hour >= 17:
-                five_pm = timezone.make_aware(
-                    datetime.combine(today, time(17, 0))
-                )
-                attendance.check_out = five_pm
-                attendance.save()
             
             serializer = AttendanceSerializer(attendance)
             data = serializer.data
@@ -327,24 +327,28 @@ class TodayAttendanceView(APIView):
         except Attendance.DoesNotExist:
             # Check if it's a working day
             is_working_day = Attendance.is_working_day(today)
+            local_time = timezone.localtime(now).time()
             
-            # If it's after 8 AM and no attendance marked, auto-mark as absent
-            if is_working_day:
-                local_now = timezone.localtime(now)
-                if local_now.hour >= 8:
-                    # Auto-mark as absent
-                    attendance = Attendance.objects.create(
-                        user=user,
-                        date=today,
-                        status='absent'
-                    )
-                    serializer = AttendanceSerializer(attendance)
-                    return Response({
-                        'success': True,
-                        'data': serializer.data
-                    }, status=status.HTTP_200_OK)
+            # Missed the check-in window: shown as absent; the close_attendance_day
+            # job records the absence
+            if is_working_day and local_time >= time(8, 0):
+                return Response({
+                    'success': False,
+                    'data': {
+                        'date': today,
+                        'status': 'absent',
+                        'status_display': 'Absent',
+                        'flags': {
+                            'can_check_in': False,
+                            'can_leave_early': False,
+                            'can_checkout': False,
+                            'can_start_overtime': False,
+                        }
+                    },
+                    'is_working_day': True,
+                    'message': 'Attendance not marked for today'
+                }, status=status.HTTP_200_OK)
             
-            local_time = timezone.localtime(now).time()
             return Response({
                 'success': False,
                 'data': {
@@ -360,9 +364,18 @@ class TodayAttendanceView(APIView):
             }, status=status.HTTP_200_OK)
 
 
+@conditional_get
 class AttendanceSummaryView(APIView):
-    """Get attendance summary (daily, weekly, monthly, yearly)"""
+    """Get attendance summary (daily, weekly, monthly, yearly, or custom with start_date/end_date)"""
     permission_classes = [IsAuthenticated]
+    max_custom_days = 366 * 5
+
+    def get_version_signature(self):
+        return [
+            aggregate_version(Attendance.objects.filter(user=self.request.user)),
+            aggregate_version(Holiday.objects.all()),  # Deactivations change updated_at too
+            timezone.now().date().isoformat(),
+        ]
     
     def get(self, request):
         period = request.query_params.get('period', 'daily')  # daily, weekly, monthly, yearly
@@ -398,135 +411,35 @@ class AttendanceSummaryView(APIView):
                     }
                 }
         
-        elif period == 'weekly':
-            # This week's attendance
-            week_start = today - timedelta(days=today.weekday())
-            week_end = week_start + timedelta(days=6)
-            
-            attendances = Attendance.objects.filter(
-                user=user,
-                date__range=[week_start, week_end]
-            )
-            
-            data = self._calculate_summary(attendances, week_start, week_end)
-        
-        elif period == 'monthly':
-            # This month's attendance
-            month_start = today.replace(day=1)
-            if today.month == 12:
-                month_end = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
+        elif period in ('weekly', 'monthly', 'yearly', 'custom'):
+            if period == 'custom':
+                try:
+                    start_date, end_date = parse_date_range(request.query_params, self.max_custom_days)
+                except ValueError as e:
+                    return Response({
+                        'error': str(e)
+                    }, status=status.HTTP_400_BAD_REQUEST)
             else:
-                month_end = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
-            
-            attendances = Attendance.objects.filter(
-                user=user,
-                date__range=[month_start, month_end]
-            )
-            
-            data = self._calculate_summary(attendances, month_start, month_end)
-        
-        elif period == 'yearly':
-            # This year's attendance
-            year_start = today.replace(month=1, day=1)
-            year_end = today.replace(month=12, day=31)
-            
-            attendances = Attendance.objects.filter(
-                user=user,
-                date__range=[year_start, year_end]
-            )
-            
-            data = self._calculate_summary(attendances, year_start, year_end)
+                start_date, end_date = period_bounds(period, today)
+
+            data = summarize_attendance(user, start_date, end_date)
         
         else:
             return Response({
-                'error': 'Invalid period. Use: daily, weekly, monthly, yearly'
+                'error': 'Invalid period. Use: daily, weekly, monthly, yearly, custom'
             }, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({
             'period': period,
             'data': data
         }, status=status.HTTP_200_OK)
-    
-    def _calculate_summary(self, attendances, start_date, end_date):
-        """Calculate summary statistics for a date range"""
-        total_days = (end_date - start_date).days + 1
-        
-        # Count working days (excluding Sundays and holidays)
-        working_days = 0
-        current_date = start_date
-        holidays = set(Holiday.objects.filter(
-            date__range=[start_date, end_date],
-            is_active=True
-        ).values_list('date', flat=True))
-        
-        while current_date <= end_date:
-            if current_date.weekday() != 6 and current_date not in holidays:
-                working_days += 1
-            current_date += timedelta(days=1)
-        
-        present_count = attendances.filter(status='present').count()
-        half_day_count = attendances.filter(status='half_day').count()
-        absent_count = working_days - present_count - half_day_count
-        
-        total_working_hours = attendances.aggregate(
-            total=Sum('working_hours')
-        )['total'] or 0.0
-        
-        total_overtime_hours = attendances.aggregate(
-            total=Sum('overtime_hours')
-        )['total'] or 0.0
-        
-        attendance_percentage = 0.0
-        if working_days > 0:
-            attendance_percentage = ((present_count + half_day_count * 0.5) / working_days) * 100
-        
-        # Get daily breakdown for charts
-        daily_data = []
-        current_date = start_date
-        while current_date <= end_date:
-            if current_date.weekday() != 6 and current_date not in holidays:
-                try:
-                    att = attendances.get(date=current_date)
-                    daily_data.append({
-                        'date': current_date.isoformat(),
-                        'status': att.status,
-                        'check_in': att.check_in.isoformat() if att.check_in else None,
-                        'check_out': att.check_out.isoformat() if att.check_out else None,
-                        'working_hours': float(att.working_hours),
-                        'overtime_hours': float(att.overtime_hours),
-                    })
-                except Attendance.DoesNotExist:
-                    daily_data.append({
-                        'date': current_date.isoformat(),
-                        'status': 'absent',
-                        'check_in': None,
-                        'check_out': None,
-                        'working_hours': 0.0,
-                        'overtime_hours': 0.0,
-                    })
-            current_date += timedelta(days=1)
-        
-        return {
-            'start_date': start_date.isoformat(),
-            'end_date': end_date.isoformat(),
-            'total_days': total_days,
-            'working_days': working_days,
-            'summary': {
-                'present': present_count,
-                'half_day': half_day_count,
-                'absent': absent_count,
-                'total_working_hours': float(total_working_hours),
-                'total_overtime_hours': float(total_overtime_hours),
-                'attendance_percentage': round(float(attendance_percentage), 2),
-            },
-            'daily_data': daily_data
-        }
 
 
 class MyAttendancesView(generics.ListAPIView):
     """Get all attendances for the current user"""
     permission_classes = [IsAuthenticated]
     serializer_class = AttendanceSerializer
+    pagination_class = KeysetPagination
     
     def get_queryset(self):
         return Attendance.objects.filter(user=self.request.user).order_by('-date')
@@ -566,77 +479,15 @@ class WeeklyAttendanceSummaryView(APIView):
         
         # Calculate week end (6 days after week start)
         week_end = week_start + timedelta(days=6)
-        
-        # Get all employees with specific roles (excluding Admin)
-        employee_roles = [
-            'coordinator',
-            'field_officer',
-            'senior_valuer',
-            'accessor',
-            'md_gm',
-            'general_employee'
-        ]
-        
-        employee_users = User.objects.filter(
-            role__role__in=employee_roles
-        ).select_related('role')
-        
-        # Get holidays for the week
-        holidays = set(Holiday.objects.filter(
-            date__range=[week_start, week_end],
-            is_active=True
-        ).values_list('date', flat=True))
-        
-        # Calculate working days in the week
-        working_days = 0
-        current_date = week_start
-        while current_date <= week_end:
-            if current_date.weekday() != 6 and current_date not in holidays:  # Not Sunday and not holiday
-                working_days += 1
-            current_date += timedelta(days=1)
-        
-        # Get attendance data for all employees for this week
-        attendances = Attendance.objects.filter(
-            date__range=[week_start, week_end]
-        ).select_related('user')
-        
-        # Build summary for each employee
-        summary_data = []
-        for user in employee_users:
-            user_attendances = attendances.filter(user=user)
-            
-            # Count present, half_day, and absent
-            present_count = user_attendances.filter(status='present').count()
-            half_day_count = user_attendances.filter(status='half_day').count()
-            absent_count = working_days - present_count - half_day_count
-            
-            # Calculate total overtime hours for the week
-            total_overtime = user_attendances.aggregate(
-                total=Sum('overtime_hours')
-            )['total'] or 0.0
-            
-            # Calculate attendance percentage
-            attendance_percentage = 0.0
-            if working_days > 0:
-                attendance_percentage = ((present_count + half_day_count * 0.5) / working_days) * 100
-            
-            # Get employee name
-            employee_name = user.get_full_name() or user.username
-            
-            # Use User ID as Employee number
-            employee_number = str(user.id)
-            
-            summary_data.append({
-                'employee_name': employee_name,
-                'employee_number': employee_number,
-                'absent_days': absent_count,
-                'half_days': half_day_count,
-                'attendance_percentage': round(float(attendance_percentage), 2),
-                'overtime_hours': round(float(total_overtime), 2),
-            })
-        
-        # Sort by employee name
-        summary_data.sort(key=lambda x: x['employee_name'])
+
+        try:
+            roles = parse_roles(request.query_params)
+        except ValueError as e:
+            return Response({
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+        users = employee_queryset(roles, request.query_params.get('search'))
+        summary_data, working_days = summarize_employees(week_start, week_end, users)
         
         return Response({
             'success': True,
@@ -648,8 +499,9 @@ class WeeklyAttendanceSummaryView(APIView):
 
 
 class HRAttendanceSummaryView(APIView):
-    """Get attendance summary for all employees - daily, weekly, or monthly (HR Head only)"""
+    """Get attendance summary for all employees - daily, weekly, monthly or custom range (HR Head only)"""
     permission_classes = [IsAuthenticated]
+    max_custom_days = 366
 
     def get(self, request):
         from authentication.models import UserRole
@@ -668,111 +520,375 @@ class HRAttendanceSummaryView(APIView):
         period = request.query_params.get('period', 'daily')
         today = timezone.now().date()
 
+        if period == 'custom':
+            try:
+                start_date, end_date = parse_date_range(request.query_params, self.max_custom_days)
+            except ValueError as e:
+                return Response({
+                    'error': str(e)
+                }, status=status.HTTP_400_BAD_REQUEST)
+        elif period in ('daily', 'weekly', 'monthly'):
+            start_date, end_date = period_bounds(period, today)
+        else:
+            return Response({
+                'error': 'Invalid period. Use: daily, weekly, monthly, custom'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            roles = parse_roles(request.query_params)
+        except ValueError as e:
+            return Response({
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+        users = employee_queryset(roles, request.query_params.get('search'))
+
         if period == 'daily':
-            start_date = today
-            end_date = today
-        elif period == 'weekly':
-            start_date = today - timedelta(days=today.weekday())
-            end_date = start_date + timedelta(days=6)
-        elif period == 'monthly':
-            start_date = today.replace(day=1)
-            if today.month == 12:
-                end_date = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
-            else:
-                end_date = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
+            summary_data = employee_day_status(today, users)
+            working_days = working_days_between(today, today)
         else:
+            summary_data, working_days = summarize_employees(start_date, end_date, users)
+
+        return Response({
+            'success': True,
+            'data': summary_data,
+            'period': period,
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'working_days': working_days,
+        }, status=status.HTTP_200_OK)
+
+
+class AttendanceTrendView(APIView):
+    """Monthly attendance totals for the current user across years, read from the rollups"""
+    permission_classes = [IsAuthenticated]
+    max_years = 10
+
+    def get(self, request):
+        today = timezone.now().date()
+        try:
+            end_year = int(request.query_params.get('end_year', today.year))
+            start_year = int(request.query_params.get('start_year', end_year))
+        except ValueError:
             return Response({
-                'error': 'Invalid period. Use: daily, weekly, monthly'
+                'error': 'start_year and end_year must be years'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if start_year > end_year or end_year - start_year >= self.max_years:
+            return Response({
+                'error': f'Use a range of at most {self.max_years} years with start_year <= end_year'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        employee_roles = [
-            'coordinator', 'field_officer', 'senior_valuer',
-            'accessor', 'md_gm', 'general_employee'
-        ]
-        employee_users = User.objects.filter(
-            role__role__in=employee_roles
-        ).select_related('role')
+        rows = MonthlyAttendanceRollup.objects.filter(
+            user=request.user,
+            year__range=[start_year, end_year]
+        ).order_by('year', 'month').values(
+            'year', 'month', 'present_days', 'half_days', 'absent_days',
+            'leave_days', 'working_hours', 'overtime_hours'
+        )
+
+        return Response({
+            'success': True,
+            'start_year': start_year,
+            'end_year': end_year,
+            'data': [
+                {**row, 'working_hours': float(row['working_hours']), 'overtime_hours': float(row['overtime_hours'])}
+                for row in rows
+            ],
+        }, status=status.HTTP_200_OK)
+
+
+def hr_access_error(request):
+    """403 response unless the user is the HR Head (or staff without a role)"""
+    from authentication.models import UserRole
+    try:
+        user_role = UserRole.objects.get(user=request.user)
+        if user_role.role != 'hr_head':
+            return Response({
+                'error': 'Only HR Head can access this endpoint'
+            }, status=status.HTTP_403_FORBIDDEN)
+    except UserRole.DoesNotExist:
+        if not request.user.is_staff:
+            return Response({
+                'error': 'User role not found and user is not a staff member'
+            }, status=status.HTTP_403_FORBIDDEN)
+    return None
+
+
+class HRAttendanceTrendView(APIView):
+    """Monthly attendance totals per role over a date range, read from the rollups (HR Head only)"""
+    permission_classes = [IsAuthenticated]
+    max_custom_days = 366 * 5
+
+    def get(self, request):
+        error = hr_access_error(request)
+        if error:
+            return error
+
+        if 'start_date' in request.query_params or 'end_date' in request.query_params:
+            try:
+                start_date, end_date = parse_date_range(request.query_params, self.max_custom_days)
+            except ValueError as e:
+                return Response({
+                    'error': str(e)
+                }, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            start_date, end_date = period_bounds('yearly', timezone.now().date())
 
-        holidays = set(Holiday.objects.filter(
+        try:
+            roles = parse_roles(request.query_params)
+        except ValueError as e:
+            return Response({
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = DailyRoleAttendanceRollup.objects.filter(
             date__range=[start_date, end_date],
-            is_active=True
-        ).values_list('date', flat=True))
+            role__in=roles,
+        ).annotate(
+            month=TruncMonth('date')
+        ).order_by('month', 'role').values('month', 'role').annotate(
+            present=Sum('present'),
+            half_day=Sum('half_day'),
+            absent=Sum('absent'),
+            leave=Sum('leave'),
+            working_hours=Sum('working_hours'),
+            overtime_hours=Sum('overtime_hours'),
+        )
 
-        working_days = 0
-        current_date = start_date
-        while current_date <= end_date:
-            if current_date.weekday() != 6 and current_date not in holidays:
-                working_days += 1
-            current_date += timedelta(days=1)
+        return Response({
+            'success': True,
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'data': [
+                {
+                    **row,
+                    'month': row['month'].strftime('%Y-%m'),
+                    'working_hours': float(row['working_hours'] or 0),
+                    'overtime_hours': float(row['overtime_hours'] or 0),
+                }
+                for row in rows
+            ],
+        }, status=status.HTTP_200_OK)
 
-        attendances = Attendance.objects.filter(
-            date__range=[start_date, end_date]
-        ).select_related('user')
 
-        summary_data = []
+class AttendanceImportView(APIView):
+    """Import attendance from a CSV or XLSX export (HR Head only); ?dry_run=true validates without saving"""
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
 
-        if period == 'daily':
-            for user in employee_users:
-                user_att = attendances.filter(user=user, date=today).first()
-                employee_name = user.get_full_name() or user.username
-                employee_number = str(user.id)
-
-                if user_att:
-                    summary_data.append({
-                        'employee_name': employee_name,
-                        'employee_number': employee_number,
-                        'status': user_att.status,
-                        'check_in': user_att.check_in.isoformat() if user_att.check_in else None,
-                        'check_out': user_att.check_out.isoformat() if user_att.check_out else None,
-                        'working_hours': round(float(user_att.working_hours), 2),
-                        'overtime_hours': round(float(user_att.overtime_hours), 2),
-                    })
-                else:
-                    is_working = today.weekday() != 6 and today not in holidays
-                    summary_data.append({
-                        'employee_name': employee_name,
-                        'employee_number': employee_number,
-                        'status': 'absent' if is_working else 'N/A',
-                        'check_in': None,
-                        'check_out': None,
-                        'working_hours': 0.0,
-                        'overtime_hours': 0.0,
-                    })
+    def post(self, request):
+        error = hr_access_error(request)
+        if error:
+            return error
+
+        upload = request.FILES.get('file')
+        if not upload:
+            return Response({
+                'error': 'Upload the attendance export as "file"'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            file_format = detect_format(upload.name)
+        except ValueError as e:
+            return Response({
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        dry_run = str(request.query_params.get('dry_run', request.data.get('dry_run', ''))).lower() in ('1', 'true', 'yes')
+        report = import_attendance(upload, file_format, dry_run=dry_run)
+        if report['read_error'] and not report['rows']:
+            return Response({
+                'error': report['read_error']
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if not dry_run and report['imported']:
+            try:
+                from system_logs.utils import log_action, get_client_ip
+                log_action(
+                    action='ATTENDANCE_IMPORTED',
+                    user=request.user,
+                    description=f"Attendance imported from {upload.name}: {report['imported']} row(s), {report['failed']} failed",
+                    category='attendance',
+                    ip_address=get_client_ip(request),
+                    metadata={'file': upload.name, 'rows': report['rows'], 'imported': report['imported'], 'failed': report['failed']},
+                )
+            except Exception:
+                pass
+
+        return Response({
+            'success': report['failed'] == 0 and not report['read_error'],
+            'data': report
+        }, status=status.HTTP_200_OK)
+
+
+class AttendanceCorrectionView(APIView):
+    """Correct many attendance records at once (HR Head only)"""
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        error = hr_access_error(request)
+        if error:
+            return error
+
+        rows = request.data.get('corrections')
+        if not isinstance(rows, list) or not rows:
+            return Response({
+                'error': 'Provide a non-empty "corrections" list'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if len(rows) > MAX_CORRECTIONS:
+            return Response({
+                'error': f'At most {MAX_CORRECTIONS} corrections can be applied per request'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = AttendanceCorrectionSerializer(data=rows, many=True)
+        if not serializer.is_valid():
+            return Response({
+                'success': False,
+                'error': 'Validation failed',
+                'errors': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+        row_errors = validate_corrections(serializer.validated_data)
+        if row_errors:
+            return Response({
+                'success': False,
+                'error': 'Validation failed',
+                'errors': [row_errors.get(index, {}) for index in range(len(rows))]
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            results = apply_corrections(serializer.validated_data)
+        except CorrectionRowErrors as e:
+            row_errors = e.errors
+            return Response({
+                'success': False,
+                'error': 'Validation failed',
+                'errors': [row_errors.get(index, {}) for index in range(len(rows))]
+            }, status=status.HTTP_400_BAD_REQUEST)
+        reason = str(request.data.get('reason') or '').strip()
+
+        try:
+            from system_logs.utils import log_action, get_client_ip
+            description = f"Attendance corrected for {len(results)} record(s)"
+            if reason:
+                description += f": {reason}"
+            log_action(
+                action='ATTENDANCE_CORRECTED',
+                user=request.user,
+                description=description,
+                category='attendance',
+                ip_address=get_client_ip(request),
+                metadata={
+                    'reason': reason,
+                    'created': sum(1 for result in results if result['created']),
+                    'updated': sum(1 for result in results if not result['created']),
+                    'rows': results,
+                },
+            )
+        except Exception:
+            pass
+
+        return Response({
+            'success': True,
+            'message': f'{len(results)} attendance record(s) corrected',
+            'data': results
+        }, status=status.HTTP_200_OK)
+
+
+def _target_user_id(request):
+    """?user_id for the HR Head, otherwise the current user; returns (user_id, error response)"""
+    requested = request.query_params.get('user_id')
+    if not requested or requested == str(request.user.pk):
+        return request.user.pk, None
+    error = hr_access_error(request)
+    if error:
+        return None, error
+    if not requested.isdigit():
+        return None, Response({
+            'error': 'user_id must be a number'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    return int(requested), None
+
+
+@conditional_get
+class AttendanceHeatmapView(APIView):
+    """A year of daily attendance statuses and hours for a heatmap (?year=, ?user_id= for HR)"""
+    permission_classes = [IsAuthenticated]
+
+    def get_version_signature(self):
+        user_id, error = _target_user_id(self.request)
+        if error:
+            return None  # get() returns the error
+        return [
+            aggregate_version(AttendanceYearMap.objects.filter(user_id=user_id)),
+            aggregate_version(Holiday.objects.all()),  # Deactivations change updated_at too
+        ]
+
+    def get(self, request):
+        user_id, error = _target_user_id(request)
+        if error:
+            return error
+        try:
+            year = int(request.query_params.get('year', timezone.now().year))
+        except ValueError:
+            return Response({
+                'error': 'year must be a year'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'success': True,
+            'user_id': user_id,
+            'data': year_heatmap(user_id, year)
+        }, status=status.HTTP_200_OK)
+
+
+class AttendanceStreakView(APIView):
+    """Current and longest attendance streaks (?user_id= for HR)"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user_id, error = _target_user_id(request)
+        if error:
+            return error
+
+        return Response({
+            'success': True,
+            'user_id': user_id,
+            'data': attendance_streaks(user_id, timezone.now().date())
+        }, status=status.HTTP_200_OK)
+
+
+class HRPresenceView(APIView):
+    """Organisation-wide presence percentage per working day (HR Head only)"""
+    permission_classes = [IsAuthenticated]
+    max_days = 366
+
+    def get(self, request):
+        error = hr_access_error(request)
+        if error:
+            return error
+
+        today = timezone.now().date()
+        if 'start_date' in request.query_params or 'end_date' in request.query_params:
+            try:
+                start_date, end_date = parse_date_range(request.query_params, self.max_days)
+            except ValueError as e:
+                return Response({
+                    'error': str(e)
+                }, status=status.HTTP_400_BAD_REQUEST)
         else:
-            for user in employee_users:
-                user_attendances = attendances.filter(user=user)
-                present_count = user_attendances.filter(status='present').count()
-                half_day_count = user_attendances.filter(status='half_day').count()
-                absent_count = max(0, working_days - present_count - half_day_count)
-
-                total_overtime = user_attendances.aggregate(
-                    total=Sum('overtime_hours')
-                )['total'] or 0.0
-
-                attendance_percentage = 0.0
-                if working_days > 0:
-                    attendance_percentage = ((present_count + half_day_count * 0.5) / working_days) * 100
-
-                employee_name = user.get_full_name() or user.username
-                employee_number = str(user.id)
-
-                summary_data.append({
-                    'employee_name': employee_name,
-                    'employee_number': employee_number,
-                    'present_days': present_count,
-                    'absent_days': absent_count,
-                    'half_days': half_day_count,
-                    'overtime_hours': round(float(total_overtime), 2),
-                    'attendance_percentage': round(float(attendance_percentage), 2),
-                })
-
-        summary_data.sort(key=lambda x: x['employee_name'])
+            start_date, end_date = today.replace(day=1), today
+
+        try:
+            roles = parse_roles(request.query_params)
+        except ValueError as e:
+            return Response({
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+        user_ids = employee_queryset(roles).filter(is_active=True).values_list('pk', flat=True)
+        presence = organisation_presence(start_date, end_date, user_ids)
 
         return Response({
             'success': True,
-            'data': summary_data,
-            'period': period,
             'start_date': start_date.isoformat(),
             'end_date': end_date.isoformat(),
-            'working_days': working_days,
-        }, status=status.HTTP_200_OK)
\ No newline at end of file
+            'roles': roles,
+            'data': presence
+        }, status=status.HTTP_200_OK)
@@ -0,0 +1,105 @@
+"""
+In-process working-day calendar.
+
+Working days are every day except Sundays and active holidays. Active
+``Holiday`` dates are loaded once per process and, per year, turned into a
+cumulative count of working days, so "working days between A and B" is two
+lookups per year spanned instead of a walk over the range.
+
+Holiday saves and deletes invalidate the calendar in the process that made
+them (see the receivers in attendance/models.py); other processes reload it
+after ``max_age`` seconds.
+"""
+import threading
+import time
+from datetime import date, timedelta
+
+from .models import Holiday
+
+SUNDAY = 6
+
+
+class _CalendarState:
+    def __init__(self, holidays):
+        self.holidays = holidays
+        self.loaded_at = time.monotonic()
+        self.years = {}
+
+    def is_working_day(self, day):
+        return day.weekday() != SUNDAY and day not in self.holidays
+
+    def cumulative(self, year):
+        """cumulative[i] = working days among the first i days of the year"""
+        counts = self.years.get(year)
+        if counts is None:
+            day = date(year, 1, 1)
+            counts = [0]
+            while day.year == year:
+                counts.append(counts[-1] + self.is_working_day(day))
+                day += timedelta(days=1)
+            self.years[year] = counts
+        return counts
+
+
+class WorkingDayCalendar:
+    """Answers working-day questions from a cached holiday set"""
+    max_age = 300
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = None
+
+    def _fresh(self, state):
+        return state is not None and time.monotonic() - state.loaded_at < self.max_age
+
+    def _get_state(self):
+        state = self._state
+        if not self._fresh(state):
+            with self._lock:
+                state = self._state
+                if not self._fresh(state):
+                    state = _CalendarState(frozenset(
+                        Holiday.objects.filter(is_active=True).values_list('date', flat=True)
+                    ))
+                    self._state = state
+        return state
+
+    def invalidate(self):
+        self._state = None
+
+    def is_working_day(self, day):
+        return self._get_state().is_working_day(day)
+
+    def holidays_between(self, start_date, end_date):
+        """Active holiday dates within the range"""
+        return {day for day in self._get_state().holidays if start_date <= day <= end_date}
+
+    def working_days_between(self, start_date, end_date):
+        """Number of working days from start_date to end_date, both inclusive"""
+        if end_date < start_date:
+            return 0
+        state = self._get_state()
+        total = 0
+        for year in range(start_date.year, end_date.year + 1):
+            counts = state.cumulative(year)
+            first = (start_date - date(year, 1, 1)).days if year == start_date.year else 0
+            last = (end_date - date(year, 1, 1)).days + 1 if year == end_date.year else len(counts) - 1
+            total += counts[last] - counts[first]
+        return total
+
+    def iter_working_days(self, start_date, end_date):
+        """Working dates from start_date to end_date, both inclusive"""
+        state = self._get_state()
+        day = start_date
+        while day <= end_date:
+            if state.is_working_day(day):
+                yield day
+            day += timedelta(days=1)
+
+
+working_calendar = WorkingDayCalendar()
+
+is_working_day = working_calendar.is_working_day
+holidays_between = working_calendar.holidays_between
+working_days_between = working_calendar.working_days_between
+iter_working_days = working_calendar.iter_working_days
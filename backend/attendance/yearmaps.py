@@ -0,0 +1,377 @@
+"""
+Per user, per year attendance as packed arrays (``AttendanceYearMap``).
+
+Every day of the year has a slot (index = day of year - 1, 366 slots):
+
+* ``status`` - 2 bits per day, four days to a byte, first day in the high
+  bits: 0 no record, 1 present, 2 half day, 3 absent
+* ``leave`` - 1 bit per day (``numpy.packbits`` order), set for leave records
+* ``working_hours`` / ``overtime_hours`` - little-endian uint16 hundredths
+  of an hour per day
+
+A year of one employee's attendance fits in under 1.7 KB. Maps are rewritten
+a month at a time from ``refresh_rollups``, so every path that keeps the
+rollups current keeps the maps current too. Heatmaps, streaks and
+organisation presence are computed from them with NumPy; "attended" (present
+or half day) is ``high bit XOR low bit`` on the packed bytes, so presence
+across many employees never unpacks individual statuses.
+"""
+import calendar
+from datetime import date, timedelta
+from functools import reduce
+from operator import or_
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Attendance, AttendanceYearMap
+from .workdays import iter_working_days
+
+DAYS = 366
+STATUS_BYTES = (DAYS + 3) // 4
+LEAVE_BYTES = (DAYS + 7) // 8
+HOURS_SCALE = 100
+
+NO_RECORD, PRESENT, HALF_DAY, ABSENT = 0, 1, 2, 3
+LEAVE = 4  # Heatmap code only; leave is stored in its own bitmap
+STATUS_CODES = {'present': PRESENT, 'half_day': HALF_DAY, 'absent': ABSENT}
+HEATMAP_LEGEND = {
+    NO_RECORD: 'no_record',
+    PRESENT: 'present',
+    HALF_DAY: 'half_day',
+    ABSENT: 'absent',
+    LEAVE: 'leave',
+}
+
+ATTENDANCE_FIELDS = ('user_id', 'date', 'status', 'working_hours', 'overtime_hours')
+
+
+def day_index(day):
+    return day.timetuple().tm_yday - 1
+
+
+def days_in_year(year):
+    return 366 if calendar.isleap(year) else 365
+
+
+# Encoding
+
+def pack_status(codes):
+    """uint8 codes (0-3) for each day -> STATUS_BYTES bytes"""
+    padded = np.zeros(STATUS_BYTES * 4, dtype=np.uint8)
+    padded[:len(codes)] = codes
+    quads = padded.reshape(-1, 4)
+    return ((quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]).astype(np.uint8).tobytes()
+
+
+def unpack_status(packed):
+    """STATUS_BYTES bytes -> uint8 codes for each day"""
+    packed = _status_bytes(packed)
+    quads = np.stack([packed >> 6, (packed >> 4) & 3, (packed >> 2) & 3, packed & 3], axis=1)
+    return quads.reshape(-1)[:DAYS].copy()
+
+
+def _status_bytes(packed):
+    packed = np.frombuffer(bytes(packed or b''), dtype=np.uint8)
+    return packed if len(packed) == STATUS_BYTES else np.zeros(STATUS_BYTES, dtype=np.uint8)
+
+
+def _leave_bits(packed):
+    packed = np.frombuffer(bytes(packed or b''), dtype=np.uint8)
+    return packed if len(packed) == LEAVE_BYTES else np.zeros(LEAVE_BYTES, dtype=np.uint8)
+
+
+def _hours(packed):
+    hours = np.frombuffer(bytes(packed or b''), dtype='<u2')
+    return hours.copy() if len(hours) == DAYS else np.zeros(DAYS, dtype='<u2')
+
+
+def decode(year_map):
+    """(status codes, leave flags, working hours, overtime hours) arrays for a map"""
+    if year_map is None:
+        return (np.zeros(DAYS, dtype=np.uint8), np.zeros(DAYS, dtype=bool),
+                np.zeros(DAYS), np.zeros(DAYS))
+    return (
+        unpack_status(year_map.status),
+        np.unpackbits(_leave_bits(year_map.leave), count=DAYS).astype(bool),
+        _hours(year_map.working_hours) / HOURS_SCALE,
+        _hours(year_map.overtime_hours) / HOURS_SCALE,
+    )
+
+
+def _attended_and_recorded(packed):
+    """
+    Per-day attended (present or half day) and recorded flags from packed
+    status bytes of shape (..., STATUS_BYTES), using bitwise operations on
+    the packed form: codes 01 and 10 have exactly one bit set.
+    """
+    high = (packed >> 1) & 0x55
+    low = packed & 0x55
+    attended = np.unpackbits(high ^ low, axis=-1)[..., 1::2][..., :DAYS]
+    recorded = np.unpackbits(high | low, axis=-1)[..., 1::2][..., :DAYS]
+    return attended.astype(bool), recorded.astype(bool)
+
+
+# Maintenance
+
+def _fill(arrays, rows):
+    status, leave, working, overtime = arrays
+    for _, day, row_status, working_hours, overtime_hours in rows:
+        index = day_index(day)
+        status[index] = STATUS_CODES.get(row_status, NO_RECORD)
+        leave[index] = row_status == 'leave'
+        working[index] = round(float(working_hours or 0) * HOURS_SCALE)
+        overtime[index] = round(float(overtime_hours or 0) * HOURS_SCALE)
+
+
+def _encode(year_map, arrays):
+    status, leave, working, overtime = arrays
+    year_map.status = pack_status(status)
+    year_map.leave = np.packbits(leave).tobytes()
+    year_map.working_hours = np.clip(working, 0, 65535).astype('<u2').tobytes()
+    year_map.overtime_hours = np.clip(overtime, 0, 65535).astype('<u2').tobytes()
+
+
+def _stored_arrays(year_map):
+    return (
+        unpack_status(year_map.status),
+        np.unpackbits(_leave_bits(year_map.leave), count=DAYS).astype(bool),
+        _hours(year_map.working_hours).astype(np.int64),
+        _hours(year_map.overtime_hours).astype(np.int64),
+    )
+
+
+def _is_empty(arrays):
+    status, leave, _, _ = arrays
+    return not status.any() and not leave.any()
+
+
+@transaction.atomic
+def refresh_year_maps(user_months, attendances):
+    """
+    Rewrite the month slices of the maps for (user_id, year, month) keys from
+    attendances, a queryset covering exactly those user-months.
+    """
+    user_months = set(user_months)
+    if not user_months:
+        return
+    keys = {(user_id, year) for user_id, year, _ in user_months}
+    AttendanceYearMap.objects.bulk_create(
+        [AttendanceYearMap(user_id=user_id, year=year) for user_id, year in keys],
+        ignore_conflicts=True,
+    )
+    by_year = {}
+    for user_id, year in keys:
+        by_year.setdefault(year, set()).add(user_id)
+    maps = {
+        (year_map.user_id, year_map.year): year_map
+        for year_map in AttendanceYearMap.objects.select_for_update().filter(reduce(or_, (
+            Q(year=year, user_id__in=user_ids) for year, user_ids in by_year.items()
+        )))
+    }
+
+    arrays = {key: _stored_arrays(year_map) for key, year_map in maps.items()}
+    for user_id, year, month in user_months:
+        start = day_index(date(year, month, 1))
+        end = start + calendar.monthrange(year, month)[1]
+        for array in arrays[(user_id, year)]:
+            array[start:end] = 0
+    rows = {}
+    for row in attendances.order_by().values_list(*ATTENDANCE_FIELDS):
+        rows.setdefault((row[0], row[1].year), []).append(row)
+    for key, key_rows in rows.items():
+        if key in arrays:
+            _fill(arrays[key], key_rows)
+
+    empty = [year_map.pk for key, year_map in maps.items() if _is_empty(arrays[key])]
+    changed = [year_map for key, year_map in maps.items() if year_map.pk not in empty]
+    now = timezone.now()
+    for year_map in changed:
+        _encode(year_map, arrays[(year_map.user_id, year_map.year)])
+        year_map.updated_at = now  # bulk_update skips auto_now
+    AttendanceYearMap.objects.bulk_update(
+        changed, ['status', 'leave', 'working_hours', 'overtime_hours', 'updated_at'], batch_size=500,
+    )
+    if empty:
+        AttendanceYearMap.objects.filter(pk__in=empty).delete()
+
+
+def _new_arrays():
+    return (np.zeros(DAYS, dtype=np.uint8), np.zeros(DAYS, dtype=bool),
+            np.zeros(DAYS, dtype=np.int64), np.zeros(DAYS, dtype=np.int64))
+
+
+@transaction.atomic
+def rebuild_year_maps(start_year=None, end_year=None):
+    """Recompute every map, optionally limited to a range of years; returns the count"""
+    attendances = Attendance.objects.all()
+    year_maps = AttendanceYearMap.objects.all()
+    if start_year:
+        attendances = attendances.filter(date__gte=date(start_year, 1, 1))
+        year_maps = year_maps.filter(year__gte=start_year)
+    if end_year:
+        attendances = attendances.filter(date__lte=date(end_year, 12, 31))
+        year_maps = year_maps.filter(year__lte=end_year)
+    year_maps.delete()
+
+    rebuilt = build_year_maps(attendances, AttendanceYearMap)
+    AttendanceYearMap.objects.bulk_create(rebuilt, batch_size=1000)
+    return len(rebuilt)
+
+
+def build_year_maps(attendances, year_map_model):
+    """
+    Unsaved year maps for every user and year in an attendance queryset;
+    takes the model class so data migrations can pass their historical one
+    """
+    arrays = {}
+    for row in attendances.order_by().values_list(*ATTENDANCE_FIELDS).iterator(chunk_size=5000):
+        key = (row[0], row[1].year)
+        if key not in arrays:
+            arrays[key] = _new_arrays()
+        _fill(arrays[key], [row])
+
+    year_maps = []
+    for (user_id, year), key_arrays in arrays.items():
+        if _is_empty(key_arrays):
+            continue
+        year_map = year_map_model(user_id=user_id, year=year)
+        _encode(year_map, key_arrays)
+        year_maps.append(year_map)
+    return year_maps
+
+
+# Analytics
+
+def working_day_mask(year):
+    """Boolean array flagging the year's working days"""
+    mask = np.zeros(DAYS, dtype=bool)
+    indexes = [day_index(day) for day in iter_working_days(date(year, 1, 1), date(year, 12, 31))]
+    mask[indexes] = True
+    return mask
+
+
+def year_heatmap(user_id, year):
+    """Per-day status codes (see HEATMAP_LEGEND) and hours for one user's year"""
+    status, leave, working, overtime = decode(
+        AttendanceYearMap.objects.filter(user_id=user_id, year=year).first()
+    )
+    days = days_in_year(year)
+    codes = np.where(leave, LEAVE, status)[:days]
+    counts = np.bincount(codes, minlength=len(HEATMAP_LEGEND))
+    return {
+        'year': year,
+        'start_date': date(year, 1, 1).isoformat(),
+        'legend': HEATMAP_LEGEND,
+        'status': codes.tolist(),
+        'working_day': working_day_mask(year)[:days].astype(int).tolist(),
+        'working_hours': np.round(working[:days], 2).tolist(),
+        'overtime_hours': np.round(overtime[:days], 2).tolist(),
+        'totals': {
+            **{HEATMAP_LEGEND[code]: int(counts[code]) for code in HEATMAP_LEGEND if code != NO_RECORD},
+            'working_hours': round(float(working.sum()), 2),
+            'overtime_hours': round(float(overtime.sum()), 2),
+        },
+    }
+
+
+def _runs(flags):
+    """(lengths, ends) of the runs of True in a boolean array"""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], flags.astype(np.int8), [0]))))
+    starts, ends = edges[::2], edges[1::2]
+    return ends - starts, ends
+
+
+def _working_sequence(user_id, year, today):
+    """
+    Attended flags for the working days of `year` up to today (leave days
+    skipped, today only once recorded) and the matching dates
+    """
+    year_map = AttendanceYearMap.objects.filter(user_id=user_id, year=year).first()
+    attended, recorded = _attended_and_recorded(_status_bytes(year_map.status if year_map else None))
+    _, leave, _, _ = decode(year_map)
+
+    last = min(date(year, 12, 31), today)
+    if last == today and not recorded[day_index(today)]:
+        last -= timedelta(days=1)
+    if last < date(year, 1, 1):
+        return np.zeros(0, dtype=bool), []
+    considered = working_day_mask(year) & ~leave
+    considered[day_index(last) + 1:] = False
+    indexes = np.flatnonzero(considered)
+    return attended[indexes], [date(year, 1, 1) + timedelta(days=int(index)) for index in indexes]
+
+
+def attendance_streaks(user_id, today):
+    """
+    Current and longest runs of attended working days (present or half day);
+    leave days neither break nor extend a run.
+    """
+    previous, previous_dates = _working_sequence(user_id, today.year - 1, today)
+    current, current_dates = _working_sequence(user_id, today.year, today)
+    flags = np.concatenate((previous, current))
+    dates = previous_dates + current_dates
+
+    lengths, ends = _runs(flags)
+    current_streak = int(lengths[-1]) if len(lengths) and ends[-1] == len(flags) else 0
+    year_lengths, year_ends = _runs(current)
+    longest = int(year_lengths.max()) if len(year_lengths) else 0
+    longest_end = current_dates[year_ends[year_lengths.argmax()] - 1] if longest else None
+
+    return {
+        'current_streak': current_streak,
+        'current_streak_start': dates[len(flags) - current_streak].isoformat() if current_streak else None,
+        'longest_streak': longest,
+        'longest_streak_end': longest_end.isoformat() if longest_end else None,
+        'year': today.year,
+        'attended_days': int(current.sum()),
+        'working_days': len(current),
+        'attendance_rate': round(float(current.mean()) * 100, 2) if len(current) else 0.0,
+    }
+
+
+def organisation_presence(start_date, end_date, user_ids):
+    """
+    Per working day: employees present or on a half day, on leave and the
+    presence percentage of those expected (employees not on leave).
+    """
+    user_ids = list(user_ids)
+    employees = len(user_ids)
+    days = []
+    attended_total = expected_total = 0
+    for year in range(start_date.year, end_date.year + 1):
+        stored = list(
+            AttendanceYearMap.objects.filter(year=year, user_id__in=user_ids).values_list('status', 'leave')
+        )
+        if stored:
+            status_matrix = np.stack([_status_bytes(status) for status, _ in stored])
+            leave_matrix = np.stack([_leave_bits(leave) for _, leave in stored])
+            attended, _ = _attended_and_recorded(status_matrix)
+            attended_counts = attended.sum(axis=0)
+            leave_counts = np.unpackbits(leave_matrix, axis=1, count=DAYS).sum(axis=0)
+        else:
+            attended_counts = leave_counts = np.zeros(DAYS, dtype=np.int64)
+
+        first = max(start_date, date(year, 1, 1))
+        last = min(end_date, date(year, 12, 31))
+        for day in iter_working_days(first, last):
+            index = day_index(day)
+            attended_count = int(attended_counts[index])
+            on_leave = int(leave_counts[index])
+            expected = employees - on_leave
+            attended_total += attended_count
+            expected_total += expected
+            days.append({
+                'date': day.isoformat(),
+                'attended': attended_count,
+                'on_leave': on_leave,
+                'expected': expected,
+                'presence_percentage': round(attended_count / expected * 100, 2) if expected else 0.0,
+            })
+    return {
+        'employees': employees,
+        'days': days,
+        'average_presence_percentage': round(attended_total / expected_total * 100, 2) if expected_total else 0.0,
+    }
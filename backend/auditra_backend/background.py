@@ -0,0 +1,87 @@
+"""
+In-process batching of deferrable work.
+
+A ``BatchWorker`` collects items from request threads and hands them to its
+``flush`` function in batches from a daemon thread, either every
+``interval`` seconds or as soon as ``max_batch`` items are waiting. Hot
+paths (e.g. the morning check-in burst) use it to move audit writes and
+rollup maintenance out of the request.
+
+A batch whose flush raises is put back in the queue and retried on the next
+flush rather than dropped. Items still queued when the process exits are
+flushed by an ``atexit`` hook; a hard kill loses them, so work that must
+survive one (audit entries) is persisted first and only its key is queued.
+With ``BACKGROUND_BATCHING = False`` (tests, one-off scripts) items are
+flushed immediately in the caller's thread.
+"""
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class BatchWorker:
+    """Queue items and flush them in batches from a background thread"""
+
+    def __init__(self, name, flush, interval=1.0, max_batch=500):
+        self.name = name
+        self.flush_function = flush
+        self.interval = interval
+        self.max_batch = max_batch
+        self._items = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        atexit.register(self.flush)
+
+    def add(self, item):
+        """Queue an item once the current transaction commits"""
+        transaction.on_commit(lambda: self._enqueue(item))
+
+    def _enqueue(self, item):
+        if not getattr(settings, 'BACKGROUND_BATCHING', True):
+            with self._lock:
+                self._items.append(item)
+            # Also retries anything an earlier failed flush put back
+            self.flush()
+            return
+        with self._lock:
+            self._items.append(item)
+            full = len(self._items) >= self.max_batch
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+                self._thread.start()
+        if full:
+            self._wake.set()
+
+    def _loop(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+            close_old_connections()
+
+    def flush(self):
+        """Hand everything queued so far to the flush function"""
+        with self._lock:
+            items, self._items = self._items, []
+        failed = []
+        for start in range(0, len(items), self.max_batch):
+            batch = items[start:start + self.max_batch]
+            if not self._run(batch):
+                failed.extend(batch)
+        if failed:
+            with self._lock:
+                self._items[:0] = failed
+
+    def _run(self, items):
+        try:
+            self.flush_function(items)
+        except Exception:
+            logger.exception('%s failed to flush %d item(s); retrying on the next flush', self.name, len(items))
+            return False
+        return True
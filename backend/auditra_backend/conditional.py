@@ -0,0 +1,69 @@
+"""
+Conditional GET (ETag) support for polled read endpoints.
+
+Views derive a version signature from cheap aggregates (latest ``updated_at``
+and row counts) before any expensive queryset is evaluated, so unchanged
+resources are answered with 304 Not Modified without touching serializers.
+"""
+import functools
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import quote_etag
+
+
+def aggregate_version(queryset, field='updated_at'):
+    """
+    Return ``(latest, count)`` for a queryset in a single query.
+
+    The count catches deletions, which leave the latest timestamp unchanged.
+    """
+    result = queryset.order_by().aggregate(latest=Max(field), count=Count('pk'))
+    return result['latest'], result['count']
+
+
+def conditional_get(view_class):
+    """
+    Class decorator answering GET with 304 when the client's ETag still
+    matches.
+
+    The view implements ``get_version_signature()`` returning a list of
+    ``(latest, count)`` pairs, usually built with :func:`aggregate_version`,
+    plus any other plain values the response depends on (e.g. today's date).
+    It runs after authentication but before the view's own ``get``, so it
+    must apply the same access checks and return None to skip conditional
+    handling (e.g. when ``get`` will refuse the request).
+
+    Only an ETag is sent: a Last-Modified built from the latest timestamp
+    would not move on deletions or on the non-timestamp parts.
+    """
+    view_get = view_class.get
+
+    @functools.wraps(view_get)
+    def get(self, request, *args, **kwargs):
+        versions = self.get_version_signature()
+        if versions is None:
+            return view_get(self, request, *args, **kwargs)
+
+        raw = repr((
+            request.user.pk,
+            request.get_full_path(),
+            getattr(request, 'accepted_media_type', ''),
+            versions,
+        ))
+        etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = view_get(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        patch_vary_headers(response, ('Accept', 'Authorization'))
+        return response
+
+    view_class.get = get
+    return view_class
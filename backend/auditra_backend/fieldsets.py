@@ -0,0 +1,198 @@
+"""
+Sparse fieldsets and opt-in expansion for heavy serializers.
+
+A serializer using ``DynamicFieldsMixin`` can be narrowed by the caller:
+
+* ``?fields=id,title,status`` returns only the listed fields.
+* ``?expand=valuations,documents`` adds nested data that sparse responses
+  leave out. Dotted paths expand further down, e.g. ``valuations.photos``.
+
+Fields listed in ``Meta.expandable_fields`` are only serialized when asked
+for once either parameter is present. Requests that send neither get the
+full legacy representation.
+
+The queryset is loaded to match the requested shape, so list endpoints run
+a fixed number of queries however many rows they return:
+
+* relations reached through a field's ``source`` (``coordinator.username``)
+  and nested serializers are joined or prefetched automatically;
+* ``Meta.related_fields`` maps other fields (usually method fields) to the
+  lookups they read, either strings or ``Prefetch`` objects;
+* ``Meta.annotated_fields`` maps fields to annotations, e.g. a
+  ``related_count`` the field reads instead of running its own ``COUNT``.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+from rest_framework.serializers import BaseSerializer
+
+
+def related_count(model, field):
+    """Correlated COUNT of model rows whose `field` points at the outer row"""
+    rows = (
+        model._default_manager.filter(**{field: OuterRef('pk')})
+        .order_by()
+        .values(field)
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(rows, output_field=IntegerField()), 0)
+
+
+def _split(value):
+    if isinstance(value, str):
+        value = value.split(',')
+    return [item.strip() for item in value or () if item and item.strip()]
+
+
+def _parse_expand(value):
+    """'valuations.photos,documents' -> {'valuations': ['photos'], 'documents': []}"""
+    tree = {}
+    for path in _split(value):
+        head, _, rest = path.partition('.')
+        tree.setdefault(head, [])
+        if rest:
+            tree[head].append(rest)
+    return tree
+
+
+def _walk(model, parts):
+    """Follow relation names from model; returns (relation parts, is_many)"""
+    path, many = [], False
+    for part in parts:
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation or field.related_model is None:
+            break
+        path.append(part)
+        many = many or field.many_to_many or field.one_to_many
+        model = field.related_model
+    return path, many
+
+
+def _prefixed(prefix, lookup):
+    if isinstance(lookup, Prefetch):
+        return Prefetch(f'{prefix}__{lookup.prefetch_through}', queryset=lookup.queryset, to_attr=lookup.to_attr)
+    return f'{prefix}__{lookup}'
+
+
+class DynamicFieldsMixin:
+    """ModelSerializer mixin adding ?fields= / ?expand= and shape-driven eager loading"""
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.configure_shape(fields, expand)
+
+    def configure_shape(self, fields=None, expand=None):
+        self.sparse = fields is not None or expand is not None
+        self.requested_fields = set(_split(fields))
+        self.expand = _parse_expand(expand)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.sparse:
+            return fields
+
+        meta = getattr(self, 'Meta', None)
+        expandable = set(getattr(meta, 'expandable_fields', ()))
+        keep = self.requested_fields or set(fields) - expandable
+        keep |= set(self.expand)
+        for name in list(fields):
+            if name not in keep:
+                del fields[name]
+
+        # Nested serializers follow the same rules, one level down
+        for name, field in fields.items():
+            child = getattr(field, 'child', field)
+            if isinstance(child, DynamicFieldsMixin):
+                child.configure_shape(expand=','.join(self.expand.get(name, [])))
+        return fields
+
+    def get_eager_loading(self):
+        """(select_related, prefetch_related, annotations) for the fields being serialized"""
+        model = self.Meta.model
+        meta = self.Meta
+        related = getattr(meta, 'related_fields', {})
+        annotated = getattr(meta, 'annotated_fields', {})
+        select, prefetch, annotations = [], [], {}
+
+        def add(lookup):
+            if isinstance(lookup, Prefetch):
+                prefetch.append(lookup)
+                return
+            _, many = _walk(model, lookup.split('__'))
+            target = prefetch if many else select
+            if lookup not in target:
+                target.append(lookup)
+
+        for name, field in self.fields.items():
+            if name in annotated:
+                annotations[name] = annotated[name]
+                continue
+            if name in related:
+                for lookup in related[name]:
+                    add(lookup)
+                continue
+            if field.source == '*':
+                continue
+
+            child = getattr(field, 'child', field)
+            if isinstance(child, BaseSerializer):
+                path, many = _walk(model, field.source_attrs)
+                if not path:
+                    continue
+                lookup = '__'.join(path)
+                if not isinstance(child, DynamicFieldsMixin):
+                    add(lookup)
+                elif many:
+                    queryset = child.optimize_queryset(child.Meta.model._default_manager.all())
+                    prefetch.append(Prefetch(lookup, queryset=queryset))
+                else:
+                    add(lookup)
+                    child_select, child_prefetch, _ = child.get_eager_loading()
+                    select.extend(_prefixed(lookup, item) for item in child_select)
+                    prefetch.extend(_prefixed(lookup, item) for item in child_prefetch)
+                continue
+
+            # 'coordinator.username' needs the coordinator row, a bare FK only its id
+            path, _ = _walk(model, field.source_attrs[:-1])
+            if path:
+                add('__'.join(path))
+
+        return select, prefetch, annotations
+
+    def optimize_queryset(self, queryset):
+        """Apply the joins, prefetches and annotations the current shape needs"""
+        select, prefetch, annotations = self.get_eager_loading()
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+        return queryset
+
+
+class DynamicFieldsViewMixin:
+    """Generic view mixin passing ?fields= / ?expand= to a DynamicFieldsMixin serializer on GET"""
+
+    def uses_dynamic_fields(self):
+        return (
+            self.request.method == 'GET'
+            and issubclass(self.get_serializer_class(), DynamicFieldsMixin)
+        )
+
+    def get_serializer(self, *args, **kwargs):
+        if self.uses_dynamic_fields():
+            kwargs.setdefault('fields', self.request.query_params.get('fields'))
+            kwargs.setdefault('expand', self.request.query_params.get('expand'))
+        return super().get_serializer(*args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.uses_dynamic_fields():
+            serializer = self.get_serializer()
+            queryset = serializer.optimize_queryset(queryset)
+        return queryset
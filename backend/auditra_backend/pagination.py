@@ -0,0 +1,189 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+Pages are addressed by the ordering values of the last row seen rather than
+an offset, so deep pages cost the same as the first one and rows inserted
+while a client is paging never shift or duplicate results. The ordering is
+taken from the view's ``pagination_ordering``, the queryset's ``order_by()``
+or the model's ``Meta.ordering``, with the primary key appended as a
+tie-breaker so every position is unique. Ordering may use annotations.
+
+While ``KEYSET_PAGINATION_OPT_IN`` is on (the default), requests that send
+neither ``cursor`` nor ``page_size`` are answered unpaginated exactly as
+before, so existing clients keep working until they are updated.
+"""
+import base64
+import json
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination keyed on every ordering field plus the primary key"""
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 50
+    max_page_size = 200
+    invalid_cursor_message = 'Invalid cursor'
+
+    def is_requested(self, request):
+        """Whether this request should be paginated"""
+        if not getattr(settings, 'KEYSET_PAGINATION_OPT_IN', True):
+            return True
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset, view)
+        self.fields = [self._resolve_field(queryset, name.lstrip('-')) for name in self.ordering]
+
+        position, reverse = self.decode_cursor(request)
+        ordering = [self._flip(name) for name in self.ordering] if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._after(ordering, position))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        # Moving backwards, "more" lies before the page; a cursor always
+        # implies there is something on the side the client came from
+        self.has_next = (not reverse and has_more) or (reverse and position is not None)
+        self.has_previous = (reverse and has_more) or (not reverse and position is not None)
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data):
+        return {**self.get_links(), 'results': data}
+
+    def get_links(self):
+        """Next/previous links, for views that wrap results in their own envelope"""
+        return {'next': self.get_next_link(), 'previous': self.get_previous_link()}
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, queryset, view):
+        ordering = (
+            getattr(view, 'pagination_ordering', None)
+            or queryset.query.order_by
+            or queryset.model._meta.ordering
+            or ['-pk']
+        )
+        ordering = [ordering] if isinstance(ordering, str) else list(ordering)
+        if not any(name.lstrip('-') in ('pk', 'id') for name in ordering):
+            ordering.append('-pk' if ordering[0].startswith('-') else 'pk')
+        return ordering
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            values = payload['p']
+            if len(values) != len(self.fields):
+                raise ValueError
+            position = [field.to_python(value) for field, value in zip(self.fields, values)]
+            return position, bool(payload.get('r'))
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    def _link(self, instance, reverse):
+        values = [self._value(instance, name.lstrip('-')) for name in self.ordering]
+        payload = {'p': [self._encode(value) for value in values]}
+        if reverse:
+            payload['r'] = 1
+        encoded = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    @staticmethod
+    def _after(ordering, position):
+        """Lexicographic "comes after position" filter for the given ordering"""
+        clauses = []
+        for index, name in enumerate(ordering):
+            field = name.lstrip('-')
+            field = 'pk' if field == 'id' else field
+            lookup = 'lt' if name.startswith('-') else 'gt'
+            equal = {
+                ('pk' if prev.lstrip('-') == 'id' else prev.lstrip('-')): position[i]
+                for i, prev in enumerate(ordering[:index])
+            }
+            clauses.append(Q(**equal, **{f'{field}__{lookup}': position[index]}))
+        return reduce(or_, clauses)
+
+    @staticmethod
+    def _flip(name):
+        return name[1:] if name.startswith('-') else f'-{name}'
+
+    @staticmethod
+    def _resolve_field(queryset, path):
+        # Annotations (e.g. a workload count) page like any other column
+        if path in queryset.query.annotations:
+            return queryset.query.annotations[path].output_field
+        model = queryset.model
+        field = None
+        for part in path.split('__'):
+            if part == 'pk':
+                field = model._meta.pk
+            else:
+                try:
+                    field = model._meta.get_field(part)
+                except FieldDoesNotExist:
+                    raise ValueError(f'Cannot paginate on unknown field {path!r}')
+            if field.is_relation and field.related_model is not None and part != path.split('__')[-1]:
+                model = field.related_model
+        if field.is_relation:
+            field = field.target_field
+        return field
+
+    @staticmethod
+    def _value(instance, path):
+        value = instance
+        for part in path.split('__'):
+            value = value[part] if isinstance(value, dict) else getattr(value, part)
+        return getattr(value, 'pk', value)
+
+    @staticmethod
+    def _encode(value):
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        if isinstance(value, (int, float, str)) or value is None:
+            return value
+        return str(value)
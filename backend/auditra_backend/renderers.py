@@ -0,0 +1,24 @@
+"""
+MessagePack rendering for API clients that ask for it with
+``Accept: application/msgpack``.
+
+Payloads keep exactly the same shape as the JSON responses; values the JSON
+encoder would convert (dates, Decimals, lazy strings...) are converted the
+same way so both formats decode to identical data.
+"""
+import msgpack
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class MessagePackRenderer(BaseRenderer):
+    """Renders responses as MessagePack"""
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=JSONEncoder().default, use_bin_type=True)
@@ -49,6 +49,7 @@ INSTALLED_APPS = [
     'projects',
     'valuations',
     'system_logs',
+    'sync',
 ]
 
 MIDDLEWARE = [
@@ -174,6 +175,18 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # JSON stays the default; mobile clients opt into MessagePack via Accept
+    'DEFAULT_RENDERER_CLASSES': (
+        'rest_framework.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+        'auditra_backend.renderers.MessagePackRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+        'auditra_backend.parsers.MessagePackParser',
+    ),
 }
 
 # JWT Settings
@@ -199,4 +212,32 @@ SENDGRID_SANDBOX_MODE_IN_DEBUG = False  # Set to True for testing without sendin
 EMAIL_TIMEOUT = 30  # seconds
 
 # Frontend URL (used for login links in emails)
-FRONTEND_URL = config('FRONTEND_URL', default='http://localhost:5173')
\ No newline at end of file
+FRONTEND_URL = config('FRONTEND_URL', default='http://localhost:5173')
+# Offline delta sync
+# Tombstones older than this are pruned; cursors older than it force a full resync
+SYNC_TOMBSTONE_RETENTION_DAYS = config('SYNC_TOMBSTONE_RETENTION_DAYS', default=30, cast=int)
+# Window re-sent on every pull to catch rows from transactions still in flight
+SYNC_CURSOR_OVERLAP_SECONDS = 5
+
+# Notification long-poll fan-out: 'local' (single process) or 'postgres'
+# (LISTEN/NOTIFY, needed when running several worker processes)
+NOTIFICATION_STREAM_BACKEND = config('NOTIFICATION_STREAM_BACKEND', default='local')
+# Longest a long-poll request is held, and how many may wait at once per
+# process (keep below the server's threads per process, see README)
+NOTIFICATION_LONG_POLL_SECONDS = config('NOTIFICATION_LONG_POLL_SECONDS', default=20, cast=int)
+NOTIFICATION_LONG_POLL_MAX_WAITERS = config('NOTIFICATION_LONG_POLL_MAX_WAITERS', default=16, cast=int)
+# Clients turned away because every waiting slot is taken retry after this long
+NOTIFICATION_LONG_POLL_RETRY_SECONDS = 10
+# Extra delivery channels for workflow notifications, e.g.
+# ['valuations.notifications.EmailChannel']
+NOTIFICATION_CHANNELS = []
+# Read notifications older than this are moved to the archive by archive_notifications
+NOTIFICATION_RETENTION_DAYS = config('NOTIFICATION_RETENTION_DAYS', default=90, cast=int)
+
+# Keyset pagination stays opt-in (cursor/page_size query params) while this
+# is on; turn it off once every client pages through list endpoints
+KEYSET_PAGINATION_OPT_IN = True
+
+# Hot paths (check-in audit entries, attendance rollup refreshes) hand work to
+# in-process background batches; turn off to run it inline, e.g. in tests
+BACKGROUND_BATCHING = config('BACKGROUND_BATCHING', default=True, cast=bool)
@@ -0,0 +1,39 @@
+"""
+Per-transaction coalescing of on_commit work.
+
+Receivers that fire many times in one transaction (a workflow step touching
+several rows of a project, a day of attendance) add their keys to a single
+queued callback, so the follow-up work runs once when the transaction commits.
+"""
+from django.db import transaction
+
+
+class CoalescedCallback:
+    """on_commit callback collecting items; subclasses implement run(items)"""
+
+    def __init__(self):
+        self.items = set()
+
+    def __call__(self):
+        self.run(self.items)
+
+    def run(self, items):
+        raise NotImplementedError
+
+
+def queue_on_commit(callback_class, item):
+    """
+    Add item to the callback_class instance already queued in the current
+    transaction, or queue a new one (run immediately outside a transaction)
+    """
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        # Entries dropped by a savepoint rollback disappear from run_on_commit too
+        for entry in connection.run_on_commit:
+            callback = entry[1]
+            if isinstance(callback, callback_class):
+                callback.items.add(item)
+                return
+    callback = callback_class()
+    callback.items.add(item)
+    transaction.on_commit(callback)
@@ -53,6 +53,7 @@ urlpatterns = [
     path('api/projects/', include('projects.urls')),
     path('api/valuations/', include('valuations.urls')),
     path('api/system-logs/', include('system_logs.urls')),
+    path('api/sync/', include('sync.urls')),
 ]
 
 # Serve media files in development
@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-19 02:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0025_merge_20260218_1417'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paymentslip',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -3,7 +3,6 @@ from django.contrib.auth.models import User
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
-from django.db.models import Sum
 from datetime import datetime, timedelta
 from decimal import Decimal
 import random
@@ -167,6 +166,7 @@ class PaymentSlip(models.Model):
     generated_at = models.DateTimeField(auto_now_add=True)
     uploaded_at = models.DateTimeField(null=True, blank=True)  # When payment slips were uploaded/published
     paid_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     
     class Meta:
         db_table = 'payment_slips'
@@ -209,24 +209,32 @@ class PaymentSlip(models.Model):
         """Get total overtime hours for a user in a specific month"""
         try:
             from attendance.models import Attendance
-            from calendar import monthrange
-            from datetime import date
-            
-            # Get first and last day of the month
-            first_day = date(year, month, 1)
-            last_day = date(year, month, monthrange(year, month)[1])
             
             # Sum all overtime hours for the month
             total_overtime = Attendance.objects.filter(
                 user=user,
-                date__gte=first_day,
-                date__lte=last_day
-            ).aggregate(total=Sum('overtime_hours'))['total']
+                date__year=year,
+                date__month=month
+            ).aggregate(total=models.Sum('overtime_hours'))['total']
             
             return float(total_overtime) if total_overtime else 0.0
         except Exception:
             return 0.0
     
+    @staticmethod
+    def get_monthly_overtime_by_user(month, year):
+        """{user_id: overtime hours} for a month, summed from attendance in one query"""
+        from attendance.models import Attendance
+        
+        return dict(
+            Attendance.objects.filter(
+                date__year=year,
+                date__month=month
+            ).order_by().values('user_id').annotate(
+                total=models.Sum('overtime_hours')
+            ).values_list('user_id', 'total')
+        )
+    
     @classmethod
     def generate_for_all_users(cls, month=None, year=None, generated_by=None, force_regenerate=False):
         """Generate payment slips for all users with assigned roles (excluding client and agent)"""
@@ -242,7 +250,9 @@ class PaymentSlip(models.Model):
             'coordinator', 'field_officer', 'accessor',
             'senior_valuer', 'md_gm', 'general_employee'
         ]
-        users_with_roles = User.objects.filter(role__role__in=allowed_roles)
+        users_with_roles = User.objects.filter(role__role__in=allowed_roles).select_related('role')
+        # Payroll reads attendance itself rather than the rollups, which may lag
+        monthly_overtime = cls.get_monthly_overtime_by_user(month, year)
         
         for user in users_with_roles:
             if hasattr(user, 'role') and user.role:
@@ -265,7 +275,7 @@ class PaymentSlip(models.Model):
                             existing_slip.overtime_hours_uploaded = False
                         else:
                             # Other roles: Get from attendance system
-                            overtime_hours = Decimal(str(cls.get_monthly_overtime_hours(user, month, year)))
+                            overtime_hours = Decimal(str(monthly_overtime.get(user.id, 0)))
                             existing_slip.overtime_hours = overtime_hours
                             existing_slip.overtime_hours_uploaded = False  # Reset flag since we're fetching from attendance
                         overtime_pay = cls.calculate_overtime_pay(float(overtime_hours), float(basic_salary))
@@ -303,7 +313,7 @@ class PaymentSlip(models.Model):
                             overtime_hours = Decimal('0.00')
                         else:
                             # Other roles: Get from attendance system
-                            overtime_hours = Decimal(str(cls.get_monthly_overtime_hours(user, month, year)))
+                            overtime_hours = Decimal(str(monthly_overtime.get(user.id, 0)))
                         overtime_pay = cls.calculate_overtime_pay(float(overtime_hours), float(basic_salary))
                         # Net salary = Basic salary - EPF + allowances + overtime pay
                         net_salary = basic_salary - epf_contribution + allowances + overtime_pay
@@ -652,6 +662,12 @@ class LeaveRequest(models.Model):
     def days(self):
         """Calculate number of leave days"""
         return (self.end_date - self.start_date).days + 1
+    
+    @property
+    def working_days(self):
+        """Number of working days (excluding Sundays and holidays) the leave covers"""
+        from attendance.workdays import working_days_between
+        return working_days_between(self.start_date, self.end_date)
 
 
 class EmployeeRemovalRequest(models.Model):
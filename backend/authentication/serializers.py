@@ -295,12 +295,13 @@ class LeaveRequestSerializer(serializers.ModelSerializer):
     leave_type_display = serializers.CharField(source='get_leave_type_display', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     days = serializers.ReadOnlyField()
+    working_days = serializers.ReadOnlyField()
     
     class Meta:
         model = LeaveRequest
         fields = (
             'id', 'user', 'employee_name', 'employee_id', 'employee_role', 'leave_type', 
-            'leave_type_display', 'start_date', 'end_date', 'days', 
+            'leave_type_display', 'start_date', 'end_date', 'days', 'working_days',
             'reason', 'status', 'status_display', 'submitted_at', 
             'reviewed_at', 'reviewed_by', 'notes'
         )
@@ -389,6 +389,90 @@ The Auditra Team
             logger.error(f'Error sending project assignment email to {email}: {str(e)}', exc_info=True)
             return False
 
+    @staticmethod
+    def send_project_assignments_summary(email, name, assignments, coordinator_name=None):
+        """
+        Send one email listing several project assignments for the same recipient.
+
+        Args:
+            email: Recipient email
+            name: Recipient name
+            assignments: List of (project_title, role_in_project) tuples
+            coordinator_name: Name of the coordinator (optional)
+        """
+        recipient_name = name or 'User'
+        count = len(assignments)
+
+        subject = f'Auditra - You Have Been Assigned to {count} Project{"s" if count != 1 else ""}'
+
+        coordinator_line = ''
+        if coordinator_name:
+            coordinator_line = f'<p style="margin: 10px 0;"><strong>Coordinator:</strong> {coordinator_name}</p>'
+
+        login_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:5173') + '/login'
+
+        rows = ''.join(
+            f'<p style="margin: 10px 0;"><strong>{project_title}</strong> &mdash; {role_in_project}</p>'
+            for project_title, role_in_project in assignments
+        )
+
+        html_message = f"""
+        <html>
+        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+            <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+                <div style="background-color: #1565C0; color: white; padding: 20px; text-align: center; border-radius: 5px 5px 0 0;">
+                    <h1 style="margin: 0;">Project Assignments</h1>
+                </div>
+                <div style="background-color: #f9f9f9; padding: 30px; border-radius: 0 0 5px 5px;">
+                    <p>Dear {recipient_name},</p>
+                    <p>You have been assigned to the following projects on the Auditra system.</p>
+                    <div style="background-color: white; padding: 20px; border-left: 4px solid #1565C0; margin: 20px 0;">
+                        {rows}
+                        {coordinator_line}
+                    </div>
+                    <div style="text-align: center; margin: 30px 0;">
+                        <a href="{login_url}" style="display: inline-block; background-color: #1565C0; color: white; padding: 14px 32px; text-decoration: none; border-radius: 8px; font-weight: bold; font-size: 16px;">View Projects</a>
+                    </div>
+                    <p style="margin-top: 30px;">Best regards,<br>The Auditra Team</p>
+                </div>
+                <div style="text-align: center; padding: 20px; color: #999; font-size: 12px;">
+                    <p>This is an automated message. Please do not reply to this email.</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+        project_lines = '\n'.join(f'- {project_title} ({role_in_project})' for project_title, role_in_project in assignments)
+        plain_message = f"""
+Dear {recipient_name},
+
+You have been assigned to the following projects on the Auditra system.
+
+{project_lines}
+{f'Coordinator: {coordinator_name}' if coordinator_name else ''}
+
+Login to view the projects: {login_url}
+
+Best regards,
+The Auditra Team
+        """
+
+        try:
+            logger.info(f'Sending {count} project assignment(s) summary to {email}')
+            send_mail(
+                subject=subject,
+                message=plain_message,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                recipient_list=[email],
+                html_message=html_message,
+                fail_silently=False,
+            )
+            return True
+        except Exception as e:
+            logger.error(f'Error sending project assignments summary to {email}: {str(e)}', exc_info=True)
+            return False
+
     @staticmethod
     def send_otp_email(email, otp):
         """Send OTP code for password reset."""
@@ -890,3 +974,51 @@ The Auditra Team
         except Exception as e:
             logger.error(f'Error sending commission report to {agent.email}: {str(e)}', exc_info=True)
             return False
+
+    @staticmethod
+    def send_workflow_notification(email, name, title, message):
+        """Send an in-app workflow notification (e.g. a valuation rejection) by email."""
+        recipient_name = name or 'User'
+        login_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:5173') + '/login'
+
+        html_message = f"""
+        <html>
+        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+            <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+                <div style="background-color: #1565C0; color: white; padding: 20px; text-align: center; border-radius: 5px 5px 0 0;">
+                    <h1 style="margin: 0;">{title}</h1>
+                </div>
+                <div style="background-color: #f9f9f9; padding: 30px; border-radius: 0 0 5px 5px;">
+                    <p>Dear {recipient_name},</p>
+                    <div style="background-color: white; padding: 20px; border-left: 4px solid #1565C0; margin: 20px 0;">
+                        <p style="margin: 0;">{message}</p>
+                    </div>
+                    <div style="text-align: center; margin: 30px 0;">
+                        <a href="{login_url}" style="display: inline-block; background-color: #1565C0; color: white; padding: 14px 32px; text-decoration: none; border-radius: 8px; font-weight: bold; font-size: 16px;">Open Auditra</a>
+                    </div>
+                    <p style="margin-top: 30px;">Best regards,<br>The Auditra Team</p>
+                </div>
+                <div style="text-align: center; padding: 20px; color: #999; font-size: 12px;">
+                    <p>This is an automated message. Please do not reply to this email.</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+        plain_message = f"Dear {recipient_name},\n\n{message}\n\nLogin to view the details: {login_url}\n\nBest regards,\nThe Auditra Team"
+
+        try:
+            logger.info(f'Sending workflow notification "{title}" to {email}')
+            send_mail(
+                subject=f'Auditra - {title}',
+                message=plain_message,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                recipient_list=[email],
+                html_message=html_message,
+                fail_silently=False,
+            )
+            return True
+        except Exception as e:
+            logger.error(f'Error sending workflow notification to {email}: {str(e)}', exc_info=True)
+            return False
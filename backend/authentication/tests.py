@@ -1,3 +1,82 @@
+from decimal import Decimal
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from auditra_backend.pagination import KeysetPagination
+from .models import PaymentSlip
+
+
+class KeysetPaginationTests(TestCase):
+    """Cursor pages over AllPaymentSlipsView, ordered -year, -month, user__username (+ -pk)"""
+
+    ordering = ['-year', '-month', 'user__username', '-pk']
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user('hr', password='pass')
+        cls.hr.role.role = 'hr_head'
+        cls.hr.role.save()
+        # Several slips share year and month so the later ordering fields break ties
+        employees = []
+        for name in ('carol', 'alice', 'bob'):
+            user = User.objects.create_user(name, password='pass')
+            user.role.role = 'field_officer'
+            user.role.save()
+            employees.append(user)
+        for year, month in ((2025, 12), (2026, 1), (2026, 2), (2026, 3)):
+            for user in employees:
+                PaymentSlip.objects.create(
+                    user=user, year=year, month=month,
+                    salary=Decimal('1000'), role='field_officer', role_display='Field Officer',
+                )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.hr)
+
+    def walk(self, url, link):
+        """Follow next/previous links from url; returns the response bodies in order"""
+        pages = []
+        while url:
+            self.assertLess(len(pages), 20, 'cursor links do not advance')
+            pages.append(self.client.get(url).json())
+            url = pages[-1][link]
+        return pages
+
+    def expected_ids(self):
+        return list(PaymentSlip.objects.order_by(*self.ordering).values_list('pk', flat=True))
+
+    def test_after_matches_python_ordering(self):
+        rows = list(PaymentSlip.objects.values_list('year', 'month', 'user__username', 'pk'))
+        key = lambda row: (-row[0], -row[1], row[2], -row[3])
+        rows.sort(key=key)
+        for index, position in enumerate(rows):
+            after = PaymentSlip.objects.filter(KeysetPagination._after(self.ordering, list(position)))
+            self.assertEqual(
+                sorted(after.values_list('pk', flat=True)),
+                sorted(row[3] for row in rows[index + 1:]),
+            )
+
+    def test_next_links_walk_every_row_once(self):
+        pages = self.walk('/api/auth/payment-slips/?page_size=2', 'next')
+        self.assertTrue(all(len(page['data']) <= 2 for page in pages))
+        self.assertEqual([slip['id'] for page in pages for slip in page['data']], self.expected_ids())
+
+    def test_previous_links_walk_back_to_the_first_page(self):
+        forward = self.walk('/api/auth/payment-slips/?page_size=4', 'next')
+        backward = self.walk(forward[-1]['previous'], 'previous')
+        self.assertEqual(
+            [[slip['id'] for slip in page['data']] for page in backward],
+            [[slip['id'] for slip in page['data']] for page in forward[-2::-1]],
+        )
+
+    def test_unpaginated_without_cursor_or_page_size(self):
+        data = self.client.get('/api/auth/payment-slips/').json()
+        self.assertNotIn('next', data)
+        self.assertEqual([slip['id'] for slip in data['data']], self.expected_ids())
 
-# Create your tests here.
+    def test_invalid_cursor_is_not_found(self):
+        response = self.client.get('/api/auth/payment-slips/?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 404)
@@ -11,6 +11,8 @@ from django.contrib.auth.models import User
 from django.utils import timezone
 from django.db.models import Q
 from decimal import Decimal, InvalidOperation
+from auditra_backend.conditional import conditional_get, aggregate_version
+from auditra_backend.pagination import KeysetPagination
 from .models import UserRole, PaymentSlip, ClientFormSubmission, EmployeeFormSubmission, LeaveRequest, EmployeeRemovalRequest, PasswordResetOTP
 from .serializers import (
     UserRegistrationSerializer, 
@@ -381,6 +383,7 @@ class AllUsersView(generics.ListAPIView):
     """Admin and HR Head endpoint to view all users"""
     permission_classes = (IsAuthenticated,)
     serializer_class = UserDetailSerializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         # Check if user is admin or hr_head
@@ -574,9 +577,11 @@ class UploadPaymentSlipsView(APIView):
                 }, status=status.HTTP_404_NOT_FOUND)
             
             # Update all payment slips to be uploaded/published
+            now = timezone.now()
             updated_count = payment_slips.update(
                 is_uploaded=True,
-                uploaded_at=timezone.now()
+                uploaded_at=now,
+                updated_at=now
             )
 
             try:
@@ -606,10 +611,14 @@ class UploadPaymentSlipsView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@conditional_get
 class MyPaymentSlipsView(generics.ListAPIView):
     """Get current user's payment slips."""
     permission_classes = (IsAuthenticated,)
     serializer_class = PaymentSlipSerializer
+
+    def get_version_signature(self):
+        return [aggregate_version(self.get_queryset())]
     
     def get_serializer_context(self):
         """Add request to serializer context for building absolute URLs"""
@@ -657,10 +666,15 @@ class MyPaymentSlipsView(generics.ListAPIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@conditional_get
 class AllPaymentSlipsView(generics.ListAPIView):
     """Admin and HR Head endpoint to view all payment slips"""
     permission_classes = (IsAuthenticated,)
     serializer_class = PaymentSlipSerializer
+    pagination_class = KeysetPagination
+
+    def get_version_signature(self):
+        return [aggregate_version(self.get_queryset())]
     
     def get_serializer_context(self):
         """Add request to serializer context for building absolute URLs"""
@@ -694,11 +708,15 @@ class AllPaymentSlipsView(generics.ListAPIView):
     def list(self, request, *args, **kwargs):
         """Override list to wrap response in standard format"""
         queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(queryset if page is None else page, many=True)
+        data = {
             'success': True,
             'data': serializer.data
-        }, status=status.HTTP_200_OK)
+        }
+        if page is not None:
+            data.update(self.paginator.get_links())
+        return Response(data, status=status.HTTP_200_OK)
 
 
 class PaymentSlipDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Project, ProjectDocument
+from .models import Project, ProjectCard, ProjectDocument, ProjectMember
 
 
 @admin.register(Project)
@@ -19,3 +19,18 @@ class ProjectDocumentAdmin(admin.ModelAdmin):
     date_hierarchy = 'uploaded_at'
     readonly_fields = ('uploaded_at',)
 
+
+@admin.register(ProjectMember)
+class ProjectMemberAdmin(admin.ModelAdmin):
+    list_display = ('project', 'user', 'role', 'created_at')
+    list_filter = ('role',)
+    search_fields = ('project__title', 'user__username')
+    readonly_fields = ('created_at',)
+
+
+@admin.register(ProjectCard)
+class ProjectCardAdmin(admin.ModelAdmin):
+    list_display = ('title', 'status', 'coordinator_name', 'payment_status', 'valuations_count', 'updated_at')
+    list_filter = ('status', 'payment_status', 'pending_cancellation')
+    search_fields = ('title', 'coordinator_name')
+    readonly_fields = [field.name for field in ProjectCard._meta.fields]
@@ -0,0 +1,137 @@
+"""
+Maintenance of the ProjectCard read model.
+
+Signal receivers in projects/models.py call ``queue_card_refresh`` whenever a
+project or one of the rows a card summarises changes. Refreshes are
+collected per transaction and run once it commits, so a workflow step that
+touches a valuation, its history and the project rebuilds the card once.
+"""
+import logging
+
+from django.apps import apps as django_apps
+from django.db.models import Count, Min, OuterRef, Subquery
+
+from auditra_backend.transactions import CoalescedCallback, queue_on_commit
+
+logger = logging.getLogger(__name__)
+
+CARD_FIELDS = [
+    'title', 'status', 'priority', 'start_date', 'end_date', 'estimated_value', 'project_created_at',
+    'coordinator_name', 'field_officer_name', 'client_name', 'agent_name', 'accessor_name',
+    'senior_valuer_name', 'payment_status', 'valuations_count', 'valuation_status_counts',
+    'latest_event_status', 'latest_event_stage', 'latest_event_notes', 'latest_event_at',
+    'pending_cancellation', 'cancellation_requested_at', 'updated_at',
+]
+
+
+def _display_name(user):
+    if user is None:
+        return ''
+    return f"{user.first_name} {user.last_name}".strip() or user.username
+
+
+def _client_name(user):
+    # Same masking as ProjectSerializer.get_assigned_client_name
+    if user is None:
+        return ''
+    return f"Client {user.first_name}".strip() if user.first_name else 'Client'
+
+
+def rebuild_project_cards(project_ids=None, apps=None):
+    """
+    Recompute the cards for the given projects (all projects when None) in a
+    fixed number of queries. Data migrations pass their historical ``apps``.
+    """
+    apps = apps or django_apps
+    Project = apps.get_model('projects', 'Project')
+    ProjectCard = apps.get_model('projects', 'ProjectCard')
+    ProjectCancellationRequest = apps.get_model('projects', 'ProjectCancellationRequest')
+    ProjectPayment = apps.get_model('projects', 'ProjectPayment')
+    ProjectStatusHistory = apps.get_model('projects', 'ProjectStatusHistory')
+    Valuation = apps.get_model('valuations', 'Valuation')
+
+    projects = Project.objects.select_related(
+        'coordinator', 'assigned_field_officer', 'assigned_client', 'assigned_agent',
+        'assigned_accessor', 'assigned_senior_valuer', 'payment',
+    ).annotate(
+        latest_event_id=Subquery(
+            ProjectStatusHistory.objects.filter(project=OuterRef('pk')).order_by('-created_at', '-pk').values('pk')[:1]
+        )
+    )
+    valuations = Valuation.objects.all()
+    cancellations = ProjectCancellationRequest.objects.filter(status='pending')
+    if project_ids is not None:
+        project_ids = list(project_ids)
+        projects = projects.filter(pk__in=project_ids)
+        valuations = valuations.filter(project_id__in=project_ids)
+        cancellations = cancellations.filter(project_id__in=project_ids)
+    projects = list(projects)
+
+    status_counts = {}
+    for row in valuations.order_by().values('project_id', 'status').annotate(total=Count('pk')):
+        status_counts.setdefault(row['project_id'], {})[row['status']] = row['total']
+
+    pending_cancellations = dict(
+        cancellations.order_by().values('project_id').annotate(first=Min('created_at')).values_list('project_id', 'first')
+    )
+
+    events = ProjectStatusHistory.objects.in_bulk(
+        [project.latest_event_id for project in projects if project.latest_event_id]
+    )
+
+    cards = []
+    for project in projects:
+        counts = status_counts.get(project.pk, {})
+        event = events.get(project.latest_event_id)
+        try:
+            payment_status = project.payment.payment_status
+        except ProjectPayment.DoesNotExist:
+            payment_status = None
+        cards.append(ProjectCard(
+            project=project,
+            title=project.title,
+            status=project.status,
+            priority=project.priority,
+            start_date=project.start_date,
+            end_date=project.end_date,
+            estimated_value=project.estimated_value,
+            project_created_at=project.created_at,
+            coordinator_name=_display_name(project.coordinator),
+            field_officer_name=_display_name(project.assigned_field_officer),
+            client_name=_client_name(project.assigned_client),
+            agent_name=_display_name(project.assigned_agent),
+            accessor_name=_display_name(project.assigned_accessor),
+            senior_valuer_name=_display_name(project.assigned_senior_valuer),
+            payment_status=payment_status,
+            valuations_count=sum(counts.values()),
+            valuation_status_counts=counts,
+            latest_event_status=event.status if event else '',
+            latest_event_stage=(event.stage or '') if event else '',
+            latest_event_notes=event.notes if event else '',
+            latest_event_at=event.created_at if event else None,
+            pending_cancellation=project.pk in pending_cancellations,
+            cancellation_requested_at=pending_cancellations.get(project.pk),
+        ))
+
+    ProjectCard.objects.bulk_create(
+        cards,
+        update_conflicts=True,
+        unique_fields=['project'],
+        update_fields=CARD_FIELDS,
+    )
+    return len(cards)
+
+
+class _CardRefresh(CoalescedCallback):
+    """on_commit callback carrying every project touched in the transaction"""
+
+    def run(self, project_ids):
+        try:
+            rebuild_project_cards(project_ids)
+        except Exception:
+            logger.exception('Failed to refresh %d project card(s)', len(project_ids))
+
+
+def queue_card_refresh(project_id):
+    """Refresh the project's card once the current transaction commits"""
+    queue_on_commit(_CardRefresh, project_id)
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from projects.cards import rebuild_project_cards
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the ProjectCard read model from projects and their related rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of projects rebuilt per batch',
+        )
+        parser.add_argument(
+            '--project',
+            type=int,
+            action='append',
+            dest='projects',
+            help='Only rebuild this project id (repeatable)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        project_ids = options['projects'] or list(Project.objects.order_by('pk').values_list('pk', flat=True))
+
+        rebuilt = 0
+        for start in range(0, len(project_ids), batch_size):
+            rebuilt += rebuild_project_cards(project_ids[start:start + batch_size])
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {rebuilt} project card(s)'))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from projects.models import Project, ProjectMember
+
+
+class Command(BaseCommand):
+    help = 'Re-sync the ProjectMember index from the project assignment fields'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of projects synced per batch',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        project_ids = list(Project.objects.order_by('pk').values_list('pk', flat=True))
+        for start in range(0, len(project_ids), batch_size):
+            ProjectMember.sync_projects(Project.objects.filter(pk__in=project_ids[start:start + batch_size]))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Synced memberships for {len(project_ids)} project(s); '
+            f'{ProjectMember.objects.count()} membership(s) in total'
+        ))
@@ -0,0 +1,66 @@
+# Generated by Django 5.0 on 2026-10-19 02:15
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+ROLE_FIELDS = {
+    'coordinator': 'coordinator',
+    'field_officer': 'assigned_field_officer',
+    'client': 'assigned_client',
+    'agent': 'assigned_agent',
+    'accessor': 'assigned_accessor',
+    'senior_valuer': 'assigned_senior_valuer',
+}
+
+
+def backfill_members(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    ProjectMember = apps.get_model('projects', 'ProjectMember')
+    members = []
+    for project in Project.objects.only('pk', 'created_at', *[f'{field}_id' for field in ROLE_FIELDS.values()]).iterator():
+        for role, field in ROLE_FIELDS.items():
+            user_id = getattr(project, f'{field}_id')
+            if user_id is not None:
+                members.append(ProjectMember(
+                    project_id=project.pk, user_id=user_id, role=role, created_at=project.created_at
+                ))
+        if len(members) >= 1000:
+            ProjectMember.objects.bulk_create(members, ignore_conflicts=True)
+            members = []
+    ProjectMember.objects.bulk_create(members, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0016_projectdocument_updated_at_alter_project_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectMember',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('coordinator', 'Coordinator'), ('field_officer', 'Field Officer'), ('client', 'Client'), ('agent', 'Agent'), ('accessor', 'Accessor'), ('senior_valuer', 'Senior Valuer')], max_length=20)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='members', to='projects.project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_memberships', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Project Member',
+                'verbose_name_plural': 'Project Members',
+                'db_table': 'project_members',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', 'role', 'project'], name='project_member_lookup_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='projectmember',
+            constraint=models.UniqueConstraint(fields=('project', 'user', 'role'), name='unique_project_member'),
+        ),
+        migrations.RunPython(backfill_members, migrations.RunPython.noop),
+    ]
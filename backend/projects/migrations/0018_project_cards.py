@@ -0,0 +1,50 @@
+# Generated by Django 5.0 on 2026-10-19 02:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0017_project_members'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectCard',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to='projects.project')),
+                ('title', models.CharField(max_length=200)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], max_length=20)),
+                ('priority', models.CharField(choices=[('high', 'High'), ('medium', 'Medium'), ('low', 'Low')], max_length=10)),
+                ('start_date', models.DateField(blank=True, null=True)),
+                ('end_date', models.DateField(blank=True, null=True)),
+                ('estimated_value', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('project_created_at', models.DateTimeField()),
+                ('coordinator_name', models.CharField(blank=True, max_length=300)),
+                ('field_officer_name', models.CharField(blank=True, max_length=300)),
+                ('client_name', models.CharField(blank=True, max_length=300)),
+                ('agent_name', models.CharField(blank=True, max_length=300)),
+                ('accessor_name', models.CharField(blank=True, max_length=300)),
+                ('senior_valuer_name', models.CharField(blank=True, max_length=300)),
+                ('payment_status', models.CharField(blank=True, choices=[('pending', 'Pending'), ('requested', 'Payment Requested'), ('submitted', 'Bank Slip Submitted'), ('under_review', 'Under Review'), ('approved', 'Payment Approved'), ('rejected', 'Payment Rejected')], max_length=20, null=True)),
+                ('valuations_count', models.PositiveIntegerField(default=0)),
+                ('valuation_status_counts', models.JSONField(blank=True, default=dict)),
+                ('latest_event_status', models.CharField(blank=True, max_length=20)),
+                ('latest_event_stage', models.CharField(blank=True, max_length=100)),
+                ('latest_event_notes', models.TextField(blank=True)),
+                ('latest_event_at', models.DateTimeField(blank=True, null=True)),
+                ('pending_cancellation', models.BooleanField(default=False)),
+                ('cancellation_requested_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Project Card',
+                'verbose_name_plural': 'Project Cards',
+                'db_table': 'project_cards',
+                'ordering': ['-project_created_at'],
+                'indexes': [models.Index(fields=['-project_created_at', '-project'], name='project_card_list_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+from projects.cards import rebuild_project_cards
+
+
+def backfill_cards(apps, schema_editor):
+    rebuild_project_cards(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0018_project_cards'),
+        ('valuations', '0012_notification_archive'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_cards, migrations.RunPython.noop),
+    ]
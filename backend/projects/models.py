@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.utils import timezone
 
@@ -112,7 +114,7 @@ class Project(models.Model):
     )
     
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     
     class Meta:
         db_table = 'projects'
@@ -150,6 +152,7 @@ class ProjectDocument(models.Model):
         help_text='The assigned user this document is intended for'
     )
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     
     class Meta:
         db_table = 'project_documents'
@@ -432,3 +435,212 @@ class CommissionReport(models.Model):
 
     def __str__(self):
         return f"{self.project.title} - Commission Report - Rs. {self.commission_amount}"
+
+
+class ProjectMember(models.Model):
+    """One row per (project, user, role) assignment, mirrored from the Project assignment fields"""
+
+    ROLE_CHOICES = [
+        ('coordinator', 'Coordinator'),
+        ('field_officer', 'Field Officer'),
+        ('client', 'Client'),
+        ('agent', 'Agent'),
+        ('accessor', 'Accessor'),
+        ('senior_valuer', 'Senior Valuer'),
+    ]
+
+    # Role -> Project field the membership mirrors
+    ROLE_FIELDS = {
+        'coordinator': 'coordinator',
+        'field_officer': 'assigned_field_officer',
+        'client': 'assigned_client',
+        'agent': 'assigned_agent',
+        'accessor': 'assigned_accessor',
+        'senior_valuer': 'assigned_senior_valuer',
+    }
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name='members'
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='project_memberships'
+    )
+    role = models.CharField(max_length=20, choices=ROLE_CHOICES)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'project_members'
+        verbose_name = 'Project Member'
+        verbose_name_plural = 'Project Members'
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'user', 'role'], name='unique_project_member'),
+        ]
+        indexes = [
+            # Covers "projects this user holds this role on" without touching projects
+            models.Index(fields=['user', 'role', 'project'], name='project_member_lookup_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.get_role_display()} on {self.project.title}"
+
+    @classmethod
+    def project_ids(cls, user, *roles):
+        """Subquery of the ids of projects the user is a member of, optionally in given roles"""
+        members = cls.objects.filter(user=user)
+        if roles:
+            members = members.filter(role__in=roles)
+        return members.values('project_id')
+
+    @classmethod
+    def is_member(cls, project, user, *roles):
+        members = cls.objects.filter(project=project, user=user)
+        if roles:
+            members = members.filter(role__in=roles)
+        return members.exists()
+
+    @classmethod
+    def sync_projects(cls, projects):
+        """
+        Bring memberships in line with the projects' assignment fields.
+
+        Called by the Project post_save receiver; code that changes assignments
+        with queryset.update() or bulk_update() must call it itself.
+        """
+        projects = list(projects)
+        if not projects:
+            return
+        wanted = {
+            (project.pk, user_id, role)
+            for project in projects
+            for role, field in cls.ROLE_FIELDS.items()
+            if (user_id := getattr(project, f'{field}_id')) is not None
+        }
+        existing = {
+            (project_id, user_id, role): pk
+            for pk, project_id, user_id, role in cls.objects.filter(project__in=projects).values_list(
+                'pk', 'project_id', 'user_id', 'role'
+            )
+        }
+        stale = [pk for key, pk in existing.items() if key not in wanted]
+        if stale:
+            cls.objects.filter(pk__in=stale).delete()
+        cls.objects.bulk_create(
+            [
+                cls(project_id=project_id, user_id=user_id, role=role)
+                for project_id, user_id, role in wanted - existing.keys()
+            ],
+            ignore_conflicts=True,
+        )
+
+
+@receiver(post_save, sender=Project)
+def sync_project_members(sender, instance, created, update_fields=None, **kwargs):
+    """Mirror assignment changes into ProjectMember"""
+    if kwargs.get('raw'):
+        return
+    if update_fields is not None and not set(update_fields) & set(ProjectMember.ROLE_FIELDS.values()):
+        return
+    ProjectMember.sync_projects([instance])
+
+
+class ProjectCard(models.Model):
+    """
+    Denormalized read model behind the project dashboards.
+
+    Rebuilt from the project and its payment, valuations, history and
+    cancellation requests whenever one of them changes (see projects/cards.py),
+    so list screens read a single table.
+    """
+
+    project = models.OneToOneField(
+        Project,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='card'
+    )
+    title = models.CharField(max_length=200)
+    status = models.CharField(max_length=20, choices=Project.STATUS_CHOICES)
+    priority = models.CharField(max_length=10, choices=Project.PRIORITY_CHOICES)
+    start_date = models.DateField(null=True, blank=True)
+    end_date = models.DateField(null=True, blank=True)
+    estimated_value = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    project_created_at = models.DateTimeField()
+
+    coordinator_name = models.CharField(max_length=300, blank=True)
+    field_officer_name = models.CharField(max_length=300, blank=True)
+    client_name = models.CharField(max_length=300, blank=True)
+    agent_name = models.CharField(max_length=300, blank=True)
+    accessor_name = models.CharField(max_length=300, blank=True)
+    senior_valuer_name = models.CharField(max_length=300, blank=True)
+
+    payment_status = models.CharField(
+        max_length=20,
+        choices=ProjectPayment.PAYMENT_STATUS_CHOICES,
+        null=True,
+        blank=True
+    )
+    valuations_count = models.PositiveIntegerField(default=0)
+    valuation_status_counts = models.JSONField(default=dict, blank=True)
+
+    latest_event_status = models.CharField(max_length=20, blank=True)
+    latest_event_stage = models.CharField(max_length=100, blank=True)
+    latest_event_notes = models.TextField(blank=True)
+    latest_event_at = models.DateTimeField(null=True, blank=True)
+
+    pending_cancellation = models.BooleanField(default=False)
+    cancellation_requested_at = models.DateTimeField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        db_table = 'project_cards'
+        verbose_name = 'Project Card'
+        verbose_name_plural = 'Project Cards'
+        ordering = ['-project_created_at']
+        indexes = [
+            models.Index(fields=['-project_created_at', '-project'], name='project_card_list_idx'),
+        ]
+
+    def __str__(self):
+        return f"Card: {self.title}"
+
+
+def _refresh_card(project_id):
+    from .cards import queue_card_refresh
+    if project_id is not None:
+        queue_card_refresh(project_id)
+
+
+@receiver(post_save, sender=Project)
+def refresh_card_for_project(sender, instance, **kwargs):
+    if not kwargs.get('raw'):
+        _refresh_card(instance.pk)
+
+
+@receiver(post_save, sender=ProjectPayment)
+@receiver(post_delete, sender=ProjectPayment)
+@receiver(post_save, sender=ProjectStatusHistory)
+@receiver(post_delete, sender=ProjectStatusHistory)
+@receiver(post_save, sender=ProjectCancellationRequest)
+@receiver(post_delete, sender=ProjectCancellationRequest)
+@receiver(post_save, sender='valuations.Valuation')
+@receiver(post_delete, sender='valuations.Valuation')
+def refresh_card_for_related(sender, instance, **kwargs):
+    if not kwargs.get('raw'):
+        _refresh_card(instance.project_id)
+
+
+@receiver(post_save, sender=User)
+def refresh_cards_for_user(sender, instance, created, update_fields=None, **kwargs):
+    """Assignee names are copied onto cards, so renames have to reach them"""
+    if created or kwargs.get('raw'):
+        return
+    if update_fields is not None and not set(update_fields) & {'first_name', 'last_name', 'username'}:
+        return
+    for project_id in ProjectMember.objects.filter(user=instance).values_list('project_id', flat=True).distinct():
+        _refresh_card(project_id)
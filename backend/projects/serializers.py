@@ -1,6 +1,10 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from .models import Project, ProjectDocument, ProjectStatusHistory, ProjectPayment, ProjectCancellationRequest, CommissionReport
+from django.db.models import Prefetch
+from auditra_backend.fieldsets import DynamicFieldsMixin, related_count
+from valuations.models import Valuation
+from valuations.serializers import ValuationSerializer
+from .models import Project, ProjectCard, ProjectDocument, ProjectStatusHistory, ProjectPayment, ProjectCancellationRequest, CommissionReport
 
 
 class ProjectPaymentSerializer(serializers.ModelSerializer):
@@ -128,7 +132,7 @@ class ProjectDocumentSerializer(serializers.ModelSerializer):
         return None
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     coordinator_username = serializers.CharField(source='coordinator.username', read_only=True)
     coordinator_name = serializers.SerializerMethodField()
     assigned_field_officer_username = serializers.CharField(
@@ -188,8 +192,8 @@ class ProjectSerializer(serializers.ModelSerializer):
     )
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     documents = ProjectDocumentSerializer(many=True, read_only=True)
-    documents_count = serializers.IntegerField(source='documents.count', read_only=True)
-    valuations = serializers.SerializerMethodField()
+    documents_count = serializers.SerializerMethodField()
+    valuations = ValuationSerializer(many=True, read_only=True)
     valuations_count = serializers.SerializerMethodField()
     history = ProjectStatusHistorySerializer(many=True, read_only=True)
     payment = ProjectPaymentSerializer(read_only=True)
@@ -211,6 +215,25 @@ class ProjectSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         )
         read_only_fields = ('coordinator', 'created_at', 'updated_at')
+        expandable_fields = ('documents', 'valuations', 'history', 'payment')
+        related_fields = {
+            'coordinator_name': ['coordinator'],
+            'assigned_field_officer_name': ['assigned_field_officer'],
+            'assigned_client_name': ['assigned_client'],
+            'assigned_agent_name': ['assigned_agent'],
+            'assigned_accessor_name': ['assigned_accessor'],
+            'assigned_senior_valuer_name': ['assigned_senior_valuer'],
+            'documents': [Prefetch('documents', queryset=ProjectDocument.objects.select_related('uploaded_by', 'assigned_to'))],
+            'history': [Prefetch('history', queryset=ProjectStatusHistory.objects.select_related('created_by'))],
+            'payment': [
+                'payment', 'payment__bank_slip_uploaded_by', 'payment__payment_requested_by',
+                'payment__payment_approved_by', 'payment__agent_paid_by',
+            ],
+        }
+        annotated_fields = {
+            'documents_count': related_count(ProjectDocument, 'project'),
+            'valuations_count': related_count(Valuation, 'project'),
+        }
     
     def get_coordinator_name(self, obj):
         if obj.coordinator.first_name or obj.coordinator.last_name:
@@ -253,15 +276,16 @@ class ProjectSerializer(serializers.ModelSerializer):
             return obj.assigned_senior_valuer.username
         return None
     
-    def get_valuations(self, obj):
-        """Get valuations for this project"""
-        # Import here to avoid circular import
-        from valuations.serializers import ValuationSerializer
-        valuations = obj.valuations.all().select_related('field_officer').prefetch_related('photos')
-        return ValuationSerializer(valuations, many=True, context=self.context).data
-    
+    def get_documents_count(self, obj):
+        """Get count of documents, annotated on list querysets"""
+        if hasattr(obj, 'documents_count'):
+            return obj.documents_count
+        return obj.documents.count()
+
     def get_valuations_count(self, obj):
         """Get count of valuations for this project"""
+        if hasattr(obj, 'valuations_count'):
+            return obj.valuations_count
         return obj.valuations.count()
 
 
@@ -377,6 +401,29 @@ class AssignSeniorValuerSerializer(serializers.Serializer):
             raise serializers.ValidationError("User not found.")
 
 
+class BulkAssignmentItemSerializer(serializers.Serializer):
+    """One (project, role, user) assignment in a bulk request"""
+    project_id = serializers.IntegerField()
+    role = serializers.ChoiceField(choices=['field_officer', 'client', 'agent', 'accessor', 'senior_valuer'])
+    user_id = serializers.IntegerField()
+
+
+class BulkAssignmentSerializer(serializers.Serializer):
+    """Serializer for assigning many users to many projects at once"""
+    assignments = BulkAssignmentItemSerializer(many=True, allow_empty=False, max_length=500)
+
+    def validate_assignments(self, value):
+        seen = set()
+        for item in value:
+            key = (item['project_id'], item['role'])
+            if key in seen:
+                raise serializers.ValidationError(
+                    f"Project {item['project_id']} has more than one {item['role']} assignment."
+                )
+            seen.add(key)
+        return value
+
+
 class ProjectCancellationRequestSerializer(serializers.ModelSerializer):
     """Serializer for project cancellation requests"""
     status_display = serializers.CharField(source='get_status_display', read_only=True)
@@ -456,3 +503,38 @@ class CommissionReportSerializer(serializers.ModelSerializer):
                 return request.build_absolute_uri(obj.report_file.url)
             return obj.report_file.url
         return None
+
+
+class ProjectCardSerializer(serializers.ModelSerializer):
+    """Dashboard card served from the ProjectCard read model"""
+    id = serializers.IntegerField(source='project_id', read_only=True)
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    priority_display = serializers.CharField(source='get_priority_display', read_only=True)
+    payment_status_display = serializers.CharField(source='get_payment_status_display', read_only=True, allow_null=True)
+
+    class Meta:
+        model = ProjectCard
+        fields = (
+            'id', 'title', 'status', 'status_display', 'priority', 'priority_display',
+            'start_date', 'end_date', 'estimated_value', 'project_created_at',
+            'coordinator_name', 'field_officer_name', 'client_name', 'agent_name',
+            'accessor_name', 'senior_valuer_name', 'payment_status', 'payment_status_display',
+            'valuations_count', 'valuation_status_counts', 'latest_event_status',
+            'latest_event_stage', 'latest_event_notes', 'latest_event_at',
+            'pending_cancellation', 'cancellation_requested_at', 'updated_at'
+        )
+        read_only_fields = fields
+
+
+class AssigneeSerializer(serializers.ModelSerializer):
+    """Candidate assignee with their current project load"""
+    full_name = serializers.SerializerMethodField()
+    assigned_projects_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = User
+        fields = ('id', 'username', 'email', 'first_name', 'last_name', 'full_name', 'assigned_projects_count')
+        read_only_fields = fields
+
+    def get_full_name(self, obj):
+        return f"{obj.first_name} {obj.last_name}".strip() or obj.username
@@ -5,6 +5,7 @@ app_name = 'projects'
 
 urlpatterns = [
     path('', views.ProjectListView.as_view(), name='project-list'),
+    path('cards/', views.ProjectCardListView.as_view(), name='project-cards'),
     path('check-email/', views.CheckUserByEmailView.as_view(), name='check-email'),
     path('<int:pk>/', views.ProjectDetailView.as_view(), name='project-detail'),
     path('<int:project_id>/assign-field-officer/', views.AssignFieldOfficerView.as_view(), name='assign-field-officer'),
@@ -17,6 +18,8 @@ urlpatterns = [
     path('agents/', views.AvailableAgentsView.as_view(), name='available-agents'),
     path('accessors/', views.AvailableAccessorsView.as_view(), name='available-accessors'),
     path('senior-valuers/', views.AvailableSeniorValuersView.as_view(), name='available-senior-valuers'),
+    path('assignees/<str:role>/', views.AssigneeListView.as_view(), name='assignees'),
+    path('bulk-assign/', views.BulkAssignView.as_view(), name='bulk-assign'),
     path('users/<int:user_id>/projects/<str:role_type>/', views.UserAssignedProjectsView.as_view(), name='user-assigned-projects'),
     path('documents/', views.ProjectDocumentView.as_view(), name='project-document-create'),
     path('documents/<int:pk>/', views.ProjectDocumentDeleteView.as_view(), name='project-document-delete'),
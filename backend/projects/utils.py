@@ -287,3 +287,70 @@ def process_agent_for_project(project, agent_info):
     else:
         return None, False, "Failed to create agent account"
 
+
+
+# Statuses non-coordinator participants are allowed to see
+VISIBLE_PROJECT_STATUSES = ['pending', 'in_progress', 'completed']
+
+# Statuses counted as a participant's active workload
+ACTIVE_PROJECT_STATUSES = ['pending', 'in_progress']
+
+# Role -> Project field linking the user to the projects they participate in
+ROLE_PROJECT_FIELDS = {
+    'field_officer': 'assigned_field_officer',
+    'client': 'assigned_client',
+    'agent': 'assigned_agent',
+    'accessor': 'assigned_accessor',
+    'senior_valuer': 'assigned_senior_valuer',
+}
+
+
+def get_visible_projects(user, queryset=None):
+    """
+    Return the Project queryset visible to a user based on their role.
+
+    Coordinators see every project they created, assigned participants see
+    their pending/in-progress/completed projects and staff see everything.
+    Membership is resolved through the ProjectMember index. Pass `queryset`
+    to filter another table keyed and statused like Project (e.g. ProjectCard).
+    """
+    from .models import Project, ProjectMember
+
+    if queryset is None:
+        queryset = Project.objects.all()
+
+    try:
+        user_role = user.role.role if hasattr(user, 'role') else None
+    except Exception:
+        user_role = None
+
+    if user_role == 'coordinator':
+        return queryset.filter(pk__in=ProjectMember.project_ids(user, 'coordinator'))
+    if user_role in ROLE_PROJECT_FIELDS:
+        return queryset.filter(
+            pk__in=ProjectMember.project_ids(user, user_role),
+            status__in=VISIBLE_PROJECT_STATUSES
+        )
+    if user.is_staff or user.is_superuser:
+        return queryset
+    return queryset.none()
+
+
+def get_assignees_with_load(role, statuses=ACTIVE_PROJECT_STATUSES):
+    """
+    Active users holding `role`, annotated with `assigned_projects_count`.
+
+    The count comes from one GROUP BY over ProjectMember; pass statuses=None
+    to count every project rather than only active ones.
+    """
+    from django.db.models import Count, Q
+
+    memberships = Q(project_memberships__role=role)
+    if statuses is not None:
+        memberships &= Q(project_memberships__project__status__in=statuses)
+    return User.objects.filter(
+        role__role=role,
+        is_active=True
+    ).annotate(
+        assigned_projects_count=Count('project_memberships', filter=memberships)
+    )
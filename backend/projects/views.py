@@ -4,11 +4,15 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
-from .models import Project, ProjectDocument, ProjectStatusHistory, ProjectPayment, ProjectCancellationRequest, CommissionReport
+from .models import Project, ProjectCard, ProjectDocument, ProjectMember, ProjectStatusHistory, ProjectPayment, ProjectCancellationRequest, CommissionReport
 from .serializers import (
     ProjectSerializer,
+    ProjectCardSerializer,
+    AssigneeSerializer,
+    BulkAssignmentSerializer,
     ProjectCreateSerializer,
     ProjectDocumentSerializer,
     ProjectPaymentSerializer,
@@ -20,7 +24,13 @@ from .serializers import (
     AssignAccessorSerializer,
     AssignSeniorValuerSerializer
 )
-from .utils import check_user_by_email, process_client_for_project, process_agent_for_project
+from auditra_backend.conditional import conditional_get, aggregate_version
+from auditra_backend.fieldsets import DynamicFieldsViewMixin
+from auditra_backend.pagination import KeysetPagination
+from .utils import (
+    check_user_by_email, process_client_for_project, process_agent_for_project, get_visible_projects,
+    get_assignees_with_load, ACTIVE_PROJECT_STATUSES, ROLE_PROJECT_FIELDS,
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -91,9 +101,25 @@ class CheckUserByEmailView(APIView):
             })
 
 
-class ProjectListView(generics.ListCreateAPIView):
+@conditional_get
+class ProjectListView(DynamicFieldsViewMixin, generics.ListCreateAPIView):
     """List all projects or create a new project"""
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    def get_version_signature(self):
+        # Everything ProjectSerializer nests, without building the list itself
+        from valuations.models import Valuation, ValuationPhoto
+        projects = get_visible_projects(self.request.user)
+        valuations = Valuation.objects.filter(project__in=projects)
+        return [
+            aggregate_version(projects),
+            aggregate_version(valuations),
+            aggregate_version(ValuationPhoto.objects.filter(valuation__in=valuations)),
+            aggregate_version(ProjectDocument.objects.filter(project__in=projects)),
+            aggregate_version(ProjectStatusHistory.objects.filter(project__in=projects), 'created_at'),
+            aggregate_version(ProjectPayment.objects.filter(project__in=projects)),
+        ]
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -101,47 +127,8 @@ class ProjectListView(generics.ListCreateAPIView):
         return ProjectSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        
-        # Get user role safely
-        user_role = get_user_role(user)
-        
-        # Coordinators see all projects they created
-        if user_role == 'coordinator':
-            queryset = Project.objects.filter(coordinator=user)
-        
-        # Field officers see only assigned projects (pending, in_progress, completed)
-        elif user_role == 'field_officer':
-            queryset = Project.objects.filter(assigned_field_officer=user, status__in=['pending', 'in_progress', 'completed'])
-
-        # Clients see only assigned projects (pending, in_progress, completed)
-        elif user_role == 'client':
-            queryset = Project.objects.filter(assigned_client=user, status__in=['pending', 'in_progress', 'completed'])
-
-        # Agents see only assigned projects (pending, in_progress, completed)
-        elif user_role == 'agent':
-            queryset = Project.objects.filter(assigned_agent=user, status__in=['pending', 'in_progress', 'completed'])
-
-        # Accessors see only assigned projects (pending, in_progress, completed)
-        elif user_role == 'accessor':
-            queryset = Project.objects.filter(assigned_accessor=user, status__in=['pending', 'in_progress', 'completed'])
-
-        # Senior valuers see only assigned projects (pending, in_progress, completed)
-        elif user_role == 'senior_valuer':
-            queryset = Project.objects.filter(assigned_senior_valuer=user, status__in=['pending', 'in_progress', 'completed'])
-        
-        # Admins see all projects
-        elif user.is_staff or user.is_superuser:
-            queryset = Project.objects.all()
-        else:
-            queryset = Project.objects.none()
-        
-        # Optimize queryset with select_related and prefetch_related
-        return queryset.select_related(
-            'coordinator', 'assigned_field_officer'
-        ).prefetch_related(
-            'documents', 'valuations__field_officer', 'valuations__photos', 'history'
-        )
+        # Joins and prefetches follow the requested shape, see DynamicFieldsViewMixin
+        return get_visible_projects(self.request.user)
     
     def perform_create(self, serializer):
         # Only coordinators can create projects
@@ -268,38 +255,31 @@ class ProjectListView(generics.ListCreateAPIView):
                 logger.warning(f"Submission {submission_id} not found or not assigned to coordinator")
 
 
-class ProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
+@conditional_get
+class ProjectCardListView(generics.ListAPIView):
+    """Dashboard project cards, read from the ProjectCard table"""
+    permission_classes = [IsAuthenticated]
+    serializer_class = ProjectCardSerializer
+    pagination_class = KeysetPagination
+
+    def get_version_signature(self):
+        return [aggregate_version(self.get_queryset())]
+
+    def get_queryset(self):
+        queryset = get_visible_projects(self.request.user, ProjectCard.objects.all())
+        status_filter = self.request.query_params.get('status')
+        if status_filter:
+            queryset = queryset.filter(status=status_filter)
+        return queryset
+
+
+class ProjectDetailView(DynamicFieldsViewMixin, generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update or delete a project"""
     permission_classes = [IsAuthenticated]
     serializer_class = ProjectSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        user_role = get_user_role(user)
-        
-        if user_role == 'coordinator':
-            queryset = Project.objects.filter(coordinator=user)
-        elif user_role == 'field_officer':
-            queryset = Project.objects.filter(assigned_field_officer=user, status__in=['pending', 'in_progress', 'completed'])
-        elif user_role == 'client':
-            queryset = Project.objects.filter(assigned_client=user, status__in=['pending', 'in_progress', 'completed'])
-        elif user_role == 'agent':
-            queryset = Project.objects.filter(assigned_agent=user, status__in=['pending', 'in_progress', 'completed'])
-        elif user_role == 'accessor':
-            queryset = Project.objects.filter(assigned_accessor=user, status__in=['pending', 'in_progress', 'completed'])
-        elif user_role == 'senior_valuer':
-            queryset = Project.objects.filter(assigned_senior_valuer=user, status__in=['pending', 'in_progress', 'completed'])
-        elif user.is_staff or user.is_superuser:
-            queryset = Project.objects.all()
-        else:
-            queryset = Project.objects.none()
-
-        return queryset.select_related(
-            'coordinator', 'assigned_field_officer', 'assigned_client', 
-            'assigned_agent', 'assigned_accessor', 'assigned_senior_valuer'
-        ).prefetch_related(
-            'documents', 'valuations__field_officer', 'valuations__photos', 'history'
-        )
+        return get_visible_projects(self.request.user)
     
     def perform_update(self, serializer):
         # Only coordinators can update projects
@@ -425,118 +405,240 @@ class AssignFieldOfficerView(APIView):
         }, status=status.HTTP_200_OK)
 
 
-class AvailableFieldOfficersView(APIView):
-    """Get list of available field officers for assignment"""
+class AvailableAssigneesView(APIView):
+    """Base for the per-role "available for assignment" lists"""
     permission_classes = [IsAuthenticated]
-    
+    role = None
+    response_key = None
+    role_label = None
+    # Statuses counted in assigned_projects_count (None counts every project)
+    count_statuses = None
+
     def get(self, request):
-        # Only coordinators can view field officers
         user_role = get_user_role(request.user)
         if user_role != 'coordinator':
             return Response({
-                'error': 'Only coordinators can view field officers'
+                'error': f'Only coordinators can view {self.role_label}'
             }, status=status.HTTP_403_FORBIDDEN)
-        
-        field_officers = User.objects.filter(
-            role__role='field_officer',
-            is_active=True
-        ).select_related('role')
-        
-        officers_data = []
-        for officer in field_officers:
-            assigned_projects_count = Project.objects.filter(
-                assigned_field_officer=officer,
-                status__in=['pending', 'in_progress']
-            ).count()
-            
-            officers_data.append({
-                'id': officer.id,
-                'username': officer.username,
-                'email': officer.email,
-                'first_name': officer.first_name,
-                'last_name': officer.last_name,
-                'full_name': f"{officer.first_name} {officer.last_name}".strip() or officer.username,
-                'assigned_projects_count': assigned_projects_count,
-            })
-        
+
+        assignees = get_assignees_with_load(self.role, statuses=self.count_statuses)
         return Response({
-            'field_officers': officers_data
+            self.response_key: AssigneeSerializer(assignees, many=True).data
         }, status=status.HTTP_200_OK)
 
 
-class AvailableClientsView(APIView):
+class AvailableFieldOfficersView(AvailableAssigneesView):
+    """Get list of available field officers for assignment"""
+    role = 'field_officer'
+    response_key = 'field_officers'
+    role_label = 'field officers'
+    count_statuses = ACTIVE_PROJECT_STATUSES
+
+
+class AvailableClientsView(AvailableAssigneesView):
     """Get list of available clients for assignment"""
+    role = 'client'
+    response_key = 'clients'
+    role_label = 'clients'
+
+
+class AvailableAgentsView(AvailableAssigneesView):
+    """Get list of available agents for assignment"""
+    role = 'agent'
+    response_key = 'agents'
+    role_label = 'agents'
+
+
+class AvailableAccessorsView(AvailableAssigneesView):
+    """Get list of available accessors for assignment"""
+    role = 'accessor'
+    response_key = 'accessors'
+    role_label = 'accessors'
+
+
+class AvailableSeniorValuersView(AvailableAssigneesView):
+    """Get list of available senior valuers for assignment"""
+    role = 'senior_valuer'
+    response_key = 'senior_valuers'
+    role_label = 'senior valuers'
+
+
+class AssigneeListView(generics.ListAPIView):
+    """
+    Users of one role with their active project counts, for assignment dialogs.
+
+    Supports ?search=, ?ordering=load|-load|name and keyset pagination.
+    """
     permission_classes = [IsAuthenticated]
-    
-    def get(self, request):
-        # Only coordinators can view clients
-        user_role = get_user_role(request.user)
-        if user_role != 'coordinator':
+    serializer_class = AssigneeSerializer
+    pagination_class = KeysetPagination
+
+    ORDERINGS = {
+        'load': ('assigned_projects_count', 'username'),
+        '-load': ('-assigned_projects_count', 'username'),
+        'name': ('first_name', 'last_name', 'username'),
+    }
+
+    def list(self, request, *args, **kwargs):
+        if get_user_role(request.user) != 'coordinator':
             return Response({
-                'error': 'Only coordinators can view clients'
+                'error': 'Only coordinators can view assignees'
             }, status=status.HTTP_403_FORBIDDEN)
-        
-        clients = User.objects.filter(
-            role__role='client',
-            is_active=True
-        ).select_related('role')
-        
-        clients_data = []
-        for client in clients:
-            assigned_projects_count = Project.objects.filter(
-                assigned_client=client
-            ).count()
-            
-            clients_data.append({
-                'id': client.id,
-                'username': client.username,
-                'email': client.email,
-                'first_name': client.first_name,
-                'last_name': client.last_name,
-                'full_name': f"{client.first_name} {client.last_name}".strip() or client.username,
-                'assigned_projects_count': assigned_projects_count,
-            })
-        
-        return Response({
-            'clients': clients_data
-        }, status=status.HTTP_200_OK)
+        if kwargs['role'] not in ROLE_PROJECT_FIELDS:
+            return Response({
+                'error': 'Invalid role type'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        return super().list(request, *args, **kwargs)
 
+    @property
+    def pagination_ordering(self):
+        return self.ORDERINGS.get(self.request.query_params.get('ordering'), self.ORDERINGS['load'])
 
-class AvailableAgentsView(APIView):
-    """Get list of available agents for assignment"""
+    def get_queryset(self):
+        queryset = get_assignees_with_load(self.kwargs['role'])
+        search = self.request.query_params.get('search', '').strip()
+        if search:
+            queryset = queryset.filter(
+                Q(username__icontains=search) |
+                Q(first_name__icontains=search) |
+                Q(last_name__icontains=search) |
+                Q(email__icontains=search)
+            )
+        return queryset.order_by(*self.pagination_ordering, 'pk')
+
+
+class BulkAssignView(APIView):
+    """
+    Apply many (project, role, user) assignments in one transaction.
+
+    History rows and audit entries are written in bulk and each assignee gets
+    a single email listing all of their new projects.
+    """
     permission_classes = [IsAuthenticated]
-    
-    def get(self, request):
-        # Only coordinators can view agents
+
+    AUDIT_ACTIONS = {
+        'field_officer': 'FIELD_OFFICER_ASSIGNED',
+        'client': 'CLIENT_ASSIGNED',
+        'agent': 'AGENT_ASSIGNED',
+        'accessor': 'ACCESSOR_ASSIGNED',
+        'senior_valuer': 'SENIOR_VALUER_ASSIGNED',
+    }
+
+    @transaction.atomic
+    def post(self, request):
         user_role = get_user_role(request.user)
         if user_role != 'coordinator':
             return Response({
-                'error': 'Only coordinators can view agents'
+                'error': 'Only coordinators can assign users to projects'
             }, status=status.HTTP_403_FORBIDDEN)
-        
-        agents = User.objects.filter(
-            role__role='agent',
-            is_active=True
-        ).select_related('role')
-        
-        agents_data = []
-        for agent in agents:
-            assigned_projects_count = Project.objects.filter(
-                assigned_agent=agent
-            ).count()
-            
-            agents_data.append({
-                'id': agent.id,
-                'username': agent.username,
-                'email': agent.email,
-                'first_name': agent.first_name,
-                'last_name': agent.last_name,
-                'full_name': f"{agent.first_name} {agent.last_name}".strip() or agent.username,
-                'assigned_projects_count': assigned_projects_count,
+
+        serializer = BulkAssignmentSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        assignments = serializer.validated_data['assignments']
+
+        projects = Project.objects.select_for_update().filter(
+            id__in={item['project_id'] for item in assignments},
+            coordinator=request.user
+        ).in_bulk()
+        users = User.objects.select_related('role').filter(
+            id__in={item['user_id'] for item in assignments}
+        ).in_bulk()
+
+        errors = []
+        for index, item in enumerate(assignments):
+            user = users.get(item['user_id'])
+            if item['project_id'] not in projects:
+                errors.append({'index': index, 'error': 'Project not found'})
+            elif user is None:
+                errors.append({'index': index, 'error': 'User not found'})
+            elif not hasattr(user, 'role') or user.role.role != item['role']:
+                label = dict(ProjectMember.ROLE_CHOICES)[item['role']].lower()
+                article = 'an' if label[0] in 'aeiou' else 'a'
+                errors.append({'index': index, 'error': f"User must be {article} {label}."})
+        if errors:
+            return Response({
+                'error': 'Some assignments are invalid; nothing was changed',
+                'errors': errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        role_labels = dict(ProjectMember.ROLE_CHOICES)
+        changed_fields = {}
+        history = []
+        audit_entries = []
+        emails = {}
+        ip_address = None
+        try:
+            from system_logs.utils import get_client_ip
+            ip_address = get_client_ip(request)
+        except Exception:
+            pass
+
+        for item in assignments:
+            project = projects[item['project_id']]
+            user = users[item['user_id']]
+            field = ROLE_PROJECT_FIELDS[item['role']]
+            if getattr(project, f'{field}_id') == user.id:
+                continue
+
+            setattr(project, field, user)
+            changed_fields.setdefault(project.id, []).append(field)
+
+            name = f"{user.first_name} {user.last_name}".strip() or user.username
+            role_label = role_labels[item['role']]
+            history.append(ProjectStatusHistory(
+                project=project,
+                status=project.status,
+                notes=f"{role_label} assigned: {name}",
+                created_by=request.user
+            ))
+            audit_entries.append({
+                'action': self.AUDIT_ACTIONS[item['role']],
+                'user': request.user,
+                'target_user': user,
+                'description': f"{role_label} {name} assigned to project: {project.title}",
+                'category': 'project',
+                'ip_address': ip_address,
+                'metadata': {'project_id': project.id, f"{item['role']}_id": user.id, 'bulk': True},
             })
-        
+            if user.email:
+                emails.setdefault(user.email, (name, []))[1].append((project.title, role_label))
+
+        # Saved per project so membership, card and sync receivers still run
+        for project_id, fields in changed_fields.items():
+            projects[project_id].save(update_fields=fields + ['updated_at'])
+        ProjectStatusHistory.objects.bulk_create(history)
+
+        try:
+            from system_logs.utils import log_actions_bulk
+            # Own savepoint: a failed audit write must not roll back the assignments
+            with transaction.atomic():
+                log_actions_bulk(audit_entries)
+        except Exception:
+            pass
+
+        coordinator_name = f'{request.user.first_name} {request.user.last_name}'.strip() or request.user.username
+
+        def send_emails():
+            from authentication.services import EmailService
+            for email, (name, projects_assigned) in emails.items():
+                try:
+                    EmailService.send_project_assignments_summary(
+                        email=email,
+                        name=name,
+                        assignments=projects_assigned,
+                        coordinator_name=coordinator_name,
+                    )
+                except Exception:
+                    logger.exception('Failed to send assignment summary to %s', email)
+
+        if emails:
+            transaction.on_commit(send_emails)
+
         return Response({
-            'agents': agents_data
+            'message': f'{len(history)} assignment(s) applied',
+            'applied': len(history),
+            'skipped': len(assignments) - len(history),
+            'projects': sorted(changed_fields),
         }, status=status.HTTP_200_OK)
 
 
@@ -764,82 +866,6 @@ class AssignSeniorValuerView(APIView):
         }, status=status.HTTP_200_OK)
 
 
-class AvailableAccessorsView(APIView):
-    """Get list of available accessors for assignment"""
-    permission_classes = [IsAuthenticated]
-    
-    def get(self, request):
-        # Only coordinators can view accessors
-        user_role = get_user_role(request.user)
-        if user_role != 'coordinator':
-            return Response({
-                'error': 'Only coordinators can view accessors'
-            }, status=status.HTTP_403_FORBIDDEN)
-        
-        accessors = User.objects.filter(
-            role__role='accessor',
-            is_active=True
-        ).select_related('role')
-        
-        accessors_data = []
-        for accessor in accessors:
-            assigned_projects_count = Project.objects.filter(
-                assigned_accessor=accessor
-            ).count()
-            
-            accessors_data.append({
-                'id': accessor.id,
-                'username': accessor.username,
-                'email': accessor.email,
-                'first_name': accessor.first_name,
-                'last_name': accessor.last_name,
-                'full_name': f"{accessor.first_name} {accessor.last_name}".strip() or accessor.username,
-                'assigned_projects_count': assigned_projects_count,
-            })
-        
-        return Response({
-            'accessors': accessors_data
-        }, status=status.HTTP_200_OK)
-
-
-class AvailableSeniorValuersView(APIView):
-    """Get list of available senior valuers for assignment"""
-    permission_classes = [IsAuthenticated]
-    
-    def get(self, request):
-        # Only coordinators can view senior valuers
-        user_role = get_user_role(request.user)
-        if user_role != 'coordinator':
-            return Response({
-                'error': 'Only coordinators can view senior valuers'
-            }, status=status.HTTP_403_FORBIDDEN)
-        
-        senior_valuers = User.objects.filter(
-            role__role='senior_valuer',
-            is_active=True
-        ).select_related('role')
-        
-        senior_valuers_data = []
-        for valuer in senior_valuers:
-            assigned_projects_count = Project.objects.filter(
-                assigned_senior_valuer=valuer
-            ).count()
-            
-            senior_valuers_data.append({
-                'id': valuer.id,
-                'username': valuer.username,
-                'email': valuer.email,
-                'first_name': valuer.first_name,
-                'last_name': valuer.last_name,
-                'full_name': f"{valuer.first_name} {valuer.last_name}".strip() or valuer.username,
-                'assigned_projects_count': assigned_projects_count,
-            })
-        
-        return Response({
-            'senior_valuers': senior_valuers_data
-        }, status=status.HTTP_200_OK)
-
-
 class ProjectDocumentView(generics.CreateAPIView):
     """Upload document to a project"""
     permission_classes = [IsAuthenticated]
@@ -852,10 +878,10 @@ class ProjectDocumentView(generics.CreateAPIView):
         # Check if user is coordinator of the project
         try:
             project = Project.objects.get(id=project_id)
-            if project.coordinator != self.request.user:
+            if project.coordinator_id != self.request.user.id:
                 if not (hasattr(self.request.user, 'role') and 
                        self.request.user.role.role == 'field_officer' and
-                       project.assigned_field_officer == self.request.user):
+                       ProjectMember.is_member(project, self.request.user, 'field_officer')):
                     raise serializers.ValidationError("You don't have permission to add documents to this project.")
         except Project.DoesNotExist:
             raise serializers.ValidationError("Project not found.")
@@ -866,11 +892,8 @@ class ProjectDocumentView(generics.CreateAPIView):
             try:
                 assigned_to = User.objects.get(id=assigned_to_id)
                 # Verify the user is actually assigned to this project
-                if (assigned_to != project.assigned_field_officer and
-                    assigned_to != project.assigned_client and
-                    assigned_to != project.assigned_agent and
-                    assigned_to != project.assigned_accessor and
-                    assigned_to != project.assigned_senior_valuer):
+                participant_roles = [role for role in ProjectMember.ROLE_FIELDS if role != 'coordinator']
+                if not ProjectMember.is_member(project, assigned_to, *participant_roles):
                     raise serializers.ValidationError("Selected user is not assigned to this project.")
             except User.DoesNotExist:
                 raise serializers.ValidationError("Assigned user not found.")
@@ -906,9 +929,9 @@ class ProjectDocumentDeleteView(generics.DestroyAPIView):
         # Coordinators can delete documents from their projects
         # Field officers can delete documents from assigned projects
         if user_role == 'coordinator':
-            return ProjectDocument.objects.filter(project__coordinator=user)
+            return ProjectDocument.objects.filter(project__in=ProjectMember.project_ids(user, 'coordinator'))
         elif user_role == 'field_officer':
-            return ProjectDocument.objects.filter(project__assigned_field_officer=user)
+            return ProjectDocument.objects.filter(project__in=ProjectMember.project_ids(user, 'field_officer'))
         return ProjectDocument.objects.none()
 
     def perform_destroy(self, instance):
@@ -1040,27 +1063,24 @@ class UserAssignedProjectsView(APIView):
                 'error': 'User not found'
             }, status=status.HTTP_404_NOT_FOUND)
         
-        # Get projects based on role type
-        if role_type == 'field_officer':
-            projects = Project.objects.filter(assigned_field_officer=user).order_by('-created_at')
-        elif role_type == 'accessor':
-            projects = Project.objects.filter(assigned_accessor=user).order_by('-created_at')
-        elif role_type == 'senior_valuer':
-            projects = Project.objects.filter(assigned_senior_valuer=user).order_by('-created_at')
-        else:
+        if role_type not in ('field_officer', 'accessor', 'senior_valuer'):
             return Response({
                 'error': 'Invalid role type'
             }, status=status.HTTP_400_BAD_REQUEST)
-        
+
+        memberships = ProjectMember.objects.filter(
+            user=user, role=role_type
+        ).select_related('project').order_by('-project__created_at')
+
         projects_data = []
-        for project in projects:
-            # Get the assignment date (use created_at as proxy, or we could add an assigned_at field)
+        for membership in memberships:
+            project = membership.project
             projects_data.append({
                 'id': project.id,
                 'title': project.title,
                 'status': project.status,
                 'status_display': project.get_status_display(),
-                'assigned_date': project.created_at.isoformat(),  # Using created_at as assigned date
+                'assigned_date': membership.created_at.isoformat(),
             })
         
         return Response({
@@ -1576,10 +1596,14 @@ class ClientPaymentOverviewView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        projects = Project.objects.filter(assigned_client=request.user).select_related('coordinator')
-        
+        projects = Project.objects.filter(
+            pk__in=ProjectMember.project_ids(request.user, 'client')
+        ).select_related('coordinator', 'payment')
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(projects, request, view=self)
+
         result = []
-        for project in projects:
+        for project in (projects if page is None else page):
             payment_data = None
             try:
                 payment = project.payment
@@ -1599,9 +1623,10 @@ class ClientPaymentOverviewView(APIView):
                 'payment': payment_data
             })
 
-        return Response({
-            'projects': result
-        }, status=status.HTTP_200_OK)
+        data = {'projects': result}
+        if page is not None:
+            data.update(paginator.get_links())
+        return Response(data, status=status.HTTP_200_OK)
 
 
 class AgentPaymentOverviewView(APIView):
@@ -1616,10 +1641,14 @@ class AgentPaymentOverviewView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        projects = Project.objects.filter(assigned_agent=request.user).select_related('coordinator')
+        projects = Project.objects.filter(
+            pk__in=ProjectMember.project_ids(request.user, 'agent')
+        ).select_related('coordinator', 'payment')
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(projects, request, view=self)
 
         result = []
-        for project in projects:
+        for project in (projects if page is None else page):
             payment_data = None
             try:
                 payment = project.payment
@@ -1639,9 +1668,10 @@ class AgentPaymentOverviewView(APIView):
                 'payment': payment_data
             })
 
-        return Response({
-            'projects': result
-        }, status=status.HTTP_200_OK)
+        data = {'projects': result}
+        if page is not None:
+            data.update(paginator.get_links())
+        return Response(data, status=status.HTTP_200_OK)
 
 
 class RecordAgentPaymentView(APIView):
@@ -1838,11 +1868,18 @@ class GetCancellationRequestsView(APIView):
                 'rejected': all_requests.filter(status='rejected').count(),
             }
 
-        serializer = ProjectCancellationRequestSerializer(queryset, many=True, context={'request': request})
-        return Response({
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = ProjectCancellationRequestSerializer(
+            queryset if page is None else page, many=True, context={'request': request}
+        )
+        data = {
             'requests': serializer.data,
             'summary': summary
-        }, status=status.HTTP_200_OK)
+        }
+        if page is not None:
+            data.update(paginator.get_links())
+        return Response(data, status=status.HTTP_200_OK)
 
 
 class ApproveCancellationView(APIView):
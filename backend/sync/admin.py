@@ -0,0 +1,8 @@
+from django.contrib import admin
+from .models import Tombstone
+
+
+@admin.register(Tombstone)
+class TombstoneAdmin(admin.ModelAdmin):
+    list_display = ('model', 'object_id', 'project_ref', 'recipient_ref', 'deleted_at')
+    list_filter = ('model',)
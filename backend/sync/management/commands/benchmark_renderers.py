@@ -0,0 +1,58 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from attendance.views import AttendanceSummaryView
+from auditra_backend.renderers import MessagePackRenderer
+from projects.views import ProjectListView
+
+
+class Command(BaseCommand):
+    help = 'Compare payload size and encode time of JSON and MessagePack for the project list and attendance summary'
+
+    def add_arguments(self, parser):
+        parser.add_argument('username', help='User whose view of the endpoints is rendered')
+        parser.add_argument('--iterations', type=int, default=200, help='Encodes per renderer (default 200)')
+        parser.add_argument('--period', default='monthly', help='Attendance summary period (default monthly)')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['username']}' does not exist")
+
+        factory = APIRequestFactory()
+        endpoints = [
+            ('Project list', ProjectListView.as_view(), '/api/projects/', {}),
+            ('Attendance summary', AttendanceSummaryView.as_view(), '/api/attendance/summary/', {'period': options['period']}),
+        ]
+        renderers = [('JSON', JSONRenderer()), ('MessagePack', MessagePackRenderer())]
+        iterations = options['iterations']
+
+        for name, view, path, params in endpoints:
+            request = factory.get(path, params)
+            force_authenticate(request, user=user)
+            response = view(request)
+            if response.status_code != 200:
+                self.stdout.write(self.style.WARNING(f'{name}: HTTP {response.status_code}, skipped'))
+                continue
+
+            self.stdout.write(f'\n{name} ({path})')
+            results = {}
+            for label, renderer in renderers:
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    body = renderer.render(response.data)
+                elapsed_ms = (time.perf_counter() - start) * 1000 / iterations
+                results[label] = (len(body), elapsed_ms)
+                self.stdout.write(f'  {label:<12} {len(body):>10,} bytes  {elapsed_ms:8.3f} ms/encode')
+
+            json_size, json_time = results['JSON']
+            msgpack_size, msgpack_time = results['MessagePack']
+            self.stdout.write(self.style.SUCCESS(
+                f'  MessagePack is {100 * (1 - msgpack_size / json_size):.1f}% smaller and '
+                f'{json_time / msgpack_time if msgpack_time else 0:.2f}x the JSON encode speed'
+            ))
@@ -0,0 +1,32 @@
+# Generated by Django 5.0 on 2026-10-19 01:57
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(choices=[('project', 'Project'), ('valuation', 'Valuation'), ('valuation_photo', 'Valuation Photo'), ('project_document', 'Project Document'), ('notification', 'Notification')], max_length=50)),
+                ('object_id', models.BigIntegerField()),
+                ('project_ref', models.BigIntegerField(blank=True, db_index=True, null=True)),
+                ('recipient_ref', models.BigIntegerField(blank=True, db_index=True, null=True)),
+                ('deleted_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Tombstone',
+                'verbose_name_plural': 'Tombstones',
+                'db_table': 'sync_tombstones',
+                'ordering': ['deleted_at', 'id'],
+            },
+        ),
+    ]
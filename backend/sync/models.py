@@ -0,0 +1,144 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import models
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from projects.models import Project, ProjectDocument
+from projects.utils import ROLE_PROJECT_FIELDS, VISIBLE_PROJECT_STATUSES
+from valuations.models import Valuation, ValuationPhoto, Notification
+
+
+class Tombstone(models.Model):
+    """Records a deleted (or no longer visible) record so offline clients can drop it"""
+
+    MODEL_CHOICES = [
+        ('project', 'Project'),
+        ('valuation', 'Valuation'),
+        ('valuation_photo', 'Valuation Photo'),
+        ('project_document', 'Project Document'),
+        ('notification', 'Notification'),
+    ]
+
+    model = models.CharField(max_length=50, choices=MODEL_CHOICES)
+    object_id = models.BigIntegerField()
+    # Plain ids rather than foreign keys: the referenced rows are usually gone
+    project_ref = models.BigIntegerField(null=True, blank=True, db_index=True)
+    recipient_ref = models.BigIntegerField(null=True, blank=True, db_index=True)
+    deleted_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = 'sync_tombstones'
+        verbose_name = 'Tombstone'
+        verbose_name_plural = 'Tombstones'
+        ordering = ['deleted_at', 'id']
+
+    def __str__(self):
+        return f"{self.model} #{self.object_id} deleted at {self.deleted_at}"
+
+
+_collected = ContextVar('sync_collected_tombstones', default=None)
+
+
+@contextmanager
+def collect_tombstones():
+    """
+    Gather the tombstones written by deletion receivers inside the block and
+    insert them with one bulk_create on exit, for batch deletes that would
+    otherwise write one row per deleted object
+    """
+    tombstones = []
+    token = _collected.set(tombstones)
+    try:
+        yield
+        Tombstone.objects.bulk_create(tombstones, batch_size=1000)
+    finally:
+        _collected.reset(token)
+
+
+def _record_tombstone(**fields):
+    tombstones = _collected.get()
+    if tombstones is None:
+        Tombstone.objects.create(**fields)
+    else:
+        tombstones.append(Tombstone(**fields))
+
+
+def project_audience(project):
+    """Return the ids of the non-staff users who can currently see a project"""
+    audience = {project.coordinator_id}
+    if project.status in VISIBLE_PROJECT_STATUSES:
+        for field in ROLE_PROJECT_FIELDS.values():
+            user_id = getattr(project, f'{field}_id')
+            if user_id:
+                audience.add(user_id)
+    audience.discard(None)
+    return audience
+
+
+def _project_tombstones(project_id, user_ids, include_staff=False):
+    tombstones = [
+        Tombstone(model='project', object_id=project_id, project_ref=project_id, recipient_ref=user_id)
+        for user_id in user_ids
+    ]
+    if include_staff:
+        # Staff see every project, so deletions are broadcast with no recipient
+        tombstones.append(Tombstone(model='project', object_id=project_id, project_ref=project_id))
+    if tombstones:
+        Tombstone.objects.bulk_create(tombstones)
+
+
+@receiver(pre_save, sender=Project)
+def remember_project_audience(sender, instance, **kwargs):
+    """Capture who could see the project before an assignment or status change"""
+    if not instance.pk:
+        return
+    fields = ['coordinator_id', 'status'] + [f'{field}_id' for field in ROLE_PROJECT_FIELDS.values()]
+    previous = Project.objects.filter(pk=instance.pk).values(*fields).first()
+    instance._sync_previous_audience = project_audience(Project(**previous)) if previous else set()
+
+
+@receiver(post_save, sender=Project)
+def record_project_audience_changes(sender, instance, created, **kwargs):
+    """Tombstone the project for users who lost visibility of it"""
+    previous = getattr(instance, '_sync_previous_audience', None)
+    if created or previous is None:
+        return
+    del instance._sync_previous_audience
+    current = project_audience(instance)
+    _project_tombstones(instance.pk, previous - current)
+    if current - previous:
+        # Newly added users have never pulled this project's existing records;
+        # bump them so they appear in the next changes page
+        now = timezone.now()
+        Valuation.objects.filter(project=instance).update(updated_at=now)
+        ValuationPhoto.objects.filter(valuation__project=instance).update(updated_at=now)
+        ProjectDocument.objects.filter(project=instance).update(updated_at=now)
+
+
+@receiver(post_delete, sender=Project)
+def record_project_deletion(sender, instance, **kwargs):
+    _project_tombstones(instance.pk, project_audience(instance), include_staff=True)
+
+
+@receiver(post_delete, sender=Valuation)
+def record_valuation_deletion(sender, instance, **kwargs):
+    _record_tombstone(model='valuation', object_id=instance.pk, project_ref=instance.project_id)
+
+
+@receiver(post_delete, sender=ValuationPhoto)
+def record_valuation_photo_deletion(sender, instance, **kwargs):
+    project_id = Valuation.objects.filter(pk=instance.valuation_id).values_list('project_id', flat=True).first()
+    _record_tombstone(model='valuation_photo', object_id=instance.pk, project_ref=project_id)
+
+
+@receiver(post_delete, sender=ProjectDocument)
+def record_project_document_deletion(sender, instance, **kwargs):
+    _record_tombstone(model='project_document', object_id=instance.pk, project_ref=instance.project_id)
+
+
+@receiver(post_delete, sender=Notification)
+def record_notification_deletion(sender, instance, **kwargs):
+    _record_tombstone(model='notification', object_id=instance.pk, recipient_ref=instance.user_id)
@@ -0,0 +1,109 @@
+from rest_framework import serializers
+from projects.models import Project, ProjectDocument
+from valuations.models import Valuation, ValuationPhoto, Notification
+from valuations.serializers import ValuationHistorySerializer
+
+
+class FileUrlMixin:
+    """Builds absolute URLs for file fields when a request is available"""
+
+    def build_file_url(self, file_field):
+        if not file_field:
+            return None
+        request = self.context.get('request')
+        if request:
+            return request.build_absolute_uri(file_field.url)
+        return file_field.url
+
+
+class ProjectSyncSerializer(serializers.ModelSerializer):
+    """Flat project row for the changes feed (related records are synced separately)"""
+
+    class Meta:
+        model = Project
+        fields = '__all__'
+
+
+class ValuationSyncSerializer(FileUrlMixin, serializers.ModelSerializer):
+    """Flat valuation row for the changes feed"""
+
+    submitted_report_url = serializers.SerializerMethodField()
+    final_report_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Valuation
+        fields = '__all__'
+
+    def get_submitted_report_url(self, obj):
+        return self.build_file_url(obj.submitted_report)
+
+    def get_final_report_url(self, obj):
+        return self.build_file_url(obj.final_report)
+
+
+class ValuationPhotoSyncSerializer(FileUrlMixin, serializers.ModelSerializer):
+    """Valuation photo row for the changes feed"""
+
+    project = serializers.IntegerField(source='valuation.project_id', read_only=True)
+    photo_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ValuationPhoto
+        fields = ['id', 'valuation', 'project', 'photo', 'photo_url', 'caption', 'uploaded_at', 'updated_at']
+
+    def get_photo_url(self, obj):
+        return self.build_file_url(obj.photo)
+
+
+class ProjectDocumentSyncSerializer(FileUrlMixin, serializers.ModelSerializer):
+    """Project document row for the changes feed"""
+
+    file_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ProjectDocument
+        fields = [
+            'id', 'project', 'file', 'file_url', 'name', 'description',
+            'uploaded_by', 'assigned_to', 'uploaded_at', 'updated_at'
+        ]
+
+    def get_file_url(self, obj):
+        return self.build_file_url(obj.file)
+
+
+class NotificationSyncSerializer(serializers.ModelSerializer):
+    """Notification row for the changes feed"""
+
+    class Meta:
+        model = Notification
+        fields = [
+            'id', 'title', 'message', 'notification_type', 'is_read',
+            'valuation', 'project', 'created_at', 'updated_at'
+        ]
+
+
+class BundleValuationSerializer(ValuationSyncSerializer):
+    """Valuation with its photos and history for the field officer bundle"""
+
+    photos = ValuationPhotoSyncSerializer(many=True, read_only=True)
+    history = ValuationHistorySerializer(many=True, read_only=True)
+
+
+class BundleProjectSerializer(ProjectSyncSerializer):
+    """Project with the documents and valuations a field officer needs offline"""
+
+    coordinator_name = serializers.SerializerMethodField()
+    client_name = serializers.SerializerMethodField()
+    documents = ProjectDocumentSyncSerializer(many=True, read_only=True)
+    valuations = BundleValuationSerializer(many=True, read_only=True)
+
+    def _full_name(self, user):
+        if not user:
+            return None
+        return f"{user.first_name} {user.last_name}".strip() or user.username
+
+    def get_coordinator_name(self, obj):
+        return self._full_name(obj.coordinator)
+
+    def get_client_name(self, obj):
+        return self._full_name(obj.assigned_client)
@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import ChangesView, FieldOfficerBundleView
+
+app_name = 'sync'
+
+urlpatterns = [
+    path('changes/', ChangesView.as_view(), name='changes'),
+    path('field-officer/bundle/', FieldOfficerBundleView.as_view(), name='field-officer-bundle'),
+]
@@ -0,0 +1,30 @@
+"""
+Cursor helpers for the delta sync changes feed.
+
+A cursor is an opaque signed token holding, for every feed, the
+(updated_at, id) position of the last row the client has received.
+"""
+from datetime import datetime, timezone as dt_timezone
+
+from django.core import signing
+
+CURSOR_SALT = 'sync.changes'
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def encode_cursor(positions):
+    """Sign a {feed: (timestamp, id)} mapping into an opaque cursor string"""
+    payload = {name: [ts.isoformat(), pk] for name, (ts, pk) in positions.items()}
+    return signing.dumps(payload, salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(cursor):
+    """Return the {feed: (timestamp, id)} mapping, or None if the cursor is invalid"""
+    try:
+        payload = signing.loads(cursor, salt=CURSOR_SALT)
+        return {
+            name: (datetime.fromisoformat(ts), int(pk))
+            for name, (ts, pk) in payload.items()
+        }
+    except (signing.BadSignature, TypeError, ValueError, AttributeError):
+        return None
@@ -0,0 +1,231 @@
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Prefetch, Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from attendance.models import Holiday
+from projects.models import Project, ProjectDocument, ProjectMember
+from projects.utils import get_visible_projects
+from valuations.models import Valuation, ValuationPhoto, Notification, ValuationHistory
+from .models import Tombstone
+from .serializers import (
+    ProjectSyncSerializer,
+    ValuationSyncSerializer,
+    ValuationPhotoSyncSerializer,
+    ProjectDocumentSyncSerializer,
+    NotificationSyncSerializer,
+    BundleProjectSerializer,
+)
+from .utils import EPOCH, encode_cursor, decode_cursor
+
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 1000
+
+# Feed name -> (tombstone model name, serializer)
+SYNC_FEEDS = {
+    'projects': ('project', ProjectSyncSerializer),
+    'valuations': ('valuation', ValuationSyncSerializer),
+    'valuation_photos': ('valuation_photo', ValuationPhotoSyncSerializer),
+    'project_documents': ('project_document', ProjectDocumentSyncSerializer),
+    'notifications': ('notification', NotificationSyncSerializer),
+}
+
+
+def get_sync_querysets(user):
+    """Return the per-feed querysets of rows the user is allowed to sync"""
+    projects = get_visible_projects(user)
+    return {
+        'projects': projects,
+        'valuations': Valuation.objects.filter(project__in=projects),
+        'valuation_photos': ValuationPhoto.objects.filter(
+            valuation__project__in=projects
+        ).select_related('valuation'),
+        'project_documents': ProjectDocument.objects.filter(project__in=projects),
+        'notifications': Notification.objects.filter(user=user),
+    }
+
+
+def get_visible_tombstones(user, projects):
+    """Tombstones the user is allowed to receive"""
+    visible = (
+        Q(model='notification', recipient_ref=user.id) |
+        Q(model='project', recipient_ref=user.id) |
+        Q(
+            model__in=['valuation', 'valuation_photo', 'project_document'],
+            project_ref__in=projects.values('id')
+        )
+    )
+    if user.is_staff or user.is_superuser:
+        visible |= Q(model='project', recipient_ref__isnull=True)
+    return Tombstone.objects.filter(visible)
+
+
+def _page_after(queryset, field, position, limit):
+    """Keyset page of rows strictly after (field, id) = position"""
+    ts, pk = position
+    rows = list(
+        queryset.filter(Q(**{f'{field}__gt': ts}) | Q(**{field: ts, 'pk__gt': pk}))
+        .order_by(field, 'pk')[:limit + 1]
+    )
+    return rows[:limit], len(rows) > limit
+
+
+def _next_position(position, rows, field, has_more, safe_until):
+    """
+    Advance the cursor past the returned rows.
+
+    When a feed is caught up the position never moves beyond ``safe_until``:
+    rows written by transactions that were still in flight may commit with an
+    earlier timestamp, so the last few seconds are re-sent on the next pull.
+    Upserts are idempotent on the client, so the overlap is harmless.
+    """
+    if not rows:
+        return position
+    last = (getattr(rows[-1], field), rows[-1].pk)
+    if has_more:
+        return last
+    return max(position, min(last, (safe_until, 0)))
+
+
+class ChangesView(APIView):
+    """Delta sync feed: rows changed since the cursor plus tombstones for deletions"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        now = timezone.now()
+
+        try:
+            limit = min(int(request.query_params.get('limit', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        except (TypeError, ValueError):
+            limit = DEFAULT_PAGE_SIZE
+        limit = max(limit, 1)
+
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            positions = decode_cursor(cursor)
+            if positions is None or set(positions) != set(SYNC_FEEDS) | {'deleted'}:
+                return Response({'error': 'Invalid sync cursor'}, status=status.HTTP_400_BAD_REQUEST)
+            retention = timedelta(days=getattr(settings, 'SYNC_TOMBSTONE_RETENTION_DAYS', 30))
+            if positions['deleted'][0] < now - retention:
+                # Tombstones older than the retention window have been pruned,
+                # so the client may have missed deletions and must start over
+                return Response(
+                    {'error': 'Sync cursor has expired, a full resync is required', 'resync': True},
+                    status=status.HTTP_410_GONE
+                )
+        else:
+            # Initial sync: every visible row, no tombstones to replay
+            positions = {name: (EPOCH, 0) for name in SYNC_FEEDS}
+            positions['deleted'] = (now, 0)
+
+        safe_until = now - timedelta(seconds=getattr(settings, 'SYNC_CURSOR_OVERLAP_SECONDS', 5))
+        querysets = get_sync_querysets(user)
+        context = {'request': request}
+
+        changes = {}
+        sent = set()
+        has_more = False
+        for name, (model_name, serializer_class) in SYNC_FEEDS.items():
+            rows, more = _page_after(querysets[name], 'updated_at', positions[name], limit)
+            has_more = has_more or more
+            positions[name] = _next_position(positions[name], rows, 'updated_at', more, safe_until)
+            changes[name] = serializer_class(rows, many=True, context=context).data
+            sent.update((model_name, row.pk) for row in rows)
+
+        tombstones, more = _page_after(
+            get_visible_tombstones(user, querysets['projects']), 'deleted_at', positions['deleted'], limit
+        )
+        has_more = has_more or more
+        positions['deleted'] = _next_position(positions['deleted'], tombstones, 'deleted_at', more, safe_until)
+
+        deleted = []
+        seen = set()
+        for tombstone in tombstones:
+            key = (tombstone.model, tombstone.object_id)
+            # A row that is visible again is sent as an upsert instead
+            if key in sent or key in seen:
+                continue
+            seen.add(key)
+            deleted.append({
+                'model': tombstone.model,
+                'id': tombstone.object_id,
+                'deleted_at': tombstone.deleted_at,
+            })
+
+        return Response({
+            'changes': changes,
+            'deleted': deleted,
+            'cursor': encode_cursor(positions),
+            'has_more': has_more,
+            'server_time': now,
+        })
+
+
+class FieldOfficerBundleView(APIView):
+    """
+    Everything a field officer needs to work offline for the day in one payload:
+    active projects with document metadata, valuations (photos and history)
+    and upcoming holidays. Runs a fixed number of queries regardless of how
+    many projects are assigned, and supports If-None-Match revalidation.
+    """
+    permission_classes = [IsAuthenticated]
+
+    HOLIDAY_LOOKAHEAD_DAYS = 90
+
+    def get(self, request):
+        user = request.user
+        if not hasattr(user, 'role') or user.role.role != 'field_officer':
+            return Response(
+                {'error': 'Only field officers can download the day bundle'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        projects = Project.objects.filter(
+            pk__in=ProjectMember.project_ids(user, 'field_officer'),
+            status__in=['pending', 'in_progress']
+        ).select_related(
+            'coordinator', 'assigned_client'
+        ).prefetch_related(
+            Prefetch('documents', queryset=ProjectDocument.objects.order_by('uploaded_at')),
+            Prefetch('valuations', queryset=Valuation.objects.order_by('created_at')),
+            Prefetch('valuations__photos', queryset=ValuationPhoto.objects.order_by('uploaded_at')),
+            Prefetch(
+                'valuations__history',
+                queryset=ValuationHistory.objects.select_related('performed_by').order_by('-created_at')
+            ),
+        ).order_by('created_at')
+
+        today = timezone.localdate()
+        holidays = Holiday.objects.filter(
+            is_active=True,
+            date__gte=today,
+            date__lte=today + timedelta(days=self.HOLIDAY_LOOKAHEAD_DAYS)
+        ).values('id', 'name', 'date')
+
+        bundle = {
+            'projects': BundleProjectSerializer(projects, many=True, context={'request': request}).data,
+            'holidays': list(holidays),
+            'reference': {
+                'valuation_categories': dict(Valuation.CATEGORY_CHOICES),
+                'valuation_statuses': dict(Valuation.STATUS_CHOICES),
+            },
+        }
+
+        # Content hash: identical bundles revalidate without re-downloading
+        etag = '"%s"' % hashlib.md5(JSONRenderer().render(bundle)).hexdigest()
+        if etag in [tag.strip() for tag in request.headers.get('If-None-Match', '').split(',')]:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            bundle['generated_at'] = timezone.now()
+            response = Response(bundle)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
@@ -0,0 +1,34 @@
+# Generated by Django 5.0 on 2026-10-19 03:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('system_logs', '0007_attendance_corrected_action'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingSystemLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(choices=[('USER_LOGIN', 'User Login'), ('USER_LOGOUT', 'User Logout'), ('USER_REGISTER', 'User Registration'), ('USER_DELETE', 'User Deleted'), ('ROLE_ASSIGNED', 'Role Assigned'), ('PASSWORD_CHANGED', 'Password Changed'), ('PROJECT_CREATED', 'Project Created'), ('PROJECT_UPDATED', 'Project Updated'), ('PROJECT_APPROVED', 'Project Approved'), ('PROJECT_REJECTED', 'Project Rejected'), ('FIELD_OFFICER_ASSIGNED', 'Field Officer Assigned'), ('CLIENT_ASSIGNED', 'Client Assigned'), ('AGENT_ASSIGNED', 'Agent Assigned'), ('ACCESSOR_ASSIGNED', 'Accessor Assigned'), ('SENIOR_VALUER_ASSIGNED', 'Senior Valuer Assigned'), ('PAYMENT_GENERATED', 'Payment Slips Generated'), ('PAYMENT_UPLOADED', 'Payment Slips Published'), ('LEAVE_CREATED', 'Leave Request Created'), ('LEAVE_APPROVED', 'Leave Request Approved'), ('LEAVE_REJECTED', 'Leave Request Rejected'), ('REMOVAL_CREATED', 'Removal Request Created'), ('REMOVAL_APPROVED', 'Removal Request Approved'), ('REMOVAL_REJECTED', 'Removal Request Rejected'), ('CLIENT_FORM_SUBMITTED', 'Client Form Submitted'), ('EMPLOYEE_FORM_SUBMITTED', 'Employee Form Submitted'), ('COORDINATOR_ASSIGNED', 'Coordinator Assigned to Submission'), ('SUBMISSION_STATUS_UPDATED', 'Submission Status Updated'), ('EMPLOYEE_CREATED', 'Employee Account Created'), ('DOCUMENT_UPLOADED', 'Document Uploaded'), ('CHAIN_VERIFIED', 'Chain Integrity Verified'), ('ATTENDANCE_CHECK_IN', 'Attendance Check In'), ('ATTENDANCE_CHECK_OUT', 'Attendance Check Out'), ('ATTENDANCE_OVERTIME_START', 'Overtime Started'), ('ATTENDANCE_OVERTIME_END', 'Overtime Ended'), ('ATTENDANCE_IMPORTED', 'Attendance Imported'), ('ATTENDANCE_CORRECTED', 'Attendance Corrected'), ('VALUATION_CREATED', 'Valuation Created'), ('VALUATION_UPDATED', 'Valuation Updated'), ('VALUATION_SUBMITTED', 'Valuation Submitted'), ('VALUATION_ACCEPTED', 'Valuation Accepted'), ('VALUATION_REJECTED', 'Valuation Rejected'), ('VALUATION_APPROVED', 'Valuation Approved')], max_length=50)),
+                ('category', models.CharField(choices=[('auth', 'Authentication'), ('user', 'User Management'), ('project', 'Projects'), ('payment', 'Payments'), ('leave', 'Leave Management'), ('removal', 'Employee Removal'), ('submission', 'Form Submissions'), ('attendance', 'Attendance'), ('valuation', 'Valuations'), ('system', 'System')], default='system', max_length=20)),
+                ('description', models.TextField()),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, null=True)),
+                ('timestamp', models.DateTimeField(default=django.utils.timezone.now)),
+                ('target_user', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('user', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['pk'],
+            },
+        ),
+    ]
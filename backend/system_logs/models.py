@@ -39,6 +39,8 @@ ACTION_CHOICES = [
     ('ATTENDANCE_CHECK_OUT', 'Attendance Check Out'),
     ('ATTENDANCE_OVERTIME_START', 'Overtime Started'),
     ('ATTENDANCE_OVERTIME_END', 'Overtime Ended'),
+    ('ATTENDANCE_IMPORTED', 'Attendance Imported'),
+    ('ATTENDANCE_CORRECTED', 'Attendance Corrected'),
     ('VALUATION_CREATED', 'Valuation Created'),
     ('VALUATION_UPDATED', 'Valuation Updated'),
     ('VALUATION_SUBMITTED', 'Valuation Submitted'),
@@ -96,3 +98,30 @@ class SystemLog(models.Model):
             f"{self.previous_hash}"
         )
         return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class PendingSystemLog(models.Model):
+    """
+    An audit entry from log_action_deferred() waiting to be appended to the
+    chain. It is written in the request's transaction and deleted in the same
+    transaction that chains it, so a failed flush or a killed process loses
+    nothing; the next flush picks it up.
+    """
+    action = models.CharField(max_length=50, choices=ACTION_CHOICES)
+    category = models.CharField(max_length=20, choices=CATEGORY_CHOICES, default='system')
+    user = models.ForeignKey(
+        User, null=True, blank=True, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+'
+    )
+    target_user = models.ForeignKey(
+        User, null=True, blank=True, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+'
+    )
+    description = models.TextField()
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    metadata = models.JSONField(null=True, blank=True)
+    timestamp = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['pk']
+
+    def __str__(self):
+        return f"[pending] {self.action}"
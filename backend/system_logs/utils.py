@@ -1,7 +1,10 @@
 import hashlib
 import threading
+from django.contrib.auth.models import User
+from django.db import transaction
 from django.utils import timezone
-from .models import SystemLog
+from auditra_backend.background import BatchWorker
+from .models import PendingSystemLog, SystemLog
 
 GENESIS_HASH = '0' * 64
 _lock = threading.Lock()
@@ -30,6 +33,108 @@ def log_action(action, user=None, description='', category='system', target_user
         return log
 
 
+def log_actions_bulk(entries):
+    """
+    Append several log entries to the chain with one read and one bulk insert.
+
+    Each entry is a dict of log_action() keyword arguments, optionally with the
+    ``timestamp`` the action happened at; entries are chained in the order given.
+    """
+    if not entries:
+        return []
+    with _lock:
+        last = SystemLog.objects.order_by('-block_index').first()
+        block_index = (last.block_index + 1) if last else 0
+        previous_hash = last.current_hash if last else GENESIS_HASH
+        timestamp = timezone.now()
+
+        logs = []
+        for offset, entry in enumerate(entries):
+            log = SystemLog(
+                block_index=block_index + offset,
+                action=entry['action'],
+                category=entry.get('category', 'system'),
+                user=entry.get('user'),
+                target_user=entry.get('target_user'),
+                description=entry.get('description', ''),
+                ip_address=entry.get('ip_address'),
+                metadata=entry.get('metadata'),
+                previous_hash=previous_hash,
+                timestamp=entry.get('timestamp') or timestamp,
+            )
+            log.current_hash = log.compute_hash()
+            previous_hash = log.current_hash
+            logs.append(log)
+        return SystemLog.objects.bulk_create(logs)
+
+
+def chain_pending_logs(batch_size=500):
+    """
+    Append every pending deferred entry to the chain, oldest first, and return
+    how many were chained. Each batch is chained and removed from the pending
+    table in one transaction, so a failure leaves it pending for the next run.
+    """
+    chained = 0
+    while True:
+        with transaction.atomic():
+            pending = list(
+                PendingSystemLog.objects.select_for_update(skip_locked=True).order_by('pk')[:batch_size]
+            )
+            if not pending:
+                return chained
+            user_ids = {entry.user_id for entry in pending} | {entry.target_user_id for entry in pending}
+            existing = set(User.objects.filter(pk__in=user_ids - {None}).values_list('pk', flat=True))
+
+            entries = []
+            for entry in pending:
+                metadata = entry.metadata
+                # A user deleted since the request cannot be referenced; keep their id
+                for field in ('user_id', 'target_user_id'):
+                    user_id = getattr(entry, field)
+                    if user_id is not None and user_id not in existing:
+                        metadata = {**(metadata or {}), f'deleted_{field}': user_id}
+                        setattr(entry, field, None)
+                entries.append({
+                    'action': entry.action,
+                    'category': entry.category,
+                    'user': entry.user_id and User(pk=entry.user_id),
+                    'target_user': entry.target_user_id and User(pk=entry.target_user_id),
+                    'description': entry.description,
+                    'ip_address': entry.ip_address,
+                    'metadata': metadata,
+                    'timestamp': entry.timestamp,
+                })
+            log_actions_bulk(entries)
+            PendingSystemLog.objects.filter(pk__in=[entry.pk for entry in pending]).delete()
+        chained += len(pending)
+
+
+def _flush_deferred_logs(entry_ids):
+    # Drains everything pending, including entries left by a process that died
+    chain_pending_logs()
+
+
+_deferred_logs = BatchWorker('audit-log-writer', _flush_deferred_logs, interval=1.0)
+
+
+def log_action_deferred(action, user=None, description='', category='system', target_user=None, ip_address=None, metadata=None):
+    """
+    log_action() for hot paths: the entry is stored as pending with a plain
+    insert and appended to the chain in a batch from a background thread, so
+    the request never waits on the chain.
+    """
+    entry = PendingSystemLog.objects.create(
+        action=action,
+        user=user,
+        description=description,
+        category=category,
+        target_user=target_user,
+        ip_address=ip_address,
+        metadata=metadata,
+    )
+    _deferred_logs.add(entry.pk)
+
+
 def verify_chain():
     logs = SystemLog.objects.order_by('block_index')
     total = logs.count()
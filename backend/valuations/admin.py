@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Valuation, ValuationPhoto
+from .models import Valuation, ValuationPhoto, NotificationArchive, NotificationCounter
 
 
 @admin.register(Valuation)
@@ -15,3 +15,16 @@ class ValuationPhotoAdmin(admin.ModelAdmin):
     list_display = ['id', 'valuation', 'caption', 'uploaded_at']
     list_filter = ['uploaded_at']
     search_fields = ['valuation__project__title', 'caption']
+
+
+@admin.register(NotificationCounter)
+class NotificationCounterAdmin(admin.ModelAdmin):
+    list_display = ['user', 'unread', 'updated_at']
+    search_fields = ['user__username']
+
+
+@admin.register(NotificationArchive)
+class NotificationArchiveAdmin(admin.ModelAdmin):
+    list_display = ['notification_id', 'user', 'title', 'notification_type', 'created_at', 'archived_at']
+    list_filter = ['notification_type']
+    search_fields = ['user__username', 'title']
@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from sync.models import collect_tombstones
+from valuations.models import Notification, NotificationArchive
+
+
+class Command(BaseCommand):
+    help = 'Move read notifications older than the retention window into the archive table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=getattr(settings, 'NOTIFICATION_RETENTION_DAYS', 90),
+            help='Archive read notifications created more than this many days ago',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Notifications moved per transaction (default 1000)',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        batch_size = options['batch_size']
+        candidates = Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+
+        total = 0
+        while True:
+            # Short transactions keep row locks brief while users keep reading
+            with transaction.atomic():
+                batch = list(
+                    candidates.order_by('id').select_for_update(skip_locked=True)[:batch_size]
+                )
+                if not batch:
+                    break
+                NotificationArchive.objects.bulk_create(
+                    [
+                        NotificationArchive(
+                            notification_id=n.id,
+                            user_id=n.user_id,
+                            title=n.title,
+                            message=n.message,
+                            notification_type=n.notification_type,
+                            is_read=n.is_read,
+                            valuation_ref=n.valuation_id,
+                            project_ref=n.project_id,
+                            created_at=n.created_at,
+                        )
+                        for n in batch
+                    ],
+                    ignore_conflicts=True,
+                )
+                # Offline clients still need to drop archived rows; one insert per batch
+                with collect_tombstones():
+                    Notification.objects.filter(id__in=[n.id for n in batch]).delete()
+            total += len(batch)
+            self.stdout.write(f'  Archived {total} notification(s)...')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Archived {total} read notification(s) older than {options["days"]} days'
+        ))
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from valuations.models import Notification, NotificationCounter
+
+
+class Command(BaseCommand):
+    help = 'Recount unread notifications per user and fix drifted notification counters'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted counters without changing them',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+
+        actual = dict(
+            Notification.objects.filter(is_read=False)
+            .values('user_id')
+            .annotate(unread=Count('id'))
+            .values_list('user_id', 'unread')
+        )
+
+        with transaction.atomic():
+            counters = {
+                counter.user_id: counter
+                for counter in NotificationCounter.objects.select_for_update()
+            }
+
+            to_update = []
+            for user_id, counter in counters.items():
+                expected = actual.get(user_id, 0)
+                if counter.unread != expected:
+                    self.stdout.write(f'  User {user_id}: {counter.unread} -> {expected}')
+                    counter.unread = expected
+                    to_update.append(counter)
+
+            to_create = [
+                NotificationCounter(user_id=user_id, unread=unread)
+                for user_id, unread in actual.items()
+                if user_id not in counters
+            ]
+
+            if not dry_run:
+                NotificationCounter.objects.bulk_update(to_update, ['unread'], batch_size=500)
+                NotificationCounter.objects.bulk_create(to_create, batch_size=500)
+
+        prefix = 'Would fix' if dry_run else 'Fixed'
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix} {len(to_update)} drifted counter(s) and {len(to_create)} missing counter(s)'
+        ))
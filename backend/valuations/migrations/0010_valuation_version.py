@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-19 02:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('valuations', '0009_notification_updated_at_valuationphoto_updated_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='valuation',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
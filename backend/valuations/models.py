@@ -1,7 +1,10 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.utils import timezone
 from projects.models import Project
+from .notification_stream import publish_notification_change
 
 
 class Valuation(models.Model):
@@ -85,8 +88,11 @@ class Valuation(models.Model):
     md_gm_comments = models.TextField(blank=True, default='', help_text='Comments from MD/GM during final approval')
     
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     submitted_at = models.DateTimeField(null=True, blank=True)
+
+    # Optimistic concurrency token, bumped on every save
+    version = models.PositiveIntegerField(default=1)
     
     class Meta:
         db_table = 'valuations'
@@ -96,6 +102,18 @@ class Valuation(models.Model):
     
     def __str__(self):
         return f"{self.get_category_display()} - {self.project.title} - {self.get_status_display()}"
+
+    def save(self, *args, **kwargs):
+        bump = bool(self.pk)
+        if bump:
+            # Bumped in the database so concurrent saves cannot lose an increment
+            self.version = models.F('version') + 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'version'}
+        super().save(*args, **kwargs)
+        if bump:
+            self.refresh_from_db(fields=['version'])
     
     def submit(self):
         """Mark valuation as submitted"""
@@ -130,6 +148,7 @@ class ValuationPhoto(models.Model):
     photo = models.ImageField(upload_to='valuation_photos/%Y/%m/%d/')
     caption = models.CharField(max_length=200, blank=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     
     class Meta:
         db_table = 'valuation_photos'
@@ -158,15 +177,91 @@ class Notification(models.Model):
     valuation = models.ForeignKey(Valuation, on_delete=models.CASCADE, null=True, blank=True, related_name='notifications')
     project = models.ForeignKey(Project, on_delete=models.CASCADE, null=True, blank=True, related_name='notifications')
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         db_table = 'notifications'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at'], name='notif_user_created'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.user.username}"
 
 
+class NotificationArchive(models.Model):
+    """Read notifications moved out of the hot notifications table by the retention job"""
+
+    notification_id = models.BigIntegerField(unique=True, help_text='Id of the original notification')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_notifications')
+    title = models.CharField(max_length=255)
+    message = models.TextField()
+    notification_type = models.CharField(max_length=50, choices=Notification.NOTIFICATION_TYPES)
+    is_read = models.BooleanField(default=True)
+    # Plain ids: the valuation or project may be deleted after archiving
+    valuation_ref = models.BigIntegerField(null=True, blank=True)
+    project_ref = models.BigIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'notification_archive'
+        verbose_name = 'Archived Notification'
+        verbose_name_plural = 'Archived Notifications'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at'], name='notif_archive_user_created'),
+        ]
+
+    def __str__(self):
+        return f"{self.title} - {self.user_id} (archived)"
+
+
+class NotificationCounter(models.Model):
+    """Denormalized unread-notification count per user, so badge reads are a primary-key lookup"""
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='notification_counter')
+    unread = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'notification_counters'
+        verbose_name = 'Notification Counter'
+        verbose_name_plural = 'Notification Counters'
+
+    def __str__(self):
+        return f"{self.user_id}: {self.unread} unread"
+
+    @classmethod
+    def adjust(cls, user_id, delta):
+        """Atomically add delta to the user's unread count"""
+        if not delta:
+            return
+        updated = cls.objects.filter(user_id=user_id).update(
+            unread=models.F('unread') + delta, updated_at=timezone.now()
+        )
+        if not updated and delta > 0:
+            # First notification for this user: seed the row from the table.
+            # Missing rows are never seeded on decrements, which also run
+            # while a user and their notifications are being deleted.
+            cls.reconcile(user_id)
+
+    @classmethod
+    def reconcile(cls, user_id):
+        """Recount the user's unread notifications and store the result"""
+        unread = Notification.objects.filter(user_id=user_id, is_read=False).count()
+        cls.objects.update_or_create(user_id=user_id, defaults={'unread': unread})
+        return unread
+
+    @classmethod
+    def unread_for(cls, user_id):
+        unread = cls.objects.filter(user_id=user_id).values_list('unread', flat=True).first()
+        if unread is None:
+            return cls.reconcile(user_id)
+        return max(unread, 0)
+
+
 class ValuationHistory(models.Model):
     """Tracks every status change of a valuation for report history"""
 
@@ -193,3 +288,18 @@ class ValuationHistory(models.Model):
 
     def __str__(self):
         return f"{self.get_action_display()} - {self.valuation}"
+
+
+@receiver(post_save, sender=Notification)
+def publish_new_notification(sender, instance, created, **kwargs):
+    """Wake the recipient's long-poll requests once the notification is committed"""
+    if created:
+        if not instance.is_read:
+            NotificationCounter.adjust(instance.user_id, 1)
+        publish_notification_change(instance.user_id)
+
+
+@receiver(post_delete, sender=Notification)
+def discount_deleted_notification(sender, instance, **kwargs):
+    if not instance.is_read:
+        NotificationCounter.adjust(instance.user_id, -1)
@@ -0,0 +1,139 @@
+"""
+In-process fan-out used by the notification long-poll endpoint.
+
+Each user has a change counter. Publishing bumps it and wakes every request
+waiting on that user; waiters then re-read their notifications from the
+database, so the broker never carries notification data itself.
+
+Two backends are available through ``NOTIFICATION_STREAM_BACKEND``:
+
+* ``local`` (default) - wakes waiters in the current process only. Fine for
+  a single server process.
+* ``postgres`` - publishes with ``pg_notify`` and runs one ``LISTEN`` thread
+  per process, so changes made by any worker reach waiters in every worker.
+
+Waiting requests hold a server thread (but not a database connection), so
+each process admits at most ``NOTIFICATION_LONG_POLL_MAX_WAITERS`` of them;
+see the README for the matching worker settings.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = 'auditra_notifications'
+
+
+class LocalBroker:
+    """Per-user change counters guarded by a single condition variable"""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._versions = {}
+        # Each waiter parks a server thread; cap them so long-polls cannot
+        # take every worker thread in the process
+        self._waiter_slots = threading.BoundedSemaphore(
+            getattr(settings, 'NOTIFICATION_LONG_POLL_MAX_WAITERS', 16)
+        )
+
+    def acquire_waiter(self):
+        """Claim a waiting slot without blocking; False when the process is full"""
+        return self._waiter_slots.acquire(blocking=False)
+
+    def release_waiter(self):
+        self._waiter_slots.release()
+
+    def version(self, user_id):
+        with self._condition:
+            return self._versions.get(user_id, 0)
+
+    def wake(self, user_id):
+        with self._condition:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            self._condition.notify_all()
+
+    def publish(self, user_id):
+        self.wake(user_id)
+
+    def wait(self, user_id, seen_version, timeout):
+        """Block until the user's counter moves past seen_version; True if it did"""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._versions.get(user_id, 0) == seen_version:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+
+class PostgresBroker(LocalBroker):
+    """Cross-process fan-out over Postgres LISTEN/NOTIFY"""
+
+    RECONNECT_DELAY = 5
+
+    def __init__(self):
+        super().__init__()
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    def publish(self, user_id):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [CHANNEL, str(user_id)])
+
+    def wait(self, user_id, seen_version, timeout):
+        self._ensure_listener()
+        return super().wait(user_id, seen_version, timeout)
+
+    def _ensure_listener(self):
+        with self._listener_lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(
+                    target=self._listen, name='notification-stream-listener', daemon=True
+                )
+                self._listener.start()
+
+    def _listen(self):
+        import psycopg
+
+        params = connections['default'].get_connection_params()
+        while True:
+            try:
+                with psycopg.connect(**params, autocommit=True) as conn:
+                    conn.execute(f'LISTEN {CHANNEL}')
+                    for notify in conn.notifies():
+                        try:
+                            self.wake(int(notify.payload))
+                        except ValueError:
+                            continue
+            except Exception:
+                logger.exception('Notification stream listener failed, reconnecting')
+                time.sleep(self.RECONNECT_DELAY)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            backend = getattr(settings, 'NOTIFICATION_STREAM_BACKEND', 'local')
+            _broker = PostgresBroker() if backend == 'postgres' else LocalBroker()
+        return _broker
+
+
+def publish_notification_change(user_id):
+    """Wake the user's waiting clients once the current transaction commits"""
+    def publish():
+        try:
+            get_broker().publish(user_id)
+        except Exception:
+            logger.exception('Failed to publish notification change for user %s', user_id)
+
+    transaction.on_commit(publish)
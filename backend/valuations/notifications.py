@@ -0,0 +1,100 @@
+"""
+Notification dispatcher for workflow steps.
+
+A view collects every notification a step produces and dispatches them
+together. They are written with a single ``bulk_create`` inside the step's
+transaction, so they commit or roll back with the step, and are handed to
+any extra delivery channels configured in ``NOTIFICATION_CHANNELS`` once it
+commits::
+
+    notifier = NotificationDispatcher()
+    notifier.add(valuation.field_officer, 'Valuation Rejected', message,
+                 notification_type='rejection', valuation=valuation)
+    notifier.dispatch()
+"""
+import logging
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from .models import Notification, NotificationCounter
+from .notification_stream import publish_notification_change
+
+logger = logging.getLogger(__name__)
+
+
+class EmailChannel:
+    """Also delivers each notification to the recipient's email address"""
+
+    def send(self, notifications):
+        from authentication.services import EmailService
+
+        for notification in notifications:
+            user = notification.user
+            if not user.email:
+                continue
+            EmailService.send_workflow_notification(
+                email=user.email,
+                name=user.get_full_name() or user.username,
+                title=notification.title,
+                message=notification.message,
+            )
+
+
+def get_channels():
+    """Instantiate the extra delivery channels listed in NOTIFICATION_CHANNELS"""
+    return [import_string(path)() for path in getattr(settings, 'NOTIFICATION_CHANNELS', [])]
+
+
+class NotificationDispatcher:
+    """Collects notifications during a workflow step and creates them together"""
+
+    def __init__(self, channels=None):
+        self.channels = get_channels() if channels is None else channels
+        self._pending = []
+
+    def add(self, user, title, message, notification_type='rejection', valuation=None, project=None):
+        """Queue a notification; missing recipients are skipped and duplicates collapsed"""
+        if user is None:
+            return
+        if valuation is not None and project is None:
+            project = valuation.project
+        for pending in self._pending:
+            if pending.user_id == user.pk and pending.title == title and pending.message == message:
+                return
+        self._pending.append(Notification(
+            user=user,
+            title=title,
+            message=message,
+            notification_type=notification_type,
+            valuation=valuation,
+            project=project,
+        ))
+
+    def dispatch(self):
+        """
+        Create the queued notifications in the current transaction; the
+        external channels are called once it commits
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        with transaction.atomic():
+            Notification.objects.bulk_create(pending)
+            # bulk_create skips post_save, so keep the unread counters in step here
+            for user_id, count in Counter(n.user_id for n in pending).items():
+                NotificationCounter.adjust(user_id, count)
+
+        for user_id in {n.user_id for n in pending}:
+            publish_notification_change(user_id)
+        if self.channels:
+            transaction.on_commit(lambda: self._send(pending))
+
+    def _send(self, notifications):
+        for channel in self.channels:
+            try:
+                channel.send(notifications)
+            except Exception:
+                logger.exception('Notification channel %s failed', type(channel).__name__)
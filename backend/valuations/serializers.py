@@ -1,5 +1,8 @@
+from django.db.models import Prefetch
 from rest_framework import serializers
-from .models import Valuation, ValuationPhoto, Notification, ValuationHistory
+from auditra_backend.fieldsets import DynamicFieldsMixin
+from projects.models import ProjectMember
+from .models import Valuation, ValuationPhoto, Notification, NotificationArchive, ValuationHistory
 
 
 class ValuationPhotoSerializer(serializers.ModelSerializer):
@@ -21,7 +24,7 @@ class ValuationPhotoSerializer(serializers.ModelSerializer):
         return None
 
 
-class ValuationSerializer(serializers.ModelSerializer):
+class ValuationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for valuations"""
 
     photos = ValuationPhotoSerializer(many=True, read_only=True)
@@ -60,9 +63,15 @@ class ValuationSerializer(serializers.ModelSerializer):
             # Field officer report
             'submitted_report', 'submitted_report_url',
             # Timestamps
-            'created_at', 'updated_at', 'submitted_at', 'photos', 'can_be_edited', 'history'
+            'created_at', 'updated_at', 'submitted_at', 'photos', 'can_be_edited', 'history',
+            'version'
         ]
-        read_only_fields = ['field_officer', 'created_at', 'updated_at', 'submitted_at']
+        read_only_fields = ['field_officer', 'created_at', 'updated_at', 'submitted_at', 'version']
+        expandable_fields = ['photos', 'history']
+        related_fields = {
+            'field_officer_name': ['field_officer'],
+            'history': [Prefetch('history', queryset=ValuationHistory.objects.select_related('performed_by'))],
+        }
     
     def get_field_officer_name(self, obj):
         if obj.field_officer.first_name or obj.field_officer.last_name:
@@ -93,8 +102,10 @@ class ValuationSerializer(serializers.ModelSerializer):
 
     def get_history(self, obj):
         """Get valuation status history"""
-        from .models import ValuationHistory
-        history_qs = obj.history.select_related('performed_by').order_by('-created_at')
+        if 'history' in getattr(obj, '_prefetched_objects_cache', {}):
+            history_qs = obj.history.all()
+        else:
+            history_qs = obj.history.select_related('performed_by').order_by('-created_at')
         result = []
         for h in history_qs:
             performed_by_name = 'System'
@@ -137,7 +148,7 @@ class ValuationCreateSerializer(serializers.ModelSerializer):
         """Ensure the project is assigned to the current user and is in progress"""
         request = self.context.get('request')
         if request and request.user:
-            if value.assigned_field_officer != request.user:
+            if not ProjectMember.is_member(value, request.user, 'field_officer'):
                 raise serializers.ValidationError("You can only create valuations for projects assigned to you.")
         if value.status != 'in_progress':
             raise serializers.ValidationError("Valuation reports can only be created for projects that are in progress.")
@@ -163,6 +174,19 @@ class NotificationSerializer(serializers.ModelSerializer):
                             'valuation', 'project', 'created_at']
 
 
+class NotificationArchiveSerializer(serializers.ModelSerializer):
+    """Archived notifications, shaped like NotificationSerializer"""
+
+    id = serializers.IntegerField(source='notification_id', read_only=True)
+    valuation = serializers.IntegerField(source='valuation_ref', read_only=True)
+    project = serializers.IntegerField(source='project_ref', read_only=True)
+
+    class Meta:
+        model = NotificationArchive
+        fields = ['id', 'title', 'message', 'notification_type', 'is_read',
+                  'valuation', 'project', 'created_at', 'archived_at']
+
+
 class ValuationHistorySerializer(serializers.ModelSerializer):
     """Serializer for valuation history entries"""
 
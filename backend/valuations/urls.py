@@ -7,6 +7,7 @@ urlpatterns = [
     # Valuation endpoints
     path('', views.ValuationListCreateView.as_view(), name='valuation-list-create'),
     path('<int:pk>/', views.ValuationDetailView.as_view(), name='valuation-detail'),
+    path('<int:pk>/autosave/', views.autosave_valuation, name='valuation-autosave'),
     path('<int:pk>/submit/', views.submit_valuation, name='valuation-submit'),
     path('<int:pk>/upload-report/', views.upload_submitted_report, name='valuation-upload-report'),
     path('<int:pk>/accept/', views.accept_valuation, name='valuation-accept'),
@@ -30,6 +31,7 @@ urlpatterns = [
     # Notification endpoints
     path('notifications/', views.NotificationListView.as_view(), name='notification-list'),
     path('notifications/unread-count/', views.unread_notification_count, name='notification-unread-count'),
+    path('notifications/wait/', views.wait_for_notifications, name='notification-wait'),
     path('notifications/<int:pk>/read/', views.mark_notification_read, name='notification-mark-read'),
     path('notifications/mark-all-read/', views.mark_all_notifications_read, name='notification-mark-all-read'),
 ]
@@ -2,21 +2,30 @@ from rest_framework import generics, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.shortcuts import get_object_or_404
-from django.db import transaction
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
 import logging
-from .models import Valuation, ValuationPhoto, Notification, ValuationHistory
+import time
+from .models import Valuation, ValuationPhoto, Notification, NotificationArchive, NotificationCounter, ValuationHistory
 from .serializers import (
     ValuationSerializer, ValuationCreateSerializer,
     ValuationPhotoSerializer, ValuationPhotoCreateSerializer,
-    NotificationSerializer
+    NotificationSerializer, NotificationArchiveSerializer
 )
-from projects.models import Project, ProjectStatusHistory
+from projects.models import Project, ProjectMember, ProjectStatusHistory
+from auditra_backend.conditional import conditional_get, aggregate_version
+from auditra_backend.fieldsets import DynamicFieldsViewMixin
+from auditra_backend.pagination import KeysetPagination
+from .notification_stream import get_broker, publish_notification_change
+from .notifications import NotificationDispatcher
 
 logger = logging.getLogger(__name__)
 
 
-class ValuationListCreateView(generics.ListCreateAPIView):
+class ValuationListCreateView(DynamicFieldsViewMixin, generics.ListCreateAPIView):
     """List and create valuations"""
     permission_classes = [IsAuthenticated]
     
@@ -28,16 +37,16 @@ class ValuationListCreateView(generics.ListCreateAPIView):
         # Accessors see valuations for projects assigned to them
         # Senior Valuers see valuations for projects assigned to them
         if hasattr(user, 'role') and user.role.role == 'accessor':
-            queryset = Valuation.objects.filter(project__assigned_accessor=user)
+            queryset = Valuation.objects.filter(project__in=ProjectMember.project_ids(user, 'accessor'))
         elif hasattr(user, 'role') and user.role.role == 'senior_valuer':
-            queryset = Valuation.objects.filter(project__assigned_senior_valuer=user)
+            queryset = Valuation.objects.filter(project__in=ProjectMember.project_ids(user, 'senior_valuer'))
         else:
             queryset = Valuation.objects.filter(field_officer=user)
         
         if project_id:
             queryset = queryset.filter(project_id=project_id)
         
-        return queryset.select_related('project', 'field_officer').prefetch_related('photos')
+        return queryset
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -80,7 +89,7 @@ class ValuationListCreateView(generics.ListCreateAPIView):
         return Response(full_serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
 
-class ValuationDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ValuationDetailView(DynamicFieldsViewMixin, generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update, or delete a valuation"""
     permission_classes = [IsAuthenticated]
     serializer_class = ValuationSerializer
@@ -91,13 +100,9 @@ class ValuationDetailView(generics.RetrieveUpdateDestroyAPIView):
         # Field Officers see their own valuations
         # Accessors see valuations for projects assigned to them
         if hasattr(user, 'role') and user.role.role == 'accessor':
-            return Valuation.objects.filter(project__assigned_accessor=user).select_related(
-                'project', 'field_officer'
-            ).prefetch_related('photos')
+            return Valuation.objects.filter(project__in=ProjectMember.project_ids(user, 'accessor'))
             
-        return Valuation.objects.filter(field_officer=user).select_related(
-            'project', 'field_officer'
-        ).prefetch_related('photos')
+        return Valuation.objects.filter(field_officer=user)
     
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
@@ -131,6 +136,135 @@ class ValuationDetailView(generics.RetrieveUpdateDestroyAPIView):
         return super().update(request, *args, **kwargs)
 
 
+# Fields a field officer may change through autosave (the project is fixed)
+AUTOSAVE_FIELDS = [f for f in ValuationCreateSerializer.Meta.fields if f != 'project']
+
+
+def _field_matches(instance, field, value):
+    """Compare a stored value with a client value after coercing it to the field's type"""
+    model_field = Valuation._meta.get_field(field)
+    try:
+        expected = model_field.to_python(value)
+    except DjangoValidationError:
+        return False
+    return getattr(instance, model_field.attname) == expected
+
+
+def _changes_from_json_patch(operations, instance):
+    """
+    Translate a JSON Patch (RFC 6902) document into a {field: value} dict.
+
+    Only top-level field paths are supported. ``remove`` clears a field and
+    ``test`` fails the patch when the stored value differs.
+    """
+    if not isinstance(operations, list):
+        raise ValueError('patch must be a list of operations')
+    changes = {}
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise ValueError('each patch operation must be an object')
+        op = operation.get('op')
+        field = str(operation.get('path', '')).lstrip('/')
+        if '/' in field or not field:
+            raise ValueError(f"unsupported patch path '{operation.get('path')}'")
+        if op in ('add', 'replace'):
+            if 'value' not in operation:
+                raise ValueError(f"'{op}' operation on '{field}' is missing a value")
+            changes[field] = operation['value']
+        elif op == 'remove':
+            model_field = Valuation._meta.get_field(field) if field in AUTOSAVE_FIELDS else None
+            changes[field] = None if model_field is None or model_field.null else ''
+        elif op == 'test':
+            if field in AUTOSAVE_FIELDS and not _field_matches(instance, field, operation.get('value')):
+                raise ValueError(f"test failed for '{field}'")
+        else:
+            raise ValueError(f"unsupported patch operation '{op}'")
+    return changes
+
+
+@api_view(['PATCH'])
+@permission_classes([IsAuthenticated])
+@transaction.atomic
+def autosave_valuation(request, pk):
+    """
+    Autosave a draft valuation by applying only the fields that changed.
+
+    Accepts either ``{"version": n, "changes": {field: value}}`` or
+    ``{"version": n, "patch": [JSON Patch operations]}``; the version may also
+    be sent as an ``If-Match`` header. The write is rejected with 409 when
+    the valuation has been saved since the client's version.
+    """
+    valuation = get_object_or_404(
+        Valuation.objects.select_for_update(),
+        pk=pk,
+        field_officer=request.user
+    )
+
+    if valuation.status != 'draft':
+        return Response(
+            {'error': 'Only draft valuations can be autosaved'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    version = request.data.get('version', request.headers.get('If-Match', '').strip('"'))
+    try:
+        version = int(version)
+    except (TypeError, ValueError):
+        return Response(
+            {'error': 'A valuation version is required'},
+            status=status.HTTP_428_PRECONDITION_REQUIRED
+        )
+
+    try:
+        if 'patch' in request.data:
+            changes = _changes_from_json_patch(request.data['patch'], valuation)
+        else:
+            changes = request.data.get('changes')
+            if not isinstance(changes, dict):
+                raise ValueError('changes must be an object of field values')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    unknown = sorted(set(changes) - set(AUTOSAVE_FIELDS))
+    if unknown:
+        return Response(
+            {'error': f"These fields cannot be autosaved: {', '.join(unknown)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    if version != valuation.version:
+        return Response(
+            {
+                'error': 'This valuation has been changed since your last save',
+                'version': valuation.version,
+                'current': {field: getattr(valuation, field) for field in changes},
+            },
+            status=status.HTTP_409_CONFLICT
+        )
+
+    if changes:
+        serializer = ValuationCreateSerializer(
+            valuation, data=changes, partial=True, context={'request': request}
+        )
+        if not serializer.is_valid():
+            return Response(
+                {'detail': 'Validation failed', 'errors': serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        for field, value in serializer.validated_data.items():
+            setattr(valuation, field, value)
+        valuation.save(update_fields=list(serializer.validated_data) + ['updated_at'])
+
+    response = Response({
+        'id': valuation.id,
+        'version': valuation.version,
+        'updated_fields': sorted(changes),
+        'updated_at': valuation.updated_at,
+    })
+    response['ETag'] = f'"{valuation.version}"'
+    return response
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def submit_valuation(request, pk):
@@ -251,7 +385,7 @@ def accept_valuation(request, pk):
         )
     
     # Check if accessor is assigned to the project
-    if valuation.project.assigned_accessor != request.user:
+    if not ProjectMember.is_member(valuation.project_id, request.user, 'accessor'):
         return Response(
             {'error': 'You can only accept valuations for projects assigned to you.'},
             status=status.HTTP_403_FORBIDDEN
@@ -339,7 +473,7 @@ def reject_valuation(request, pk):
         )
     
     # Check if accessor is assigned to the project
-    if valuation.project.assigned_accessor != request.user:
+    if not ProjectMember.is_member(valuation.project_id, request.user, 'accessor'):
         return Response(
             {'error': 'You can only reject valuations for projects assigned to you.'},
             status=status.HTTP_403_FORBIDDEN
@@ -384,14 +518,15 @@ def reject_valuation(request, pk):
 
     # Create notification for field officer
     accessor_name = request.user.get_full_name() or request.user.username
-    Notification.objects.create(
-        user=valuation.field_officer,
-        title='Valuation Rejected by Assessor',
-        message=f'Your {valuation.get_category_display()} valuation for project "{valuation.project.title}" has been rejected by Assessor ({accessor_name}). Reason: {rejection_reason}',
+    notifier = NotificationDispatcher()
+    notifier.add(
+        valuation.field_officer,
+        'Valuation Rejected by Assessor',
+        f'Your {valuation.get_category_display()} valuation for project "{valuation.project.title}" has been rejected by Assessor ({accessor_name}). Reason: {rejection_reason}',
         notification_type='rejection',
         valuation=valuation,
-        project=valuation.project,
     )
+    notifier.dispatch()
 
     try:
         from system_logs.utils import log_action, get_client_ip
@@ -410,7 +545,7 @@ def reject_valuation(request, pk):
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class SeniorValuerValuationListView(generics.ListAPIView):
+class SeniorValuerValuationListView(DynamicFieldsViewMixin, generics.ListAPIView):
     """List reviewed valuations assigned to senior valuer"""
     permission_classes = [IsAuthenticated]
     serializer_class = ValuationSerializer
@@ -424,9 +559,9 @@ class SeniorValuerValuationListView(generics.ListAPIView):
         
         # Get reviewed valuations for projects assigned to this senior valuer
         queryset = Valuation.objects.filter(
-            project__assigned_senior_valuer=user,
+            project__in=ProjectMember.project_ids(user, 'senior_valuer'),
             status='reviewed'
-        ).select_related('project', 'field_officer').prefetch_related('photos')
+        )
         
         project_id = self.request.query_params.get('project', None)
         if project_id:
@@ -450,7 +585,7 @@ def senior_valuer_submit_proposal(request, pk):
         )
     
     # Check if senior valuer is assigned to the project
-    if valuation.project.assigned_senior_valuer != request.user:
+    if not ProjectMember.is_member(valuation.project_id, request.user, 'senior_valuer'):
         return Response(
             {'error': 'You can only submit proposals for projects assigned to you.'},
             status=status.HTTP_403_FORBIDDEN
@@ -496,7 +631,7 @@ def senior_valuer_approve_valuation(request, pk):
         )
     
     # Check if senior valuer is assigned to the project
-    if valuation.project.assigned_senior_valuer != request.user:
+    if not ProjectMember.is_member(valuation.project_id, request.user, 'senior_valuer'):
         return Response(
             {'error': 'You can only approve valuations for projects assigned to you.'},
             status=status.HTTP_403_FORBIDDEN
@@ -574,7 +709,7 @@ def senior_valuer_reject_valuation(request, pk):
         )
     
     # Check if senior valuer is assigned to the project
-    if valuation.project.assigned_senior_valuer != request.user:
+    if not ProjectMember.is_member(valuation.project_id, request.user, 'senior_valuer'):
         return Response(
             {'error': 'You can only reject valuations for projects assigned to you.'},
             status=status.HTTP_403_FORBIDDEN
@@ -621,26 +756,12 @@ def senior_valuer_reject_valuation(request, pk):
     sv_name = request.user.get_full_name() or request.user.username
     notification_msg = f'{valuation.get_category_display()} valuation for project "{valuation.project.title}" has been rejected by Senior Valuer ({sv_name}). Reason: {rejection_reason}'
 
-    # Notify assessor
-    if valuation.project.assigned_accessor:
-        Notification.objects.create(
-            user=valuation.project.assigned_accessor,
-            title='Valuation Rejected by Senior Valuer',
-            message=notification_msg,
-            notification_type='rejection',
-            valuation=valuation,
-            project=valuation.project,
-        )
-
-    # Notify field officer
-    Notification.objects.create(
-        user=valuation.field_officer,
-        title='Valuation Rejected by Senior Valuer',
-        message=notification_msg,
-        notification_type='rejection',
-        valuation=valuation,
-        project=valuation.project,
-    )
+    notifier = NotificationDispatcher()
+    notifier.add(valuation.project.assigned_accessor, 'Valuation Rejected by Senior Valuer', notification_msg,
+                 notification_type='rejection', valuation=valuation)
+    notifier.add(valuation.field_officer, 'Valuation Rejected by Senior Valuer', notification_msg,
+                 notification_type='rejection', valuation=valuation)
+    notifier.dispatch()
 
     try:
         from system_logs.utils import log_action, get_client_ip
@@ -663,7 +784,7 @@ def senior_valuer_reject_valuation(request, pk):
 # MD/GM Valuation Views
 # ============================================================================
 
-class MDGMValuationListView(generics.ListAPIView):
+class MDGMValuationListView(DynamicFieldsViewMixin, generics.ListAPIView):
     """List approved valuations for MD/GM review"""
     permission_classes = [IsAuthenticated]
     serializer_class = ValuationSerializer
@@ -677,7 +798,7 @@ class MDGMValuationListView(generics.ListAPIView):
         # MD/GM sees all approved and md_approved valuations
         queryset = Valuation.objects.filter(
             status__in=['approved', 'md_approved', 'rejected']
-        ).select_related('project', 'field_officer').prefetch_related('photos')
+        )
 
         project_id = self.request.query_params.get('project', None)
         if project_id:
@@ -799,26 +920,12 @@ def md_gm_reject_valuation(request, pk):
     mdgm_name = request.user.get_full_name() or request.user.username
     notification_msg = f'{valuation.get_category_display()} valuation for project "{valuation.project.title}" has been rejected by MD/GM ({mdgm_name}). Reason: {rejection_reason}'
 
-    # Notify senior valuer
-    if valuation.project.assigned_senior_valuer:
-        Notification.objects.create(
-            user=valuation.project.assigned_senior_valuer,
-            title='Valuation Rejected by MD/GM',
-            message=notification_msg,
-            notification_type='rejection',
-            valuation=valuation,
-            project=valuation.project,
-        )
-
-    # Notify field officer
-    Notification.objects.create(
-        user=valuation.field_officer,
-        title='Valuation Rejected by MD/GM',
-        message=notification_msg,
-        notification_type='rejection',
-        valuation=valuation,
-        project=valuation.project,
-    )
+    notifier = NotificationDispatcher()
+    notifier.add(valuation.project.assigned_senior_valuer, 'Valuation Rejected by MD/GM', notification_msg,
+                 notification_type='rejection', valuation=valuation)
+    notifier.add(valuation.field_officer, 'Valuation Rejected by MD/GM', notification_msg,
+                 notification_type='rejection', valuation=valuation)
+    notifier.dispatch()
 
     try:
         from system_logs.utils import log_action, get_client_ip
@@ -841,30 +948,144 @@ def md_gm_reject_valuation(request, pk):
 # Notification Views
 # ============================================================================
 
+@conditional_get
 class NotificationListView(generics.ListAPIView):
-    """List notifications for the current user"""
+    """
+    Notification history for the current user.
+
+    Supports ``?type=`` and ``?is_read=true|false`` filters and
+    ``?archived=true`` for notifications moved out by the retention job.
+    Pass ``cursor``/``page_size`` for keyset pages; without them the latest
+    50 are returned as a plain list, as before.
+    """
     permission_classes = [IsAuthenticated]
-    serializer_class = NotificationSerializer
+    pagination_class = KeysetPagination
+    LEGACY_LIMIT = 50
+
+    def get_version_signature(self):
+        return [
+            aggregate_version(Notification.objects.filter(user=self.request.user)),
+            aggregate_version(NotificationArchive.objects.filter(user=self.request.user), 'archived_at'),
+        ]
+
+    def is_archive(self):
+        return self.request.query_params.get('archived', '').lower() in ('1', 'true')
+
+    def get_serializer_class(self):
+        return NotificationArchiveSerializer if self.is_archive() else NotificationSerializer
 
     def get_queryset(self):
-        return Notification.objects.filter(user=self.request.user).order_by('-created_at')[:50]
+        model = NotificationArchive if self.is_archive() else Notification
+        queryset = model.objects.filter(user=self.request.user).order_by('-created_at')
+
+        notification_type = self.request.query_params.get('type')
+        if notification_type:
+            queryset = queryset.filter(notification_type=notification_type)
+        is_read = self.request.query_params.get('is_read', '').lower()
+        if is_read in ('true', '1'):
+            queryset = queryset.filter(is_read=True)
+        elif is_read in ('false', '0'):
+            queryset = queryset.filter(is_read=False)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        return Response(self.get_serializer(queryset[:self.LEGACY_LIMIT], many=True).data)
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def unread_notification_count(request):
     """Get count of unread notifications"""
-    count = Notification.objects.filter(user=request.user, is_read=False).count()
-    return Response({'count': count})
+    return Response({'count': NotificationCounter.unread_for(request.user.id)})
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def wait_for_notifications(request):
+    """
+    Long-poll for notification changes.
+
+    Returns as soon as the user has notifications with an id above ``after``
+    or their unread count differs from ``count``; otherwise holds the request
+    for up to ``timeout`` seconds (capped by NOTIFICATION_LONG_POLL_SECONDS)
+    and returns the unchanged state. Without ``after`` it returns the current
+    state immediately so the client can start waiting from it. When the
+    process has no free waiting slot the state is returned at once with a
+    non-zero ``retry_after`` (seconds) for the client to honour.
+    """
+    user = request.user
+    max_timeout = settings.NOTIFICATION_LONG_POLL_SECONDS
+    try:
+        timeout = min(max(float(request.query_params.get('timeout', max_timeout)), 0), max_timeout)
+    except ValueError:
+        timeout = max_timeout
+
+    after = request.query_params.get('after')
+    if after is None:
+        latest = Notification.objects.filter(user=user).order_by('-id').values_list('id', flat=True).first()
+        return Response({
+            'notifications': [],
+            'unread_count': NotificationCounter.unread_for(user.id),
+            'last_id': latest or 0,
+            'retry_after': 0,
+        })
+
+    try:
+        after = int(after)
+        known_count = int(request.query_params.get('count', -1))
+    except ValueError:
+        return Response({'error': 'after and count must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+
+    broker = get_broker()
+    waiting = broker.acquire_waiter()
+    if not waiting:
+        # Every waiting slot in this process is taken: answer with the
+        # current state and let the client come back later
+        timeout = 0
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            # Read the broker version before the database so a change landing
+            # in between still wakes the wait below
+            seen_version = broker.version(user.id)
+            new_notifications = list(
+                Notification.objects.filter(user=user, id__gt=after).order_by('-created_at')[:50]
+            )
+            unread_count = NotificationCounter.unread_for(user.id)
+            remaining = deadline - time.monotonic()
+            if new_notifications or unread_count != known_count or remaining <= 0:
+                break
+            if not connection.in_atomic_block:
+                # Don't hold a database connection while parked; the next
+                # query reconnects
+                connection.close()
+            broker.wait(user.id, seen_version, remaining)
+    finally:
+        if waiting:
+            broker.release_waiter()
+
+    return Response({
+        'notifications': NotificationSerializer(new_notifications, many=True).data,
+        'unread_count': unread_count,
+        'last_id': max([n.id for n in new_notifications], default=after),
+        'retry_after': 0 if waiting else settings.NOTIFICATION_LONG_POLL_RETRY_SECONDS,
+    })
 
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def mark_notification_read(request, pk):
     """Mark a single notification as read"""
-    notification = get_object_or_404(Notification, pk=pk, user=request.user)
-    notification.is_read = True
-    notification.save(update_fields=['is_read'])
+    get_object_or_404(Notification, pk=pk, user=request.user)
+    # Filtered update so concurrent clicks only decrement the counter once
+    marked = Notification.objects.filter(pk=pk, is_read=False).update(is_read=True, updated_at=timezone.now())
+    if marked:
+        NotificationCounter.adjust(request.user.id, -marked)
+        publish_notification_change(request.user.id)
     return Response({'status': 'ok'})
 
 
@@ -872,5 +1093,8 @@ def mark_notification_read(request, pk):
 @permission_classes([IsAuthenticated])
 def mark_all_notifications_read(request):
     """Mark all notifications as read for the current user"""
-    Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
+    marked = Notification.objects.filter(user=request.user, is_read=False).update(is_read=True, updated_at=timezone.now())
+    if marked:
+        NotificationCounter.adjust(request.user.id, -marked)
+        publish_notification_change(request.user.id)
     return Response({'status': 'ok'})